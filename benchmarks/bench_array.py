@@ -0,0 +1,55 @@
+""" Memory of `list` of enum values against `EnumArray`, and time of counting variants
+
+    python -m benchmarks.bench_array
+"""
+import collections
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from enumetyped import Enumetyped, Empty, Content, EnumArray
+
+COUNT = 1_000_000
+
+
+class Event(Enumetyped[Content]):
+    Start: type["Event[Empty]"]
+    Click: type["Event[int]"]
+    Key: type["Event[str]"]
+
+
+def source() -> list[Any]:
+    # Contents are shared, so only containers are measured
+    start, click, key = Event.Start(), Event.Click(1), Event.Key("a")
+    return [(start, click, key)[i % 3] for i in range(COUNT)]
+
+
+def measure(title: str, build: Callable[[list[Any]], Any]) -> Any:
+    values = source()
+    tracemalloc.start()
+    result = build(values)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{title:<40} {size / COUNT:8.1f} bytes per value")
+    return result
+
+
+def timed(title: str, func: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"{title:<40} {(time.perf_counter() - start) * 1e3:8.1f} ms")
+
+
+def main() -> None:
+    # Values are copied, as they would be when loaded from somewhere
+    values = measure("list", lambda v: [x.__class__(x.value) if x.value is not None else x for x in v])
+    array = measure("EnumArray", lambda v: EnumArray(Event, v))
+
+    timed("count variants, list", lambda: collections.Counter(v.__class__ for v in values))
+    timed("count variants, EnumArray", lambda: array.counts())
+    timed("filter variant, list", lambda: [v for v in values if isinstance(v, Event.Click)])
+    timed("filter variant, EnumArray", lambda: array.filter(Event.Click))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+""" Binary format of enum values against pydantic JSON: size of payload, dumping and loading
+
+    python -m benchmarks.bench_binary
+"""
+import io
+import timeit
+from typing import Any, Optional
+
+import pydantic
+
+from enumetyped import Content, Empty
+from enumetyped.pydantic import EnumetypedPydantic
+from enumetyped.pydantic.binary import binary_codec
+
+NUMBER = 20
+
+
+class Point(pydantic.BaseModel):
+    x: int
+    y: int
+
+
+class Event(EnumetypedPydantic[Content], variant="type", content="value"):
+    Ping: type["Event[Empty]"]
+    Click: type["Event[tuple[int, int]]"]
+    Text: type["Event[str]"]
+    Move: type["Event[Point]"]
+    Scores: type["Event[dict[str, float]]"]
+    Reply: type["Event[Optional[str]]"]
+    Batch: type["Event[list[Event[Any]]]"]
+
+
+def events(count: int) -> list[Event[Any]]:
+    base: list[Event[Any]] = [
+        Event.Ping(),
+        Event.Click((120, 45)),
+        Event.Text("hello, world"),
+        Event.Move(Point(x=3, y=-4)),
+        Event.Scores({"a": 0.5, "b": 1.25}),
+        Event.Reply(None),
+        Event.Batch([Event.Ping(), Event.Click((1, 2)), Event.Text("x")]),
+    ]
+    return [base[i % len(base)] for i in range(count)]
+
+
+def measure(name: str, fn: Any) -> None:
+    elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{name:<32} {elapsed * 1e3:8.2f} ms")
+
+
+def main() -> None:
+    values = events(10_000)
+    codec = binary_codec(Event)
+    adapter = pydantic.TypeAdapter(list[Event[Any]])
+
+    binary = [codec.dumps(value) for value in values]
+    text = [value.model_dump_json().encode() for value in values]
+    print(f"payload, binary                  {sum(map(len, binary)):8} bytes")
+    print(f"payload, model_dump_json         {sum(map(len, text)):8} bytes")
+
+    measure("dumps, binary", lambda: [codec.dumps(value) for value in values])
+    measure("dumps, model_dump_json", lambda: [value.model_dump_json() for value in values])
+    measure("loads, binary", lambda: [codec.loads(data) for data in binary])
+    measure("loads, model_validate_json", lambda: [Event.model_validate_json(data) for data in text])
+
+    stream = io.BytesIO()
+    codec.dump_all(values, stream)
+    array = adapter.dump_json(values)
+    measure("stream dump, binary", lambda: codec.dump_all(values, io.BytesIO()))
+    measure("array dump, adapter", lambda: adapter.dump_json(values))
+    measure("stream load, binary", lambda: list(codec.load_all(io.BytesIO(stream.getvalue()))))
+    measure("array load, adapter", lambda: adapter.validate_json(array))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+""" Creation time of enum classes with many variants, from source and from module
+generated by `python -m enumetyped.compile`
+
+    python -m benchmarks.bench_class_creation
+"""
+import gc
+import sys
+import time
+import types
+
+from enumetyped.compile import compile_source
+
+VARIANTS = 500
+REPEAT = 5
+
+CONTENTS = [
+    "int",
+    "str",
+    "Empty",
+    "list[int]",
+    "Optional[int]",
+    "Payload",
+    "{name}[Any]",
+]
+
+TEMPLATE = '''
+import dataclasses
+from typing import Any, Optional
+
+from enumetyped import Content, Empty, Enumetyped
+from enumetyped.pydantic import EnumetypedPydantic
+
+
+@dataclasses.dataclass
+class Payload:
+    a: int
+
+
+class {name}({base}[Content]{options}):
+{variants}
+'''
+
+
+def module_source(name: str, base: str, count: int, options: str = "") -> str:
+    variants = "\n".join(
+        f'    V{i}: type["{name}[{CONTENTS[i % len(CONTENTS)].format(name=name)}]"]'
+        for i in range(count)
+    )
+    return TEMPLATE.format(name=name, base=base, variants=variants, options=options)
+
+
+def execute(module_name: str, source: str) -> tuple[types.ModuleType, float]:
+    code = compile(source, module_name, "exec")
+
+    module = types.ModuleType(module_name)
+    sys.modules[module_name] = module
+
+    gc.collect()
+    start = time.perf_counter()
+    exec(code, module.__dict__)
+    elapsed = time.perf_counter() - start
+
+    del sys.modules[module_name]
+    return module, elapsed
+
+
+def create(base: str, count: int, index: int, options: str = "", precompiled: bool = False) -> float:
+    name = f"Enum{index}"
+    source = module_source(name, base, count, options)
+    module, elapsed = execute(f"bench_class_creation_{base}_{index}", source)
+    if precompiled:
+        _, elapsed = execute(f"bench_class_creation_{base}_{index}_compiled", compile_source(module, source))
+    return elapsed
+
+
+def main() -> None:
+    index = 0
+    for base in ("Enumetyped", "EnumetypedPydantic"):
+        for options in ("", ", lazy=True"):
+            for precompiled in (False, True):
+                for count in (10, 100, VARIANTS):
+                    results = []
+                    for _ in range(REPEAT):
+                        index += 1
+                        results.append(create(base, count, index, options, precompiled))
+
+                    title = f"{base}{options}{' precompiled' if precompiled else ''}"
+                    print(f"{title:<44} {count:>5} variants {min(results) * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
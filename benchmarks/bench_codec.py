@@ -0,0 +1,60 @@
+""" JSON of enum values: `enumetyped.codec` against adapter of pydantic enum with the same variants
+
+    python -m benchmarks.bench_codec
+"""
+import dataclasses
+import timeit
+from typing import Any, Optional
+
+from enumetyped import Content, Empty, Enumetyped
+from enumetyped.codec import json_codec
+from enumetyped.pydantic import EnumetypedPydantic
+
+NUMBER = 20_000
+
+
+@dataclasses.dataclass
+class Payload:
+    a: int
+    b: Optional[str] = None
+
+
+class Event(Enumetyped[Content]):
+    Ping: type["Event[Empty]"]
+    Click: type["Event[tuple[int, int]]"]
+    Text: type["Event[str]"]
+    Load: type["Event[Payload]"]
+    Batch: type["Event[list[Event[Any]]]"]
+
+
+class EventPydantic(EnumetypedPydantic[Content], variant="type", content="value"):
+    Ping: type["EventPydantic[Empty]"]
+    Click: type["EventPydantic[tuple[int, int]]"]
+    Text: type["EventPydantic[str]"]
+    Load: type["EventPydantic[Payload]"]
+    Batch: type["EventPydantic[list[EventPydantic[Any]]]"]
+
+
+def sample(E: Any) -> Any:
+    return E.Batch([E.Ping(), E.Click((1, 2)), E.Text("hello"), E.Load(Payload(1, "b"))])
+
+
+def measure(name: str, fn: Any) -> None:
+    elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{name:<28} {elapsed * 1e6:8.2f} µs")
+
+
+def main() -> None:
+    codec = json_codec(Event, variant="type", content="value")
+    value, pydantic_value = sample(Event), sample(EventPydantic)
+    data = codec.dumps(value)
+    assert data == pydantic_value.model_dump_json()
+
+    measure("dumps, codec", lambda: codec.dumps(value))
+    measure("dumps, pydantic", pydantic_value.model_dump_json)
+    measure("loads, codec", lambda: codec.loads(data))
+    measure("loads, pydantic", lambda: EventPydantic.model_validate_json(data))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+""" Columnar file of enum values against JSON lines: writing, counting by variant and random access
+
+    python -m benchmarks.bench_columnar
+"""
+import collections
+import os
+import tempfile
+import time
+from typing import Any, Callable
+
+from enumetyped import Content, Empty
+from enumetyped.pydantic import EnumetypedPydantic
+from enumetyped.pydantic.columnar import EnumFileReader, EnumFileWriter
+
+COUNT = 200_000
+
+
+class Event(EnumetypedPydantic[Content]):
+    Start: type["Event[Empty]"]
+    Click: type["Event[tuple[int, int]]"]
+    Keys: type["Event[list[str]]"]
+
+
+def timed(title: str, func: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = func()
+    print(f"{title:<40} {(time.perf_counter() - start) * 1e3:8.1f} ms")
+    return result
+
+
+def write_jsonl(path: str, values: list[Event[Any]]) -> None:
+    with open(path, "w") as file:
+        for value in values:
+            file.write(value.model_dump_json())
+            file.write("\n")
+
+
+def count_jsonl(path: str) -> Any:
+    with open(path) as file:
+        return collections.Counter(type(Event.model_validate_json(line)) for line in file)
+
+
+def read_jsonl_line(path: str, index: int) -> Event[Any]:
+    with open(path) as file:
+        for i, line in enumerate(file):
+            if i == index:
+                return Event.model_validate_json(line)
+    raise IndexError(index)
+
+
+def write_columnar(path: str, values: list[Event[Any]]) -> None:
+    with EnumFileWriter(path, Event) as writer:
+        writer.write_batch(values)
+
+
+def count_columnar(path: str) -> Any:
+    with EnumFileReader(path, Event) as reader:
+        return reader.counts()
+
+
+def read_columnar(path: str, index: int) -> Event[Any]:
+    with EnumFileReader(path, Event) as reader:
+        return reader[index]
+
+
+def main() -> None:
+    values = [(Event.Start(), Event.Click((i, i)), Event.Keys([str(i)]))[i % 3] for i in range(COUNT)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        jsonl, columnar = os.path.join(directory, "events.jsonl"), os.path.join(directory, "events.etc")
+
+        timed("write, JSON lines", lambda: write_jsonl(jsonl, values))
+        timed("write, columnar", lambda: write_columnar(columnar, values))
+        print(f"{'size, JSON lines':<40} {os.path.getsize(jsonl):8} bytes")
+        print(f"{'size, columnar':<40} {os.path.getsize(columnar):8} bytes")
+
+        assert timed("count by variant, JSON lines", lambda: count_jsonl(jsonl)) == \
+            timed("count by variant, columnar", lambda: count_columnar(columnar))
+
+        index = COUNT - 1
+        assert timed("read last value, JSON lines", lambda: read_jsonl_line(jsonl, index)) == \
+            timed("read last value, columnar", lambda: read_columnar(columnar, index))
+
+
+if __name__ == "__main__":
+    main()
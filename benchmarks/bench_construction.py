@@ -0,0 +1,91 @@
+""" Construction of variants: generic `__new__`/`__init__` against generated per-variant constructors
+
+    python -m benchmarks.bench_construction
+"""
+import timeit
+from typing import Any
+
+from enumetyped import Enumetyped, Empty, Content
+from enumetyped.core import _Enumetyped
+from enumetyped.pydantic import EnumetypedPydantic
+
+NUMBER = 1_000_000
+
+
+class Specialized(Enumetyped[Content]):
+    Empty: type["Specialized[Empty]"]
+    Int: type["Specialized[int]"]
+
+
+class Generic(Enumetyped[Content]):
+    Empty: type["Generic[Empty]"]
+    Int: type["Generic[int]"]
+
+
+class SpecializedPydantic(EnumetypedPydantic[Content]):
+    Empty: type["SpecializedPydantic[Empty]"]
+    Int: type["SpecializedPydantic[int]"]
+
+
+class GenericPydantic(EnumetypedPydantic[Content]):
+    Empty: type["GenericPydantic[Empty]"]
+    Int: type["GenericPydantic[int]"]
+
+
+def pydantic_generic_new(cls, *args, **kwargs):  # type: ignore
+    # `EnumetypedPydantic.__new__` before constructors were specialized
+    options = None
+    if args:
+        if not cls.__is_variant__:
+            options = args[0]
+    else:
+        options = kwargs
+
+    if options:
+        return cls.model_validate(options)
+    return _Enumetyped.__new__(cls, *args)  # type: ignore[no-untyped-call]
+
+
+def pydantic_generic_init(self, *args, **kwargs):  # type: ignore
+    # `EnumetypedPydantic.__init__` before constructors were specialized
+    if getattr(self, "_value", None) is not None:
+        return
+    _Enumetyped.__init__(self, *args)
+
+
+def restore_generic(kls: type[Any], new: Any, init: Any) -> None:
+    # Return variants to generic constructors
+    for variant in kls.__variants__:
+        variant.__new__ = new
+        variant.__init__ = init
+
+
+restore_generic(Generic, _Enumetyped.__dict__["__new__"], _Enumetyped.__init__)
+restore_generic(GenericPydantic, staticmethod(pydantic_generic_new), pydantic_generic_init)
+
+
+def bench(title: str, stmt: Any) -> float:
+    result = min(timeit.repeat(stmt, number=NUMBER, repeat=5))
+    print(f"{title:<40} {result / NUMBER * 1e9:8.1f} ns")
+    return result
+
+
+def main() -> None:
+    for name, generic, specialized in (
+            ("Enumetyped", Generic, Specialized),
+            ("EnumetypedPydantic", GenericPydantic, SpecializedPydantic),
+    ):
+        generic_int, specialized_int = generic.Int, specialized.Int
+        generic_empty, specialized_empty = generic.Empty, specialized.Empty
+
+        base = bench(f"{name}.Int(1) generic", lambda: generic_int(1))
+        fast = bench(f"{name}.Int(1) specialized", lambda: specialized_int(1))
+        print(f"{'speedup':<40} {base / fast:8.2f} x")
+
+        base = bench(f"{name}.Empty() generic", lambda: generic_empty())
+        fast = bench(f"{name}.Empty() specialized", lambda: specialized_empty())
+        print(f"{'speedup':<40} {base / fast:8.2f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+""" Chains of nested enum values: adapter against `enumetyped.pydantic.deep`
+
+    python -m benchmarks.bench_deep
+"""
+import timeit
+from typing import Any, Callable
+
+from enumetyped import Content
+from enumetyped.pydantic import EnumetypedPydantic
+from enumetyped.pydantic.deep import dump_json, validate_json
+
+DEPTHS = (10, 1_000, 100_000)
+
+
+class Chain(EnumetypedPydantic[Content]):
+    Leaf: type["Chain[int]"]
+    Wrap: type["Chain[Chain[Any]]"]
+
+
+def measure(name: str, fn: Callable[[], Any], depth: int) -> None:
+    number = max(1, 10_000 // depth)
+    try:
+        elapsed = min(timeit.repeat(fn, number=number, repeat=3)) / number
+    except Exception as e:
+        print(f"{name:<36} {type(e).__name__}")
+        return
+    print(f"{name:<36} {elapsed * 1000:10.3f} ms")
+
+
+def main() -> None:
+    for depth in DEPTHS:
+        value: Chain[Any] = Chain.Leaf(1)
+        for _ in range(depth):
+            value = Chain.Wrap(value)
+        data = dump_json(value)
+
+        measure(f"dump_json {depth}, adapter", value.model_dump_json, depth)
+        measure(f"dump_json {depth}, deep", lambda: dump_json(value), depth)
+        measure(f"validate_json {depth}, adapter", lambda: Chain.model_validate_json(data), depth)
+        measure(f"validate_json {depth}, deep", lambda: validate_json(Chain, data), depth)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+""" Dispatching on variant: `match` statement against `MyEnum.dispatcher(...)`
+
+    python -m benchmarks.bench_dispatch
+"""
+import sys
+import timeit
+import types
+from typing import Any
+
+NUMBER = 2_000
+REPEAT = 5
+
+TEMPLATE = '''
+from enumetyped import Content, Enumetyped
+
+
+class {name}(Enumetyped[Content]):
+{variants}
+
+
+def match(value):
+    match value:
+{cases}
+
+
+dispatch = {name}.dispatcher({{
+{handlers}
+}})
+'''
+
+
+def create(count: int) -> types.ModuleType:
+    name = f"Enum{count}"
+    source = TEMPLATE.format(
+        name=name,
+        variants="\n".join(f'    V{i}: type["{name}[int]"]' for i in range(count)),
+        cases="\n".join(f"        case {name}.V{i}(content):\n            return content + {i}" for i in range(count)),
+        handlers="\n".join(f"    {name}.V{i}: lambda v: v.value + {i}," for i in range(count)),
+    )
+
+    module_name = f"bench_dispatch_{count}"
+    module = types.ModuleType(module_name)
+    sys.modules[module_name] = module
+    exec(compile(source, module_name, "exec"), module.__dict__)
+    return module
+
+
+def bench(title: str, stmt: Any, calls: int) -> float:
+    result = min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT)) / NUMBER / calls
+    print(f"{title:<40} {result * 1e9:8.1f} ns")
+    return result
+
+
+def main() -> None:
+    for count in (5, 30, 100):
+        module = create(count)
+        enum_class = getattr(module, f"Enum{count}")
+        values = [variant(1) for variant in enum_class.__variants__]
+        match, dispatch = module.match, module.dispatch
+
+        assert [match(v) for v in values] == [dispatch(v) for v in values]
+
+        base = bench(f"match, {count} variants", lambda: [match(v) for v in values], len(values))
+        fast = bench(f"dispatcher, {count} variants", lambda: [dispatch(v) for v in values], len(values))
+        print(f"{'speedup':<40} {base / fast:8.2f} x")
+
+
+if __name__ == "__main__":
+    main()
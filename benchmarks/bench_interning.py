@@ -0,0 +1,67 @@
+""" Memory of validated repetitive trees: plain validation against interning by `enumetyped.intern.Interner`
+
+    python -m benchmarks.bench_interning
+"""
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from enumetyped import Content
+from enumetyped.intern import Interner
+from enumetyped.pydantic import EnumetypedPydantic
+
+ITEMS = 20_000
+
+
+class Expr(EnumetypedPydantic[Content], frozen=True):
+    Num: type["Expr[int]"]
+    Neg: type["Expr[Expr[Any]]"]
+    Add: type["Expr[tuple[Expr[Any], Expr[Any]]]"]
+    Sum: type["Expr[list[Expr[Any]]]"]
+
+
+def corpus() -> bytes:
+    # Few distinct subtrees, repeated many times
+    items = [
+        Expr.Add((Expr.Neg(Expr.Num(i % 10)), Expr.Neg(Expr.Num(1))))
+        for i in range(ITEMS)
+    ]
+    return Expr.Sum(items).model_dump_json().encode()
+
+
+def measure(name: str, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    # Memory is traced separately, tracing slows down allocations
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(f"{name:<24} {size / 2 ** 20:8.2f} MiB kept {peak / 2 ** 20:8.2f} MiB peak {elapsed * 1000:8.1f} ms")
+
+
+def main() -> None:
+    data = corpus()
+    Expr.model_validate_json(data)
+
+    def interned() -> Any:
+        # Interner is returned too, so its table is counted
+        with Interner() as interner:
+            return Expr.model_validate_json(data), interner
+
+    def post_pass() -> Any:
+        return Interner().intern(Expr.model_validate_json(data))
+
+    print(f"{ITEMS} repeated subtrees, {len(data) / 2 ** 10:.0f} KiB of JSON")
+    measure("validate", lambda: Expr.model_validate_json(data))
+    measure("validate, interning", interned)
+    measure("validate, then intern", post_pass)
+
+
+if __name__ == "__main__":
+    main()
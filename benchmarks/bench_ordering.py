@@ -0,0 +1,68 @@
+""" Equality of nested values: recursive `__eq__` against loop; sorting by key function against `ordered=True`
+
+    python -m benchmarks.bench_ordering
+"""
+import random
+import timeit
+from typing import Any
+
+from enumetyped import Enumetyped, Content
+
+NUMBER = 100
+DEPTH = 300  # recursive `__eq__` fails at about 450
+COUNT = 100_000
+
+
+class Tree(Enumetyped[Content], ordered=True):
+    Int: type["Tree[int]"]
+    Str: type["Tree[str]"]
+    Node: type["Tree[Tree[Any]]"]
+
+
+class Recursive(Enumetyped[Content]):
+    Int: type["Recursive[int]"]
+    Node: type["Recursive[Recursive[Any]]"]
+
+
+def recursive_eq(self: Any, other: object) -> bool:
+    # `_Enumetyped.__eq__` before comparison of nested values in loop
+    if self is other:
+        return True
+
+    if not isinstance(other, Enumetyped):
+        return False
+
+    return self.__class__ == other.__class__ and bool(self.value == other.value)
+
+
+for variant in Recursive.__variants__:
+    variant.__eq__ = recursive_eq  # type: ignore
+
+
+def bench(title: str, stmt: Any, number: int = NUMBER) -> float:
+    result = min(timeit.repeat(stmt, number=number, repeat=5))
+    print(f"{title:<40} {result / number * 1e6:8.1f} us")
+    return result
+
+
+def deep(value: Any, node: Any) -> Any:
+    for _ in range(DEPTH):
+        value = node(value)
+    return value
+
+
+def main() -> None:
+    a, b = deep(Recursive.Int(1), Recursive.Node), deep(Recursive.Int(1), Recursive.Node)
+    base = bench(f"== at depth {DEPTH}, recursive", lambda: a == b)
+    a, b = deep(Tree.Int(1), Tree.Node), deep(Tree.Int(1), Tree.Node)
+    fast = bench(f"== at depth {DEPTH}, loop", lambda: a == b)
+    print(f"{'speedup':<40} {base / fast:8.2f} x")
+
+    values = [Tree.Int(random.randrange(COUNT)) if i % 2 else Tree.Str(str(random.randrange(COUNT))) for i in range(COUNT)]
+    base = bench("sorted, key function", lambda: sorted(values, key=lambda v: (v.__ordinal__, v.value)), 1)
+    fast = bench("sorted, ordered=True", lambda: sorted(values), 1)
+    print(f"{'speedup':<40} {base / fast:8.2f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+""" Pickling and copying of variants: generic object reduction against `__reduce__`/`__deepcopy__` of enum
+
+    python -m benchmarks.bench_pickle
+"""
+import copy
+import pickle
+import timeit
+from typing import Any
+
+from enumetyped import Enumetyped, Empty, Content
+
+NUMBER = 100_000
+
+
+class Specialized(Enumetyped[Content]):
+    Empty: type["Specialized[Empty]"]
+    Int: type["Specialized[int]"]
+    List: type["Specialized[list[int]]"]
+
+
+class Generic(Enumetyped[Content]):
+    Empty: type["Generic[Empty]"]
+    Int: type["Generic[int]"]
+    List: type["Generic[list[int]]"]
+
+
+def restore_generic(kls: type[Any]) -> None:
+    # Return variants to generic reduction: class reference and `__dict__` state
+    for variant in kls.__variants__:
+        variant.__new__ = staticmethod(object.__new__)
+        variant.__reduce__ = object.__reduce__
+        variant.__copy__ = None
+        variant.__deepcopy__ = None
+
+
+# Instances are created before constructors are replaced
+VALUES = [
+    ("Empty()", Generic.Empty(), Specialized.Empty()),
+    ("Int(1)", Generic.Int(1), Specialized.Int(1)),
+    ("List([1, 2, 3])", Generic.List([1, 2, 3]), Specialized.List([1, 2, 3])),
+]
+
+restore_generic(Generic)
+
+
+def bench(title: str, stmt: Any) -> float:
+    result = min(timeit.repeat(stmt, number=NUMBER, repeat=5))
+    print(f"{title:<40} {result / NUMBER * 1e9:8.1f} ns")
+    return result
+
+
+def main() -> None:
+    for title, generic, specialized in VALUES:
+        generic_size = len(pickle.dumps(generic, pickle.HIGHEST_PROTOCOL))
+        specialized_size = len(pickle.dumps(specialized, pickle.HIGHEST_PROTOCOL))
+        print(f"{f'{title} pickle size':<40} {generic_size:5} -> {specialized_size:5} bytes")
+
+        for operation, func in (
+                ("dumps", lambda v: pickle.dumps(v, pickle.HIGHEST_PROTOCOL)),
+                ("loads", lambda v: pickle.loads(pickle.dumps(v, pickle.HIGHEST_PROTOCOL))),
+                ("copy", copy.copy),
+                ("deepcopy", copy.deepcopy),
+        ):
+            base = bench(f"{title} {operation} generic", lambda: func(generic))
+            fast = bench(f"{title} {operation} specialized", lambda: func(specialized))
+            print(f"{'speedup':<40} {base / fast:8.2f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+""" Sending batch of values to worker process: pickled list against `SharedEnumBatch`
+
+    python -m benchmarks.bench_shared_memory
+"""
+import multiprocessing
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+from enumetyped import Content, Empty
+from enumetyped.pydantic import EnumetypedPydantic
+from enumetyped.pydantic.shared_memory import SharedEnumBatch
+
+COUNT = 100_000
+
+
+class Item(EnumetypedPydantic[Content]):
+    Empty: type["Item[Empty]"]
+    Int: type["Item[int]"]
+    List: type["Item[list[str]]"]
+
+
+def first(values: Any) -> Any:
+    # Worker touches only one value
+    return values[0]
+
+
+def timed(title: str, func: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"{title:<40} {(time.perf_counter() - start) * 1e3:8.1f} ms")
+
+
+def main() -> None:
+    values = [(Item.Empty(), Item.Int(i), Item.List([str(i)]))[i % 3] for i in range(COUNT)]
+    print(f"{'pickled list size':<40} {len(pickle.dumps(values)):8} bytes")
+
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pool.submit(first, [Item.Empty()]).result()  # start worker
+
+        timed("pickled list", lambda: pool.submit(first, values).result())
+
+        with SharedEnumBatch.create(Item, values) as batch:
+            print(f"{'pickled batch size':<40} {len(pickle.dumps(batch)):8} bytes")
+            timed("shared memory batch", lambda: pool.submit(first, batch).result())
+
+        def pack_and_send() -> None:
+            with SharedEnumBatch.create(Item, values) as packed:
+                pool.submit(first, packed).result()
+
+        timed("shared memory batch, with packing", pack_and_send)
+
+
+if __name__ == "__main__":
+    main()
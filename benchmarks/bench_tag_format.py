@@ -0,0 +1,51 @@
+""" Variants tagged by names against variants tagged by ordinals: size of JSON, dumping and validation
+
+    python -m benchmarks.bench_tag_format
+"""
+import timeit
+from typing import Any
+
+import pydantic
+
+from enumetyped import Content, Empty
+from enumetyped.pydantic import EnumetypedPydantic
+
+NUMBER = 20
+
+
+class EventByName(EnumetypedPydantic[Content], variant="type", content="value"):
+    ConnectionOpened: type["EventByName[Empty]"]
+    MessageReceived: type["EventByName[str]"]
+    PositionChanged: type["EventByName[tuple[int, int]]"]
+    ConnectionClosed: type["EventByName[int]"]
+
+
+class EventByOrdinal(EnumetypedPydantic[Content], variant="type", content="value", tag_format="ordinal"):
+    ConnectionOpened: type["EventByOrdinal[Empty]"]
+    MessageReceived: type["EventByOrdinal[str]"]
+    PositionChanged: type["EventByOrdinal[tuple[int, int]]"]
+    ConnectionClosed: type["EventByOrdinal[int]"]
+
+
+def events(E: Any, count: int) -> list[Any]:
+    base = [E.ConnectionOpened(), E.MessageReceived("hi"), E.PositionChanged((1, 2)), E.ConnectionClosed(0)]
+    return [base[i % len(base)] for i in range(count)]
+
+
+def measure(name: str, fn: Any) -> None:
+    elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{name:<28} {elapsed * 1e3:8.2f} ms")
+
+
+def main() -> None:
+    for E in (EventByName, EventByOrdinal):
+        adapter = pydantic.TypeAdapter(list[E])  # type: ignore
+        values = events(E, 10_000)
+        data = adapter.dump_json(values)
+        print(f"{E.__name__}: {len(data)} bytes")
+        measure("dump", lambda: adapter.dump_json(values))
+        measure("validate", lambda: adapter.validate_json(data))
+
+
+if __name__ == "__main__":
+    main()
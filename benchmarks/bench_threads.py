@@ -0,0 +1,63 @@
+""" Validation and dumping by growing number of threads, and first use of fresh enum by all of them
+
+    python -m benchmarks.bench_threads
+"""
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from enumetyped import Empty
+from enumetyped.pydantic import create_enum
+
+THREADS = (1, 2, 4, 8, 16)
+CALLS = 20_000
+
+
+def fresh() -> Any:
+    return create_enum(
+        "Fresh",
+        {"Nil": Empty, "Int": int, "Items": "list[Fresh[Any]]", "Self": "Fresh"},
+        namespace={"Any": Any, "unique": object()},
+    )
+
+
+def run(threads: int, fn: Callable[[], Any], calls: int) -> float:
+    barrier = threading.Barrier(threads)
+
+    def work(_: int) -> None:
+        barrier.wait()
+        for _ in range(calls // threads):
+            fn()
+
+    with ThreadPoolExecutor(threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(work, range(threads)))
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+
+    Fresh = fresh()
+    value = Fresh.Items([Fresh.Int(1), Fresh.Self(Fresh.Nil()), Fresh.Items([])])
+    data = value.model_dump_json()
+
+    for threads in THREADS:
+        elapsed = run(threads, lambda: Fresh.model_validate_json(data), CALLS)
+        print(f"validate_json, {threads:>2} threads       {CALLS / elapsed:12,.0f} calls/s")
+    for threads in THREADS:
+        elapsed = run(threads, value.model_dump_json, CALLS)
+        print(f"model_dump_json, {threads:>2} threads     {CALLS / elapsed:12,.0f} calls/s")
+
+    # All threads use new enum at once, adapter is built by one of them
+    for threads in THREADS:
+        Cold = fresh()
+        elapsed = run(threads, lambda: Cold.model_validate_json(data), threads)
+        print(f"first use, {threads:>2} threads           {elapsed * 1000:12.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+""" Folding trees of enum values: recursive function against `enumetyped.traversal.fold`
+
+    python -m benchmarks.bench_traversal
+"""
+import sys
+import timeit
+from typing import Any
+
+from enumetyped import Enumetyped, Content
+from enumetyped.traversal import fold, transform
+
+NUMBER = 5
+WIDTH = 100_000
+DEPTH = 100_000
+
+
+class Expr(Enumetyped[Content]):
+    Num: type["Expr[int]"]
+    Neg: type["Expr[Expr[Any]]"]
+    Sum: type["Expr[list[Expr[Any]]]"]
+
+
+def recursive(node: Any) -> int:
+    if isinstance(node, Expr.Num):
+        return node.value  # type: ignore
+    if isinstance(node, Expr.Neg):
+        return -recursive(node.value)
+    return sum(recursive(child) for child in node.value)
+
+
+def evaluate(node: Any, results: list[int]) -> int:
+    if isinstance(node, Expr.Num):
+        return node.value  # type: ignore
+    if isinstance(node, Expr.Neg):
+        return -results[0]
+    return sum(results)
+
+
+def bench(title: str, stmt: Any) -> float:
+    result = min(timeit.repeat(stmt, number=NUMBER, repeat=3))
+    print(f"{title:<40} {result / NUMBER * 1e3:8.1f} ms")
+    return result
+
+
+def main() -> None:
+    # Wide tree: sums of 10 negated numbers
+    wide = Expr.Sum([Expr.Sum([Expr.Neg(Expr.Num(i)) for i in range(10)]) for _ in range(WIDTH // 20)])
+    base = bench(f"fold {WIDTH} nodes, recursive", lambda: recursive(wide))
+    fast = bench(f"fold {WIDTH} nodes, traversal", lambda: fold(wide, evaluate))
+    print(f"{'slowdown':<40} {fast / base:8.2f} x")
+    bench(f"transform {WIDTH} nodes, unchanged", lambda: transform(wide, lambda node: node))
+
+    deep: Expr[Any] = Expr.Num(1)
+    for _ in range(DEPTH):
+        deep = Expr.Neg(deep)
+
+    try:
+        recursive(deep)
+    except RecursionError:
+        print(f"{f'fold depth {DEPTH}, recursive':<40} RecursionError (limit {sys.getrecursionlimit()})")
+    bench(f"fold depth {DEPTH}, traversal", lambda: fold(deep, evaluate))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,11 @@
-from enumetyped.core import Enumetyped, Content, Empty
+import importlib
+import typing
+
+from enumetyped.core import Enumetyped, Content, Empty, Ordinal
+
+if typing.TYPE_CHECKING:
+    from enumetyped.array import EnumArray
+    from enumetyped.enumset import EnumSet
 
 __all__ = [
     "Empty",
@@ -6,6 +13,9 @@ __all__ = [
     "TypEnum",  # deprecated
     "TypEnumContent",  # deprecated
     "Content",
+    "Ordinal",
+    "EnumArray",
+    "EnumSet",
 ]
 
 __package_name__ = "enumetyped"
@@ -16,3 +26,15 @@ __description__ = "Type-containing enumeration"
 TypEnum = Enumetyped
 TypEnumContent = Content  # type: ignore
 NoValue = Empty
+
+# Containers are imported on first access
+_MODULES = {
+    "EnumArray": "enumetyped.array",
+    "EnumSet": "enumetyped.enumset",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_MODULES[name]), name)
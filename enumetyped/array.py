@@ -0,0 +1,144 @@
+import array
+import collections
+import itertools
+import typing
+
+from enumetyped.core import Empty, _Enumetyped
+
+__all__ = [
+    "EnumArray",
+]
+
+Enum = typing.TypeVar("Enum", bound=_Enumetyped[typing.Any])
+
+_TAG_FORMATS: dict[int, str] = {1: "B", 2: "H", 4: "I"}
+
+
+class EnumArray(typing.Generic[Enum]):
+    """ Columnar container of enum values
+
+    Ordinals of variants are stored in compact `array` of tags, contents in column of its variant
+    and position in column in array of offsets. Instances are created only when items are accessed.
+    Columns are append-only, so slices share them with original array.
+    """
+    __slots__ = ("_enum", "_tags", "_offsets", "_columns")
+
+    def __init__(self, enum_class: type[Enum], values: typing.Iterable[Enum] = ()) -> None:
+        enum = enum_class.__enum__
+        by_ordinal = enum.__variants_by_ordinal__
+
+        self._enum = enum
+        self._tags = array.array(_TAG_FORMATS[enum.__tag_size__()])
+        self._offsets = array.array("I")
+        # Empty variants have no content, so they have no column
+        self._columns: tuple[typing.Optional[list[typing.Any]], ...] = tuple(
+            [] if variant is not None and variant.__content_type__ is not Empty else None
+            for variant in by_ordinal
+        )
+        self.extend(values)
+
+    def _copy(self, tags: 'array.array[int]', offsets: 'array.array[int]') -> 'EnumArray[Enum]':
+        result: EnumArray[Enum] = object.__new__(EnumArray)
+        result._enum = self._enum
+        result._tags = tags
+        result._offsets = offsets
+        result._columns = self._columns
+        return result
+
+    def _variant(self, variant: type[Enum]) -> int:
+        if variant not in self._enum.__variants__:
+            raise ValueError(f"{self._enum.__name__}: `{variant!r}` is not a variant")
+        return variant.__ordinal__
+
+    def append(self, value: Enum) -> None:
+        if not isinstance(value, self._enum):
+            raise TypeError(f"Expected instance of {self._enum.__name__}, got {type(value).__name__}")
+
+        tag = value.__ordinal__
+        column = self._columns[tag]
+        if column is None:
+            self._offsets.append(0)
+        else:
+            self._offsets.append(len(column))
+            column.append(value._value)
+        self._tags.append(tag)
+
+    def extend(self, values: typing.Iterable[Enum]) -> None:
+        append = self.append
+        for value in values:
+            append(value)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> Enum:
+        pass
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> 'EnumArray[Enum]':
+        pass
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[Enum, 'EnumArray[Enum]']:
+        if isinstance(index, slice):
+            return self._copy(self._tags[index], self._offsets[index])
+
+        tag = self._tags[index]
+        variant = self._enum.__variants_by_ordinal__[tag]
+        column = self._columns[tag]
+        if column is None:
+            return variant()  # type: ignore
+        return variant(column[self._offsets[index]])  # type: ignore
+
+    def __iter__(self) -> typing.Iterator[Enum]:
+        by_ordinal = self._enum.__variants_by_ordinal__
+        columns = self._columns
+        for tag, offset in zip(self._tags, self._offsets):
+            column = columns[tag]
+            if column is None:
+                yield by_ordinal[tag]()  # type: ignore
+            else:
+                yield by_ordinal[tag](column[offset])  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"EnumArray({self._enum.__name__}, {list(self)!r})"
+
+    def _count(self) -> typing.Callable[[int], int]:
+        # Searching byte in bytes is much faster than comparing items of array
+        if self._tags.typecode == "B":
+            return self._tags.tobytes().count
+        return self._tags.count
+
+    def counts(self) -> dict[type[Enum], int]:
+        """ Count of values per variant, variants without values are skipped """
+        by_ordinal = self._enum.__variants_by_ordinal__
+        if self._tags.typecode == "B":
+            count = self._count()
+            counts = [(tag, count(tag)) for tag, variant in enumerate(by_ordinal) if variant is not None]
+        else:
+            counts = sorted(collections.Counter(self._tags).items())
+        return {by_ordinal[tag]: n for tag, n in counts if n}  # type: ignore
+
+    def count(self, variant: type[Enum]) -> int:
+        return self._count()(self._variant(variant))
+
+    def _selector(self, tag: int) -> typing.Iterator[bool]:
+        return map(tag.__eq__, self._tags)
+
+    def filter(self, variant: type[Enum]) -> 'EnumArray[Enum]':
+        """ Values of one variant, in original order """
+        tag = self._variant(variant)
+        offsets = array.array("I", itertools.compress(self._offsets, self._selector(tag)))
+        return self._copy(array.array(self._tags.typecode, [tag]) * len(offsets), offsets)
+
+    def contents(self, variant: type[Enum]) -> list[typing.Any]:
+        """ Contents of values of one variant, in original order, without creating instances """
+        tag = self._variant(variant)
+        column = self._columns[tag]
+        if column is None:
+            return [None] * self._count()(tag)
+        return [column[offset] for offset in itertools.compress(self._offsets, self._selector(tag))]
+
+    def group(self) -> dict[type[Enum], 'EnumArray[Enum]']:
+        """ Values split by variant, variants without values are skipped """
+        return {variant: self.filter(variant) for variant in self.counts()}
@@ -0,0 +1,445 @@
+import dataclasses
+import json
+import math
+import types
+import typing
+from abc import ABC, abstractmethod
+from json.encoder import encode_basestring
+
+from enumetyped.core import Empty, EnumetypedMeta, _Enumetyped, _enum_cached
+from enumetyped.resolver import resolve
+
+__all__ = [
+    "JsonCodec",
+    "json_codec",
+]
+
+Enum = typing.TypeVar("Enum", bound=_Enumetyped[typing.Any])
+
+# JSON of value and pairs of JSON keys and values for contents, which are merged by internal tagging
+Encode = typing.Callable[[typing.Any], str]
+Decode = typing.Callable[[typing.Any], typing.Any]
+Fields = typing.Callable[[typing.Any], list[tuple[str, str]]]
+
+
+class _Type(typing.NamedTuple):
+    encode: Encode
+    decode: Decode
+    fields: typing.Optional[Fields] = None
+
+
+def _encode_float(value: float) -> str:
+    # Like pydantic: `null` for inf and nan, exponent without leading zeros,
+    # positional notation down to 1e-5 (Python switches to exponent after 1e-4)
+    if not math.isfinite(value):
+        return "null"
+
+    text = float.__repr__(value)
+    if "e" not in text:
+        return text
+
+    mantissa, exponent = text.split("e")
+    power = int(exponent)
+    if power == -5:
+        sign = "-" if mantissa.startswith("-") else ""
+        return f"{sign}0.0000{mantissa.lstrip('-').replace('.', '')}"
+    return f"{mantissa}e{'+' if power >= 0 else '-'}{abs(power)}"
+
+
+def _encode_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _encode_none(value: None) -> str:
+    return "null"
+
+
+def _decoder(kind: typing.Union[type, tuple[type, ...]], name: str) -> Decode:
+    def decode(value: typing.Any) -> typing.Any:
+        # `bool` is subclass of `int`, but not a number in JSON
+        if isinstance(value, kind) and (value.__class__ is not bool or name == "bool"):
+            return value
+        raise ValueError(f"Expected {name}, got {value!r}")
+
+    return decode
+
+
+def _decode_float(value: typing.Any) -> float:
+    if isinstance(value, (int, float)) and value.__class__ is not bool:
+        return float(value)
+    raise ValueError(f"Expected float, got {value!r}")
+
+
+_SCALARS: dict[typing.Any, _Type] = {
+    bool: _Type(_encode_bool, _decoder(bool, "bool")),
+    int: _Type(int.__repr__, _decoder(int, "int")),
+    float: _Type(_encode_float, _decode_float),
+    str: _Type(encode_basestring, _decoder(str, "str")),
+    type(None): _Type(_encode_none, _decoder(type(None), "null")),
+    None: _Type(_encode_none, _decoder(type(None), "null")),
+}
+
+
+class _EnumCodec:
+    # Functions of one enum by ordinals of variants, filled after codec is registered,
+    # so contents refer to codecs of enums, which are compiled yet
+    __slots__ = ("enum", "variant", "content", "encoders", "fields_of", "decoders")
+
+    def __init__(self, enum: EnumetypedMeta, variant: typing.Optional[str], content: typing.Optional[str]) -> None:
+        self.enum = enum
+        self.variant = variant
+        self.content = content
+        self.encoders: list[typing.Optional[Encode]] = [None] * len(enum.__variants_by_ordinal__)
+        self.fields_of: list[typing.Optional[Fields]] = [None] * len(enum.__variants_by_ordinal__)
+        self.decoders: dict[str, tuple[typing.Any, typing.Optional[Decode]]] = {}
+
+    def encode(self, value: typing.Any) -> str:
+        return self.encoders[value.__ordinal__](value)  # type: ignore
+
+    def fields(self, value: typing.Any) -> list[tuple[str, str]]:
+        return self.fields_of[value.__ordinal__](value)  # type: ignore
+
+    def decode(self, obj: typing.Any) -> typing.Any:
+        if self.variant is None:
+            if isinstance(obj, str):
+                name, content = obj, None
+            elif isinstance(obj, dict) and len(obj) == 1:
+                (name, content), = obj.items()
+            else:
+                raise ValueError(f"{self.enum.__name__}: Expected name of variant or object with one key, got {obj!r}")
+        elif isinstance(obj, dict) and isinstance(obj.get(self.variant), str):
+            name = obj[self.variant]
+            if self.content is not None:
+                content = obj.get(self.content)
+            else:
+                content = {key: value for key, value in obj.items() if key != self.variant}
+        else:
+            raise ValueError(f"{self.enum.__name__}: Expected object with `{self.variant}` key, got {obj!r}")
+
+        try:
+            variant, decode = self.decoders[name]
+        except KeyError:
+            raise ValueError(f"{self.enum.__name__}: Unknown variant `{name}`") from None
+
+        if decode is None:
+            return variant()
+        return variant(decode(content))
+
+
+Compiled = typing.TypeVar("Compiled")
+Codec = typing.TypeVar("Codec")
+
+
+class _ContentCompiler(ABC, typing.Generic[Compiled, Codec]):
+    """ Walk of content types, shared by formats, which emit functions for each kind of type
+
+    Codec of enum is registered before its variants are compiled, so recursive contents refer to it.
+    """
+
+    def __init__(self, scalars: dict[typing.Any, Compiled]) -> None:
+        self.scalars = scalars
+        self.enums: dict[EnumetypedMeta, Codec] = {}
+
+    def compile(self, tp: typing.Any) -> Compiled:
+        if tp in self.scalars:
+            return self.scalars[tp]
+        if tp is typing.Any or tp is object:
+            return self._any()
+
+        origin, args = typing.get_origin(tp), typing.get_args(tp)
+        if isinstance(tp, EnumetypedMeta) or isinstance(origin, EnumetypedMeta):
+            return self._enum_content(self.enum(origin or tp))
+
+        if origin is list or tp is list:
+            return self._sequence(self.compile(args[0] if args else typing.Any), list)
+        if origin in (set, frozenset) or tp in (set, frozenset):
+            return self._sequence(self.compile(args[0] if args else typing.Any), origin or tp)
+        if origin is tuple or tp is tuple:
+            if not args or (len(args) == 2 and args[1] is Ellipsis):
+                return self._sequence(self.compile(args[0] if args else typing.Any), tuple)
+            return self._tuple([self.compile(item_type) for item_type in args])
+        if origin is dict or tp is dict:
+            key_type, value_type = args or (typing.Any, typing.Any)
+            return self._dict(key_type, self.compile(value_type))
+        if origin in (typing.Union, types.UnionType):
+            return self._union(args, [self.compile(member_type) for member_type in args])
+
+        return self._other(tp)
+
+    def enum(self, enum: EnumetypedMeta) -> Codec:
+        codec = self.enums.get(enum)
+        if codec is not None:
+            return codec
+
+        codec = self.enums[enum] = self._enum_codec(enum)
+        for variant, attr in enum.__variants__.items():
+            self._variant(codec, variant, attr)
+        return codec
+
+    @abstractmethod
+    def _enum_codec(self, enum: EnumetypedMeta) -> Codec:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _variant(self, codec: Codec, variant: typing.Any, attr: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _enum_content(self, codec: Codec) -> Compiled:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _any(self) -> Compiled:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _sequence(self, item: Compiled, kind: type) -> Compiled:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _tuple(self, items: list[Compiled]) -> Compiled:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _dict(self, key_type: typing.Any, item: Compiled) -> Compiled:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _union(self, member_types: tuple[typing.Any, ...], members: list[Compiled]) -> Compiled:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _other(self, tp: typing.Any) -> Compiled:
+        raise NotImplementedError
+
+
+class _Compiler(_ContentCompiler[_Type, _EnumCodec]):
+    def __init__(self, variant: typing.Optional[str], content: typing.Optional[str]) -> None:
+        super().__init__(_SCALARS)
+        self.variant = variant
+        self.content = content
+        self.runtime: dict[typing.Any, _Type] = {}
+
+    def _enum_codec(self, enum: EnumetypedMeta) -> _EnumCodec:
+        return _EnumCodec(enum, self.variant, self.content)
+
+    def _variant(self, codec: _EnumCodec, variant: typing.Any, attr: str) -> None:
+        enum = codec.enum
+        content_type = variant.__content_type__
+        if isinstance(content_type, str):
+            # Declared below enum
+            content_type = resolve(variant.__variant_annotation__, enum.__module__)
+
+        content = None if content_type is Empty else self.compile(content_type)
+        if self.variant is not None and self.content is None and content is not None and content.fields is None:
+            raise TypeError(
+                f"{enum.__name__}: Content of `{attr}` must be dataclass, dict or enum to be tagged internally"
+            )
+
+        encode, fields = self._tagged(encode_basestring(attr), content)
+        codec.encoders[variant.__ordinal__] = encode
+        codec.fields_of[variant.__ordinal__] = fields
+        codec.decoders[attr] = (variant, None if content is None else content.decode)
+
+    def _enum_content(self, codec: _EnumCodec) -> _Type:
+        fields = codec.fields if self.variant is not None and self.content is None else None
+        return _Type(codec.encode, codec.decode, fields)
+
+    def _any(self) -> _Type:
+        return _Type(self._encode_any, lambda value: value)
+
+    def _other(self, tp: typing.Any) -> _Type:
+        if dataclasses.is_dataclass(tp) and isinstance(tp, type):
+            return self._dataclass(tp)
+        raise TypeError(f"Content type `{typing._type_repr(tp)}` is not supported")  # noqa
+
+    def _tagged(self, name: str, content: typing.Optional[_Type]) -> tuple[Encode, typing.Optional[Fields]]:
+        # Layouts of `ExternalTagging`, `AdjacentTagging` and `InternalTagging`
+        if self.variant is None:
+            if content is None:
+                return lambda value: name, None
+            prefix, encode_content = f"{{{name}:", content.encode
+            return lambda value: f"{prefix}{encode_content(value._value)}}}", None
+
+        variant_tag = encode_basestring(self.variant)
+        if self.content is not None:
+            if content is None:
+                result = f"{{{variant_tag}:{name}}}"
+                return lambda value: result, None
+            prefix, encode_content = f"{{{variant_tag}:{name},{encode_basestring(self.content)}:", content.encode
+            return lambda value: f"{prefix}{encode_content(value._value)}}}", None
+
+        content_fields = content.fields if content is not None else None
+
+        def fields(value: typing.Any) -> list[tuple[str, str]]:
+            if content_fields is None:
+                return [(variant_tag, name)]
+
+            # Like `{variant: name}.update(content)`: key of variant stays first
+            tag, pairs = name, []
+            for key, item in content_fields(value._value):
+                if key == variant_tag:
+                    tag = item
+                else:
+                    pairs.append((key, item))
+            return [(variant_tag, tag), *pairs]
+
+        return lambda value: _object(fields(value)), fields
+
+    def _encode_any(self, value: typing.Any) -> str:
+        # Content type is known only from value
+        tp = _runtime_type(value)
+        compiled = self.runtime.get(tp)
+        if compiled is None:
+            compiled = self.runtime[tp] = self.compile(tp)
+        return compiled.encode(value)
+
+    def _sequence(self, item: _Type, kind: type) -> _Type:
+        encode_item, decode_item = item.encode, item.decode
+
+        def encode(value: typing.Any) -> str:
+            return f"[{','.join([encode_item(v) for v in value])}]"
+
+        def decode(value: typing.Any) -> typing.Any:
+            if not isinstance(value, list):
+                raise ValueError(f"Expected array, got {value!r}")
+            return kind(decode_item(v) for v in value) if kind is not list else [decode_item(v) for v in value]
+
+        return _Type(encode, decode)
+
+    def _tuple(self, items: list[_Type]) -> _Type:
+        def encode(value: typing.Any) -> str:
+            return f"[{','.join([item.encode(v) for item, v in zip(items, value)])}]"
+
+        def decode(value: typing.Any) -> typing.Any:
+            if not isinstance(value, list) or len(value) != len(items):
+                raise ValueError(f"Expected array of {len(items)} items, got {value!r}")
+            return tuple(item.decode(v) for item, v in zip(items, value))
+
+        return _Type(encode, decode)
+
+    def _dict(self, key_type: typing.Any, item: _Type) -> _Type:
+        # Like pydantic, keys of bare `dict` are strings in JSON
+        if key_type not in (str, int, typing.Any):
+            raise TypeError(f"Keys of type `{typing._type_repr(key_type)}` are not supported")  # noqa
+
+        encode_item, decode_item = item.encode, item.decode
+        decode_key = int if key_type is int else str
+
+        def fields(value: typing.Any) -> list[tuple[str, str]]:
+            return [(encode_basestring(str(k)), encode_item(v)) for k, v in value.items()]
+
+        def decode(value: typing.Any) -> typing.Any:
+            if not isinstance(value, dict):
+                raise ValueError(f"Expected object, got {value!r}")
+            return {decode_key(k): decode_item(v) for k, v in value.items()}
+
+        return _Type(lambda value: _object(fields(value)), decode, fields)
+
+    def _union(self, member_types: tuple[typing.Any, ...], members: list[_Type]) -> _Type:
+        # Members are tried in declared order
+        kinds = [(typing.get_origin(tp) or tp, member) for tp, member in zip(member_types, members)]
+
+        def encode(value: typing.Any) -> str:
+            for kind, member in kinds:
+                if kind is typing.Any or isinstance(kind, type) and type(value) is kind:
+                    return member.encode(value)
+            for kind, member in kinds:
+                if isinstance(kind, type) and isinstance(value, kind):
+                    return member.encode(value)
+            return self._encode_any(value)
+
+        def decode(value: typing.Any) -> typing.Any:
+            for member in members:
+                try:
+                    return member.decode(value)
+                except (ValueError, TypeError):
+                    pass
+            raise ValueError(f"Value {value!r} matches no member of union")
+
+        return _Type(encode, decode)
+
+    def _dataclass(self, cls: type) -> _Type:
+        hints = typing.get_type_hints(cls)
+        fields = [
+            (field.name, encode_basestring(field.name), self.compile(hints[field.name]))
+            for field in dataclasses.fields(cls)
+        ]
+
+        def pairs(value: typing.Any) -> list[tuple[str, str]]:
+            return [(key, item.encode(getattr(value, name))) for name, key, item in fields]
+
+        def decode(value: typing.Any) -> typing.Any:
+            if not isinstance(value, dict):
+                raise ValueError(f"Expected object for {cls.__name__}, got {value!r}")
+            return cls(**{name: item.decode(value[name]) for name, _, item in fields if name in value})
+
+        return _Type(lambda value: _object(pairs(value)), decode, pairs)
+
+
+def _object(pairs: list[tuple[str, str]]) -> str:
+    return f"{{{','.join([f'{key}:{value}' for key, value in pairs])}}}"
+
+
+def _runtime_type(value: typing.Any) -> typing.Any:
+    kind = type(value)
+    if kind in _SCALARS or dataclasses.is_dataclass(kind):
+        return kind
+    if isinstance(value, _Enumetyped):
+        return kind.__enum__
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return list
+    if isinstance(value, dict):
+        return dict
+    raise TypeError(f"Value of type `{kind.__name__}` is not supported")
+
+
+class JsonCodec(typing.Generic[Enum]):
+    """ JSON of enum values without pydantic, in layouts of `EnumetypedPydantic` taggings
+
+        codec = json_codec(Shape, variant="type", content="value")
+        data = codec.dumps(Shape.Circle(1.0))  # '{"type":"Circle","value":1.0}'
+        assert codec.loads(data) == Shape.Circle(1.0)
+
+    Contents may be `bool`, `int`, `float`, `str`, `None`, lists, tuples, sets, dicts with `str` or
+    `int` keys, unions, dataclasses and other enums. Output is the same as of pydantic enum
+    with the same variants and options.
+    """
+
+    __slots__ = ("enum", "_codec")
+
+    def __init__(
+            self,
+            enum: type[Enum],
+            *,
+            variant: typing.Optional[str] = None,
+            content: typing.Optional[str] = None,
+    ) -> None:
+        if content is not None and variant is None:
+            raise ValueError("`content` is set without `variant`")
+
+        self.enum = enum.__enum__
+        self._codec = _Compiler(variant, content).enum(self.enum)
+
+    def dumps(self, value: Enum) -> str:
+        if not isinstance(value, self.enum):
+            raise TypeError(f"Expected instance of {self.enum.__name__}, got {type(value).__name__}")
+        return self._codec.encode(value)
+
+    def loads(self, data: typing.Union[str, bytes, bytearray]) -> Enum:
+        result: Enum = self._codec.decode(json.loads(data))
+        return result
+
+
+def json_codec(
+        enum: type[Enum],
+        *,
+        variant: typing.Optional[str] = None,
+        content: typing.Optional[str] = None,
+) -> JsonCodec[Enum]:
+    """ Codec of enum, cached in enum like `EnumetypedPydantic.adapter()` """
+    return _enum_cached(
+        enum.__enum__,
+        ("json_codec", variant, content),
+        lambda: JsonCodec(enum, variant=variant, content=content),
+    )
@@ -0,0 +1,164 @@
+import argparse
+import ast
+import hashlib
+import importlib
+import importlib.util
+import os
+import re
+import sys
+import types
+import typing
+
+from enumetyped.core import EnumetypedMeta
+
+__all__ = [
+    "compile_source",
+    "compile_module",
+    "default_output",
+    "is_stale",
+    "main",
+]
+
+# Changes, when generated code changes, so modules generated by older versions are stale
+_VERSION = 1
+
+_SOURCE_HEADER = re.compile(r"^# Source: (?P<module>\S+) sha256:(?P<hash>[0-9a-f]{64})$", re.MULTILINE)
+
+
+def _source_hash(source: str) -> str:
+    return hashlib.sha256(f"{_VERSION}\n{source}".encode()).hexdigest()
+
+
+def _source_path(module_name: str) -> str:
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or spec.origin is None or not spec.origin.endswith(".py"):
+        raise ValueError(f"{module_name}: Source of module is not found")
+    return spec.origin
+
+
+def _read(path: str) -> str:
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+
+def _enum_lines(enum: EnumetypedMeta, indent: str) -> list[str]:
+    lines = [f"{indent}# Generated by enumetyped.compile\n", f"{indent}__precompiled__ = {{\n"]
+    for attr, annotation in enum.__declared_variants__.items():
+        names = ", ".join(repr(name) for name in sorted(annotation.names))
+        resolver = None
+        if annotation.content is not None and not annotation.is_self:
+            # Enum is passed as argument, like it's passed to `resolve` while enum is created
+            resolver = f"lambda {enum.__name__}: ({annotation.content})"
+
+        lines.append(
+            f"{indent}    {attr!r}: ({enum.__declared_ordinals__[attr]}, {annotation.content!r}, "
+            f"{annotation.is_self}, frozenset({{{names}}}), {resolver}),\n"
+        )
+    lines.append(f"{indent}}}\n")
+
+    renames: typing.Optional[dict[str, str]] = enum.__dict__.get("__names_serialization__")
+    if renames is not None:
+        lines.append(f"{indent}__precompiled_renames__ = {renames!r}\n")
+
+    return lines
+
+
+def compile_source(module: types.ModuleType, source: str) -> str:
+    """ Source of module with tables of variants of enums, declared at top level of module
+
+    `module` is the module, executed from `source`. Generated module executes the same code,
+    but enums are created from tables instead of parsing annotations of variants.
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+
+    insertions: list[tuple[int, list[str]]] = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        enum = module.__dict__.get(node.name)
+        if (
+                not isinstance(enum, EnumetypedMeta) or
+                enum.__is_variant__ or
+                enum.__module__ != module.__name__ or
+                enum.__qualname__ != node.name or
+                "__declared_variants__" not in enum.__dict__
+        ):
+            continue
+
+        if node.body[0].lineno == node.lineno:
+            raise ValueError(f"{module.__name__}: Body of `{node.name}` must start on new line")
+
+        assert node.end_lineno is not None
+        indent = lines[node.body[0].lineno - 1][:node.body[0].col_offset]
+        insertions.append((node.end_lineno, _enum_lines(enum, indent)))
+
+    for lineno, enum_lines in reversed(insertions):
+        lines[lineno:lineno] = enum_lines
+
+    header = [
+        f"# Generated by `python -m enumetyped.compile {module.__name__}`, do not edit.\n",
+        f"# Source: {module.__name__} sha256:{_source_hash(source)}\n",
+    ]
+    return "".join(header + lines)
+
+
+def compile_module(module_name: str) -> str:
+    """ Import module and compile its source """
+    source = _read(_source_path(module_name))
+    return compile_source(importlib.import_module(module_name), source)
+
+
+def default_output(module_name: str) -> str:
+    """ Path of generated module, `models_compiled.py` next to `models.py` """
+    path = _source_path(module_name)
+    return f"{os.path.splitext(path)[0]}_compiled.py"
+
+
+def is_stale(module_name: str, output: typing.Union[str, os.PathLike[str], None] = None) -> bool:
+    """ Whether generated module is missing or was generated from other source of module
+
+    Source module is not imported.
+    """
+    output = output if output is not None else default_output(module_name)
+    try:
+        generated = _read(os.fspath(output))
+    except FileNotFoundError:
+        return True
+
+    match = _SOURCE_HEADER.search(generated, 0, 4096)
+    return (
+            match is None or
+            match["module"] != module_name or
+            match["hash"] != _source_hash(_read(_source_path(module_name)))
+    )
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m enumetyped.compile",
+        description="Generate module with precomputed variants of enums, which is imported instead of source module",
+    )
+    parser.add_argument("module", help="Module with enums, e.g. `myapp.models`")
+    parser.add_argument("-o", "--output", help="Path of generated module, `<module>_compiled.py` by default")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1, when generated module is stale")
+    args = parser.parse_args(argv)
+
+    output = args.output if args.output is not None else default_output(args.module)
+    if args.check:
+        if is_stale(args.module, output):
+            print(f"{output}: Stale, run `python -m enumetyped.compile {args.module}`", file=sys.stderr)
+            return 1
+        return 0
+
+    generated = compile_module(args.module)
+    with open(output, "w", encoding="utf-8") as file:
+        file.write(generated)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
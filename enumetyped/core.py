@@ -1,3 +1,6 @@
+import copy
+import functools
+import threading
 import types
 import typing
 
@@ -6,47 +9,261 @@ __all__ = [
     "Enumetyped",
     "Content",
     "EnumetypedMeta",
+    "Ordinal",
 ]
 
 import typing_extensions
 
-from annotated_types import BaseMetadata
+from annotated_types import BaseMetadata, GroupedMetadata
+from dataclasses import FrozenInstanceError, dataclass
 from typing_extensions import Annotated
 
+from enumetyped.resolver import VariantAnnotation, parse_variant_annotation, resolve
+
 Content = typing.TypeVar("Content")
+Result = typing.TypeVar("Result")
+
+# Contents, which are not copied by `copy.deepcopy`
+_IMMUTABLE = frozenset({int, float, bool, complex, str, bytes, type(None)})
 
 
 Empty = types.EllipsisType
 
 
+@dataclass(frozen=True, slots=True)
+class Ordinal(BaseMetadata):
+    value: int
+
+
+# Default of content in generated constructors, so missing content is told apart from any value
+_UNSET = object()
+
+# Guards creation of variants for lazy enums and other state of enums filled on first use,
+# one lock for all, so enums, which refer to each other, don't wait for each other
+_lazy_lock = threading.RLock()
+
+
+def _enum_cached(enum: 'EnumetypedMeta', key: typing.Hashable, build: typing.Callable[[], Result]) -> Result:
+    # State of enum built once on first use (e.g. codecs), kept in `__dict__` of enum, so subclasses don't share it
+    cache = enum.__dict__.get("_lazy_cache")
+    value = cache.get(key) if cache is not None else None
+    if value is None:
+        with _lazy_lock:
+            # Other thread may build it while this one waits for lock
+            cache = enum.__dict__.get("_lazy_cache")
+            if cache is None:
+                cache = {}
+                setattr(enum, "_lazy_cache", cache)
+            value = cache.get(key)
+            if value is None:
+                value = cache[key] = build()
+    return value
+
+
+def _frozen_setattr(self: '_Enumetyped[typing.Any]', name: str, value: typing.Any) -> None:
+    raise FrozenInstanceError(f"cannot assign to field '{name}' of frozen {self.__full_variant_name__}")
+
+
+def _frozen_delattr(self: '_Enumetyped[typing.Any]', name: str) -> None:
+    raise FrozenInstanceError(f"cannot delete field '{name}' of frozen {self.__full_variant_name__}")
+
+
+def _frozen_hash(self: '_Enumetyped[typing.Any]') -> int:
+    cached: typing.Optional[int] = getattr(self, "_hash", None)
+    if cached is not None:
+        return cached
+
+    # Nested frozen values are hashed from the innermost one outward, each caches its hash,
+    # so hash of outer value doesn't recurse and depth is not limited, like in `_frozen_eq`
+    chain = [self]
+    value = self.value
+    while isinstance(value, _Enumetyped) and value.__class__.__hash__ is _frozen_hash and getattr(value, "_hash", None) is None:
+        chain.append(value)
+        value = value.value
+
+    hash_ = 0
+    for node in reversed(chain):
+        hash_ = hash((node.__class__, node.value))
+        object.__setattr__(node, "_hash", hash_)
+    return hash_
+
+
+def _frozen_eq(self: '_Enumetyped[typing.Any]', other: object) -> bool:
+    # Like `_Enumetyped.__eq__`, nested enums are compared in loop
+    while True:
+        if self is other:
+            return True
+
+        if self.__class__ is not other.__class__:
+            return False
+
+        # Hashes cached on both sides are a cheap way to reject before deep comparison of contents
+        hash_, other_hash = getattr(self, "_hash", None), getattr(other, "_hash", None)
+        if hash_ is not None and other_hash is not None and hash_ != other_hash:
+            return False
+
+        value, other_value = self.value, other.value
+        if not isinstance(value, _Enumetyped):
+            return bool(value == other_value)
+
+        self, other = value, other_value
+
+
+def _ordered_pair(self: '_Enumetyped[typing.Any]', other: '_Enumetyped[typing.Any]') -> tuple[typing.Any, typing.Any]:
+    # Walk nested values of the same enum in loop and return first pair of ordinals or values, which differ
+    while True:
+        if self.__ordinal__ != other.__ordinal__:
+            return self.__ordinal__, other.__ordinal__
+
+        if self.__content_type__ is Empty:
+            return 0, 0
+
+        value, other_value = self.value, other.value
+        if not isinstance(value, _Enumetyped) or value.__enum__ is not other_value.__enum__:  # type: ignore
+            return value, other_value
+
+        self, other = value, other_value  # type: ignore
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_function(source: str) -> types.CodeType:
+    return compile(source, "<enumetyped>", "exec")
+
+
+def _create_function(
+        name: str,
+        args: str,
+        body: list[str],
+        globals_: dict[str, typing.Any],
+        qualname: str,
+) -> typing.Callable[..., typing.Any]:
+    # Like `dataclasses`, build straight-line function from source.
+    # Most variants share source, so it's compiled once
+    source = "\n".join([f"def {name}({args}):", *(f"    {line}" for line in body)])
+    namespace: dict[str, typing.Any] = {}
+    exec(_compile_function(source), globals_, namespace)
+
+    fn: typing.Callable[..., typing.Any] = namespace[name]
+    fn.__qualname__ = f"{qualname}.{name}"
+    return fn
+
+
+def _ordering(name: str, symbol: str) -> typing.Callable[..., typing.Any]:
+    # Fast paths for values of the same enum, e.g. while sorting: ordinals of different variants,
+    # then raw values of the same variant with not enum contents. Attributes are read from instances,
+    # lookups on classes are slower because of `EnumetypedMeta.__getattr__`
+    body = [
+        "if self.__class__ is not other.__class__:",
+        "    if not isinstance(other, _Enumetyped) or self.__enum__ is not other.__enum__:",
+        "        return NotImplemented",
+        f"    return self.__ordinal__ {symbol} other.__ordinal__",
+        "if self is other:",
+        f"    return 0 {symbol} 0",
+        "value = self._value",
+        "if not isinstance(value, _Enumetyped):",
+        f"    return value {symbol} other._value",
+        "value, other_value = _ordered_pair(self, other)",
+        f"return value {symbol} other_value",
+    ]
+    return _create_function(name, "self, other", body, globals(), "_Enumetyped")
+
+
+_ORDERING = {name: _ordering(name, symbol) for name, symbol in (
+    ("__lt__", "<"),
+    ("__le__", "<="),
+    ("__gt__", ">"),
+    ("__ge__", ">="),
+)}
+
+
 class EnumetypedMeta(type):
     __full_variant_name__: str
     __variant_name__: str
 
     __content_type__: typing.Union[str, type[typing.Any]]
+    __variant_annotation__: VariantAnnotation
 
     __variants__: dict[type['_Enumetyped[typing.Any]'], str]
+    __variants_by_ordinal__: tuple[typing.Optional[type['_Enumetyped[typing.Any]']], ...]
+
+    # Variants in declaration order, by attribute name
+    __declared_variants__: dict[str, VariantAnnotation] = {}
+    __declared_ordinals__: dict[str, int]
+
+    __ordinal__: int
+
+    # Enum itself, inherited by its variants
+    __enum__: 'EnumetypedMeta'
 
     __is_variant__: bool = False
 
+    __compact__: bool = False
+    __frozen__: bool = False
+    __lazy__: bool = False
+    __ordered__: bool = False
+
     def __new__(
             cls,
             cls_name: str,
             bases: tuple[typing.Any],
             class_dict: dict[str, typing.Any],
+            compact: bool = False,
+            frozen: bool = False,
+            lazy: bool = False,
+            ordered: bool = False,
     ) -> typing.Any:
+        if compact:
+            # Instances of compact enums have no `__dict__`, so every class
+            # in the hierarchy (the enum itself and its variants) must declare slots
+            class_dict.setdefault("__slots__", ())
+
+        if frozen:
+            class_dict.setdefault("__setattr__", _frozen_setattr)
+            class_dict.setdefault("__delattr__", _frozen_delattr)
+            class_dict.setdefault("__hash__", _frozen_hash)
+            class_dict.setdefault("__eq__", _frozen_eq)
+
+        if ordered:
+            for name, method in _ORDERING.items():
+                class_dict.setdefault(name, method)
+
+        # Table of variants emitted by `python -m enumetyped.compile`
+        precompiled = class_dict.pop("__precompiled__", None)
+
         enum_class = super().__new__(cls, cls_name, bases, class_dict)
+        if not enum_class.__is_variant__:
+            enum_class.__enum__ = enum_class
+
         if enum_class.__annotations__.get("__abstract__"):
             return enum_class
 
         if enum_class.__is_variant__:
             return enum_class
         else:
-            enum_class.__variants__ = dict()
+            enum_class.__declared_variants__ = dict()
+            enum_class.__declared_ordinals__ = dict()
+            enum_class.__compact__ = compact
+            enum_class.__frozen__ = frozen
+            enum_class.__lazy__ = lazy
+            enum_class.__ordered__ = ordered
 
         enum_class.__full_variant_name__ = cls_name
         enum_class.__variant_name__ = cls_name
 
+        if precompiled is not None:
+            # Annotations were parsed and checked by compiler, so they are not parsed again
+            for attr, (ordinal, content, is_self, names, resolver) in precompiled.items():
+                enum_class.__declared_variants__[attr] = VariantAnnotation(
+                    enum_name=cls_name,
+                    content=content,
+                    is_self=is_self,
+                    names=names,
+                    code=None,
+                    resolver=resolver,
+                )
+                enum_class.__declared_ordinals__[attr] = ordinal
+            return enum_class
+
         annotation: typing.Union[type[Annotated[typing.Any, BaseMetadata]], type]
         for attr, annotation in enum_class.__annotations__.items():
             if not hasattr(annotation, "__args__"):
@@ -61,71 +278,222 @@ class EnumetypedMeta(type):
 
                 origin = typing.get_args(annotation)[0]
 
-            split = origin[:-1].split("[", maxsplit=1)
+            if not isinstance(origin, str):
+                continue
 
-            content_type: str | type[typing.Any]
-            if len(split) == 1:
-                content_type = Empty
-            else:
-                left, right = split
-                if left != enum_class.__name__:
-                    continue
+            variant_annotation = parse_variant_annotation(origin)
+            if variant_annotation is None or variant_annotation.enum_name != enum_class.__name__:
+                continue
 
-                if right.split("[", maxsplit=1)[0] == enum_class.__name__:
-                    content_type = enum_class
-                else:
-                    try:
-                        content_type = eval(right)
-                    except NameError:
-                        content_type = right
+            enum_class.__declared_variants__[attr] = variant_annotation
 
-            try:
-                variant_base = enum_class[content_type]  # type: ignore
-            except TypeError:
-                # When enum is non-generic, like this
-                #
-                # class SimpleEnum(TypEnum):
-                #     V: type["SimpleEnum"]
-                #
-                variant_base = enum_class
+            # Like Rust discriminants: explicit `Ordinal` or next after previous variant
+            ordinal = next(reversed(enum_class.__declared_ordinals__.values()), -1) + 1
+            metadata: list[typing.Any] = []
+            for v in getattr(annotation, "__metadata__", ()):
+                if isinstance(v, GroupedMetadata):
+                    metadata.extend(v)
+                else:
+                    metadata.append(v)
 
-            class _EnumVariant(variant_base):  # type: ignore
-                __is_variant__ = True
+            for __meta__ in metadata:
+                if isinstance(__meta__, Ordinal):
+                    ordinal = __meta__.value
 
-            # _EnumVariant.__name__ = enum_class.__name__
-            # _EnumVariant.__full_variant_name__ = f"{enum_class.__name__}.{attr}"
-            _EnumVariant.__name__ = _EnumVariant.__full_variant_name__ = f"{enum_class.__name__}.{attr}"
-            _EnumVariant.__variant_name__ = attr
-            _EnumVariant.__content_type__ = content_type
+            if ordinal < 0:
+                raise ValueError(f"{cls_name}: Ordinal of `{attr}` must be non-negative")
 
-            enum_class.__variants__[_EnumVariant] = attr
+            if ordinal in enum_class.__declared_ordinals__.values():
+                raise ValueError(f"{cls_name}: Two or many variants have ordinal `{ordinal}`")
 
-            setattr(enum_class, attr, _EnumVariant)
+            enum_class.__declared_ordinals__[attr] = ordinal
 
         return enum_class
 
+    def __init__(
+            cls,
+            cls_name: str,
+            bases: tuple[typing.Any],
+            class_dict: dict[str, typing.Any],
+            **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(cls_name, bases, class_dict)
+
+        # Variants created after `__new__` of all metaclasses, so subclasses of `EnumetypedMeta`
+        # can prepare enum before. Lazy enums create variants on first access, see `__getattr__`
+        if "__declared_variants__" in cls.__dict__ and not cls.__lazy__:
+            cls.__create_variants__()
+
+    def __tag_size__(cls) -> int:
+        """ Size in bytes of unsigned integer, which fits ordinals of all variants """
+        count = len(cls.__variants_by_ordinal__)
+        return 1 if count <= 0x100 else 2 if count <= 0x10000 else 4
+
+    def __getattr__(cls, name: str) -> typing.Any:
+        # Called only when attribute is not found, so variants of lazy enum are created here
+        enum_class = cls.__enum__
+
+        if name in enum_class.__declared_variants__:
+            with _lazy_lock:
+                return enum_class.__dict__.get(name) or enum_class.__publish_variant__(name)
+
+        if name in ("__variants__", "__variants_by_ordinal__") and enum_class.__declared_variants__:
+            with _lazy_lock:
+                if name not in enum_class.__dict__:
+                    enum_class.__create_variants__()
+                return enum_class.__dict__[name]
+
+        raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+    def __create_variants__(cls) -> dict[type['_Enumetyped[typing.Any]'], str]:
+        variants = dict()
+        by_ordinal: list[typing.Optional[type['_Enumetyped[typing.Any]']]] = [
+            None for _ in range(max(cls.__declared_ordinals__.values(), default=-1) + 1)
+        ]
+        for attr in cls.__declared_variants__:
+            variant = cls.__dict__.get(attr) or cls.__publish_variant__(attr)
+            variants[variant] = attr
+            by_ordinal[variant.__ordinal__] = variant
+
+        cls.__variants_by_ordinal__ = tuple(by_ordinal)
+        cls.__variants__ = variants
+        return variants
+
+    def __create_variant__(cls, attr: str) -> type['_Enumetyped[typing.Any]']:
+        variant_annotation = cls.__declared_variants__[attr]
+
+        content_type: str | type[typing.Any]
+        if variant_annotation.content is None:
+            content_type = Empty
+        elif variant_annotation.is_self:
+            content_type = cls
+        else:
+            try:
+                if variant_annotation.resolver is not None:
+                    content_type = variant_annotation.resolver(cls)
+                else:
+                    # Enum is not bound in module while it's created, so pass it explicitly
+                    content_type = resolve(variant_annotation, cls.__module__, {cls.__name__: cls})
+            except NameError:
+                # Declared below enum, resolved later
+                content_type = variant_annotation.content
+
+        # Empty variants keep no value at all and read `_value` from the class,
+        # hashes of frozen values are cached in slot, Empty singletons included
+        slots: tuple[str, ...] = ("_hash",) if cls.__frozen__ else ()
+        if content_type is not Empty:
+            slots = ("_value", *slots)
+
+        class _EnumVariant(cls):  # type: ignore
+            __is_variant__ = True
+
+            if cls.__compact__:
+                __slots__ = slots
+
+        # _EnumVariant.__name__ = enum_class.__name__
+        # _EnumVariant.__full_variant_name__ = f"{enum_class.__name__}.{attr}"
+        _EnumVariant.__name__ = _EnumVariant.__full_variant_name__ = f"{cls.__name__}.{attr}"
+        _EnumVariant.__qualname__ = f"{cls.__qualname__}.{attr}"
+        _EnumVariant.__variant_name__ = attr
+        _EnumVariant.__ordinal__ = cls.__declared_ordinals__[attr]
+        _EnumVariant.__content_type__ = content_type
+        _EnumVariant.__variant_annotation__ = variant_annotation
+        _EnumVariant.__module__ = cls.__module__
+
+        cls.__specialize_variant__(_EnumVariant)
+        return _EnumVariant
+
+    def __publish_variant__(cls, attr: str) -> type['_Enumetyped[typing.Any]']:
+        # Variant is set to enum after subclasses of `EnumetypedMeta` finish it, so other threads,
+        # which read it without lock, never see half-built variant
+        variant = cls.__create_variant__(attr)
+        setattr(cls, attr, variant)
+        return variant
+
+    def __specialize_variant__(cls, variant: type['_Enumetyped[typing.Any]']) -> None:
+        # Replace generic `_Enumetyped.__new__`/`__init__` by constructor generated for this variant,
+        # so construction does not branch on content type, args, etc.
+        #
+        # All work is done in `__new__` and `__init__` is a no-op, because instance may be returned
+        # from `MyEnum.__new__` (lookup by name, validation), and then `__init__` is called again
+        if variant.__content_type__ is Empty:
+            singleton = variant.__singleton__ or object.__new__(variant)
+            variant.__singleton__ = singleton
+            body = ["return singleton"]
+            args = "cls, content=..., /"
+        else:
+            body = [
+                "if content is unset:",
+                "    raise ValueError('Content must be set')",
+                "self = new(cls)",
+                *cls.__variant_init_body__(variant),
+                "return self",
+            ]
+            args = "cls, content=unset, /"
+
+        new = _create_function(
+            "__new__",
+            args,
+            body,
+            {
+                "new": object.__new__,
+                "setattr": object.__setattr__,
+                "singleton": variant.__singleton__,
+                "unset": _UNSET,
+                "content_type": variant.__content_type__,
+            },
+            variant.__qualname__,
+        )
+        variant.__new__ = staticmethod(new)  # type: ignore
+        variant.__init__ = object.__init__  # type: ignore
+
+    def __variant_init_body__(cls, variant: type['_Enumetyped[typing.Any]']) -> list[str]:
+        if variant.__frozen__:
+            return ["setattr(self, '_value', content)"]
+        return ["self._value = content"]
+
     def __repr__(self) -> str:
         # return self.__name__
         return getattr(self, "__full_variant_name__", self.__class__.__name__)
 
 
 class _Enumetyped(typing.Generic[Content], metaclass=EnumetypedMeta):
+    __slots__ = ()
     __match_args__ = ("value",)
 
     __full_variant_name__: typing.ClassVar[str]
     __variant_name__: typing.ClassVar[str]
 
     __content_type__: typing.ClassVar[typing.Union[str, type[typing.Any]]]
+    __variant_annotation__: typing.ClassVar[VariantAnnotation]
 
     __variants__: typing.ClassVar[dict[type['_Enumetyped[typing.Any]'], str]]
+    __variants_by_ordinal__: typing.ClassVar[tuple[typing.Optional[type['_Enumetyped[typing.Any]']], ...]]
+
+    # Position of variant in `__variants_by_ordinal__`
+    __ordinal__: typing.ClassVar[int]
+    __enum__: typing.ClassVar[EnumetypedMeta]
 
     __is_variant__: typing.ClassVar[bool] = False
+    __compact__: typing.ClassVar[bool] = False
+    __frozen__: typing.ClassVar[bool] = False
+    __ordered__: typing.ClassVar[bool] = False
+
+    # Shared instance of variant with Empty content, created on first construction
+    __singleton__: typing.ClassVar[typing.Optional['_Enumetyped[typing.Any]']] = None
 
     __abstract__: typing_extensions.Never
 
     _value: typing.Optional[Content] = None
 
     def __new__(cls, *args):  # type: ignore
+        if cls.__is_variant__ and cls.__content_type__ is Empty:
+            # All instances of Empty variant are identical, so any arguments skipped
+            instance = cls.__singleton__
+            if instance is None:
+                instance = cls.__singleton__ = object.__new__(cls)
+            return instance
+
         if not args:
             if cls.__content_type__ is not Empty:
                 raise ValueError("Content must be set")
@@ -150,11 +518,13 @@ class _Enumetyped(typing.Generic[Content], metaclass=EnumetypedMeta):
         pass
 
     def __init__(self, content: Content = ...):  # type: ignore
-        if self._value is None and self.__content_type__ is not Empty:
+        # Slot of compact variant is unset until first assignment
+        if getattr(self, "_value", None) is None and self.__content_type__ is not Empty:
             if content is Ellipsis:
                 return
 
-            self._value = content
+            # Bypass `__setattr__` of frozen enums
+            object.__setattr__(self, "_value", content)
 
     def __repr__(self) -> str:
         if self.__content_type__ is Empty:
@@ -162,11 +532,88 @@ class _Enumetyped(typing.Generic[Content], metaclass=EnumetypedMeta):
         return f"{self.__full_variant_name__}({self.value.__repr__()})"
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, _Enumetyped):
-            return False
+        # Nested enums are compared in loop instead of recursion, so depth of values is not limited
+        while True:
+            if self is other:
+                return True
+
+            if self.__class__ is not other.__class__:
+                return False
+
+            value, other_value = self.value, other.value
+            if not isinstance(value, _Enumetyped):
+                return bool(value == other_value)
+
+            self, other = value, other_value
+
+    if typing.TYPE_CHECKING:
+        # Set in class of enum with `ordered=True` only
+        def __lt__(self, other: '_Enumetyped[typing.Any]') -> bool: ...
+        def __le__(self, other: '_Enumetyped[typing.Any]') -> bool: ...
+        def __gt__(self, other: '_Enumetyped[typing.Any]') -> bool: ...
+        def __ge__(self, other: '_Enumetyped[typing.Any]') -> bool: ...
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        # Only variant, referenced by qualified name "MyEnum.Variant", and content are pickled,
+        # so instance is restored by constructor of variant
+        if self.__content_type__ is Empty:
+            return self.__class__, ()
+        return self.__class__, (self.value,)
+
+    def __copy__(self) -> typing_extensions.Self:
+        if self.__content_type__ is Empty:
+            return self
+        return self.__class__(self._value)
+
+    def __deepcopy__(self, memo: dict[int, typing.Any]) -> typing_extensions.Self:
+        if self.__content_type__ is Empty:
+            return self
+
+        value = self._value
+        if value.__class__ in _IMMUTABLE:
+            # Frozen instance with immutable content can't be changed at all
+            return self if self.__frozen__ else self.__class__(value)
+
+        result = self.__class__(copy.deepcopy(value, memo))
+        memo[id(self)] = result
+        return result
+
+    @classmethod
+    def dispatcher(
+            cls,
+            handlers: typing.Mapping[type['_Enumetyped[typing.Any]'], typing.Callable[[typing.Any], Result]],
+            default: typing.Optional[typing.Callable[[typing.Any], Result]] = None,
+    ) -> typing.Callable[['_Enumetyped[typing.Any]'], Result]:
+        """ Build function, which calls handler of variant with enum instance
+
+        Handlers are placed into table indexed by ordinal, so dispatching doesn't depend on count of variants,
+        unlike `match` statement. Raises ValueError when some variant is not handled and `default` is not set.
+        """
+        enum_class = cls.__enum__
+        by_ordinal = enum_class.__variants_by_ordinal__
+
+        for variant in handlers:
+            if variant not in enum_class.__variants__:
+                raise ValueError(f"{enum_class.__name__}: `{variant!r}` is not a variant")
+
+        missing = [name for variant, name in enum_class.__variants__.items() if variant not in handlers]
+        if missing and default is None:
+            raise ValueError(f"{enum_class.__name__}: Variants `{'`, `'.join(missing)}` are not handled")
+
+        table = tuple(
+            handlers.get(variant, default) if variant is not None else default
+            for variant in by_ordinal
+        )
+
+        def dispatch(value: '_Enumetyped[typing.Any]') -> Result:
+            # Ordinals of other enums would index the table too
+            if not isinstance(value, enum_class):
+                raise TypeError(f"{enum_class.__name__}: `{value!r}` is not a value of enum")
+            return table[value.__ordinal__](value)
 
-        return self.__class__ == other.__class__ and self.value == other.value
+        return dispatch
 
 
 class Enumetyped(_Enumetyped[Content]):
+    __slots__ = ()
     __abstract__: typing_extensions.Never
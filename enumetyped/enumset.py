@@ -0,0 +1,162 @@
+import typing
+
+from enumetyped.core import Empty, EnumetypedMeta, _Enumetyped
+
+__all__ = [
+    "EnumSet",
+]
+
+Enum = typing.TypeVar("Enum", bound=_Enumetyped[typing.Any])
+
+
+class EnumSet(typing.Generic[Enum]):
+    """ Immutable set of values of enum with Empty variants, stored as bitmask over ordinals
+
+    Membership, union, intersection and difference are single operations on integers.
+    In pydantic models `EnumSet[MyEnum]` is serialized as list of variant names.
+
+        permissions = EnumSet(Permission, [Permission.Read(), Permission.Write()])
+        assert Permission.Read() in permissions
+    """
+    __slots__ = ("_enum", "_bits")
+
+    def __init__(self, enum_class: type[Enum], values: typing.Iterable[Enum] = ()) -> None:
+        enum = enum_class.__enum__
+        for variant in enum.__variants__:
+            if variant.__content_type__ is not Empty:
+                raise TypeError(f"{variant.__full_variant_name__}: EnumSet contains only Empty variants")
+
+        bits = 0
+        for value in values:
+            if not isinstance(value, enum):
+                raise TypeError(f"Expected instance of {enum.__name__}, got {type(value).__name__}")
+            bits |= 1 << value.__ordinal__
+
+        self._enum = enum
+        self._bits = bits
+
+    @classmethod
+    def _from_bits(cls, enum: EnumetypedMeta, bits: int) -> 'EnumSet[Enum]':
+        result: EnumSet[Enum] = object.__new__(cls)
+        result._enum = enum
+        result._bits = bits
+        return result
+
+    @classmethod
+    def full(cls, enum_class: type[Enum]) -> 'EnumSet[Enum]':
+        """ Set of all variants of enum """
+        return cls(enum_class, [variant() for variant in enum_class.__variants__])  # type: ignore
+
+    @classmethod
+    def from_names(cls, enum_class: type[Enum], names: typing.Iterable[str]) -> 'EnumSet[Enum]':
+        """ Set of variants by serialized names, renames of pydantic enums are respected """
+        deserialization: dict[str, str] = getattr(enum_class, "__names_deserialization__", {})
+        return cls(enum_class, [getattr(enum_class, deserialization.get(name, name))() for name in names])
+
+    def names(self) -> list[str]:
+        """ Serialized names of variants in declaration order """
+        serialization: dict[str, str] = getattr(self._enum, "__names_serialization__", {})
+        return [serialization.get(value.__variant_name__, value.__variant_name__) for value in self]
+
+    def __contains__(self, value: object) -> bool:
+        return isinstance(value, self._enum) and bool(self._bits >> value.__ordinal__ & 1)
+
+    def __iter__(self) -> typing.Iterator[Enum]:
+        bits = self._bits
+        for variant in self._enum.__variants__:
+            if bits >> variant.__ordinal__ & 1:
+                yield variant()  # type: ignore
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self._bits != 0
+
+    def _other_bits(self, other: object) -> typing.Optional[int]:
+        if isinstance(other, EnumSet) and other._enum is self._enum:
+            return other._bits
+        return None
+
+    def __or__(self, other: 'EnumSet[Enum]') -> 'EnumSet[Enum]':
+        bits = self._other_bits(other)
+        if bits is None:
+            return NotImplemented
+        return self._from_bits(self._enum, self._bits | bits)
+
+    def __and__(self, other: 'EnumSet[Enum]') -> 'EnumSet[Enum]':
+        bits = self._other_bits(other)
+        if bits is None:
+            return NotImplemented
+        return self._from_bits(self._enum, self._bits & bits)
+
+    def __sub__(self, other: 'EnumSet[Enum]') -> 'EnumSet[Enum]':
+        bits = self._other_bits(other)
+        if bits is None:
+            return NotImplemented
+        return self._from_bits(self._enum, self._bits & ~bits)
+
+    def __xor__(self, other: 'EnumSet[Enum]') -> 'EnumSet[Enum]':
+        bits = self._other_bits(other)
+        if bits is None:
+            return NotImplemented
+        return self._from_bits(self._enum, self._bits ^ bits)
+
+    def __eq__(self, other: object) -> bool:
+        return self._other_bits(other) == self._bits
+
+    def __le__(self, other: 'EnumSet[Enum]') -> bool:
+        bits = self._other_bits(other)
+        if bits is None:
+            return NotImplemented
+        return self._bits & ~bits == 0
+
+    def __ge__(self, other: 'EnumSet[Enum]') -> bool:
+        bits = self._other_bits(other)
+        if bits is None:
+            return NotImplemented
+        return bits & ~self._bits == 0
+
+    def __hash__(self) -> int:
+        return hash((self._enum, self._bits))
+
+    def __repr__(self) -> str:
+        return f"EnumSet({self._enum.__name__}, {list(self)!r})"
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return self._from_bits, (self._enum, self._bits)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: typing.Any, handler: typing.Any) -> typing.Any:
+        from pydantic_core import core_schema
+
+        args = typing.get_args(source_type)
+        if not args:
+            raise TypeError("EnumSet must be parametrized by enum, e.g. `EnumSet[MyEnum]`")
+        enum = args[0]
+
+        names = cls.full(enum).names()
+
+        def from_names(strict: bool) -> core_schema.CoreSchema:
+            # Strict list in python mode, so EnumSet of other enum is not validated as iterable of names
+            return core_schema.no_info_after_validator_function(
+                lambda value: cls.from_names(enum, value),
+                core_schema.list_schema(core_schema.literal_schema(names), strict=strict),
+            )
+
+        def from_set(value: EnumSet[Enum]) -> EnumSet[Enum]:
+            if value._enum is not enum:
+                raise ValueError(f"Expected EnumSet of {enum.__name__}, got EnumSet of {value._enum.__name__}")
+            return value
+
+        return core_schema.json_or_python_schema(
+            json_schema=from_names(False),
+            python_schema=core_schema.union_schema([
+                core_schema.no_info_after_validator_function(from_set, core_schema.is_instance_schema(cls)),
+                from_names(True),
+            ]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.names(),
+                return_schema=core_schema.list_schema(core_schema.str_schema()),
+            ),
+        )
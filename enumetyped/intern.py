@@ -0,0 +1,91 @@
+import threading
+import typing
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+
+from enumetyped.core import _Enumetyped
+from enumetyped.traversal import transform
+
+__all__ = [
+    "Interner",
+]
+
+Node = typing.TypeVar("Node", bound=_Enumetyped[typing.Any])
+
+# Interner of values created by validation of pydantic enums, set by `with Interner():`
+_active_interner: ContextVar[typing.Optional["Interner"]] = ContextVar("_active_interner", default=None)
+# Tokens of nested `with` blocks, kept per context, so threads and tasks don't reset tokens of each other
+_active_tokens: ContextVar[tuple[Token[typing.Optional["Interner"]], ...]] = ContextVar("_active_tokens", default=())
+
+
+class Interner:
+    """ Bounded table of frozen values, equal values are replaced by the first one seen
+
+        interner = Interner()
+        tree = interner.intern(tree)
+
+        with interner:
+            tree = MyEnum.model_validate_json(data)
+
+    Only frozen variants with hashable contents are interned, others are kept as is, but their
+    contents are interned. Least recently used values are dropped, when table is full.
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._table: OrderedDict[_Enumetyped[typing.Any], _Enumetyped[typing.Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __repr__(self) -> str:
+        return f"Interner(size={len(self._table)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+    def __enter__(self) -> "Interner":
+        _active_tokens.set((*_active_tokens.get(), _active_interner.set(self)))
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        *tokens, token = _active_tokens.get()
+        _active_tokens.set(tuple(tokens))
+        _active_interner.reset(token)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._table.clear()
+            self.hits = self.misses = 0
+
+    def intern_value(self, value: Node) -> Node:
+        """ Interned value itself, its contents are expected to be interned already """
+        if not value.__frozen__:
+            return value
+
+        try:
+            hash(value)
+        except TypeError:
+            # Content is not hashable, e.g. list
+            return value
+
+        table = self._table
+        with self._lock:
+            interned = table.get(value)
+            if interned is not None:
+                table.move_to_end(interned)
+                self.hits += 1
+                return interned  # type: ignore
+
+            table[value] = value
+            self.misses += 1
+            if len(table) > self.maxsize:
+                table.popitem(last=False)
+        return value
+
+    def intern(self, value: Node) -> Node:
+        """ Value with all equal frozen values in it replaced by interned ones """
+        return transform(value, self.intern_value)
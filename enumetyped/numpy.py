@@ -0,0 +1,112 @@
+import typing
+from dataclasses import dataclass
+
+import numpy
+
+from enumetyped.array import EnumArray
+from enumetyped.core import Empty, EnumetypedMeta, _Enumetyped
+
+__all__ = [
+    "EnumColumns",
+    "to_numpy",
+    "from_numpy",
+]
+
+Enum = typing.TypeVar("Enum", bound=_Enumetyped[typing.Any])
+
+# Content types, which have NumPy counterpart
+DTYPES: dict[typing.Any, type[numpy.generic]] = {
+    bool: numpy.bool_,
+    int: numpy.int64,
+    float: numpy.float64,
+}
+
+# Tags by `EnumetypedMeta.__tag_size__`
+_TAGS_DTYPES: dict[int, type[numpy.unsignedinteger[typing.Any]]] = {1: numpy.uint8, 2: numpy.uint16, 4: numpy.uint32}
+
+
+@dataclass(frozen=True, slots=True)
+class EnumColumns(typing.Generic[Enum]):
+    enum: type[Enum]
+
+    # Ordinal of variant per value
+    tags: numpy.ndarray
+
+    # Contents of values per variant, in order of values; Empty variants are skipped
+    contents: dict[type[Enum], numpy.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def mask(self, variant: type[Enum]) -> numpy.ndarray:
+        """ Boolean mask of values of variant """
+        return self.tags == variant.__ordinal__  # type: ignore
+
+    def positions(self, variant: type[Enum]) -> numpy.ndarray:
+        """ Indices of values of variant, aligned with `contents[variant]`
+
+        e.g. `columns.positions(MyEnum.Int)[columns.contents[MyEnum.Int] > 10]`
+        """
+        return numpy.flatnonzero(self.mask(variant))
+
+
+def _enum(enum_class: type[Enum]) -> EnumetypedMeta:
+    enum = enum_class.__enum__
+    for variant in enum.__variants__:
+        if variant.__content_type__ is not Empty and variant.__content_type__ not in DTYPES:
+            raise TypeError(f"{variant.__full_variant_name__}: Content must be bool, int, float or Empty")
+    return enum
+
+
+def _tags_dtype(enum: EnumetypedMeta) -> type[numpy.unsignedinteger[typing.Any]]:
+    return _TAGS_DTYPES[enum.__tag_size__()]
+
+
+def to_numpy(enum_class: type[Enum], values: typing.Union[typing.Iterable[Enum], EnumArray[Enum]]) -> EnumColumns[Enum]:
+    """ Convert values of enum with bool, int, float or Empty contents to NumPy arrays """
+    enum = _enum(enum_class)
+    dtype = _tags_dtype(enum)
+    variants = [v for v in enum.__variants_by_ordinal__ if v is not None and v.__content_type__ is not Empty]
+
+    contents: dict[typing.Any, numpy.ndarray]
+    if isinstance(values, EnumArray):
+        # Columns are already collected, only values of this array are picked from them
+        tags = numpy.frombuffer(values._tags, dtype=values._tags.typecode).astype(dtype)
+        offsets = numpy.frombuffer(values._offsets, dtype=numpy.uint32)
+        contents = {
+            variant: numpy.array(values._columns[variant.__ordinal__], dtype=DTYPES[variant.__content_type__])[
+                offsets[tags == variant.__ordinal__]
+            ]
+            for variant in variants
+        }
+    else:
+        tags_list: list[int] = []
+        columns: list[list[typing.Any]] = [[] for _ in enum.__variants_by_ordinal__]
+        for value in values:
+            tag = value.__ordinal__
+            tags_list.append(tag)
+            columns[tag].append(value._value)
+
+        tags = numpy.array(tags_list, dtype=dtype)
+        contents = {
+            variant: numpy.array(columns[variant.__ordinal__], dtype=DTYPES[variant.__content_type__])
+            for variant in variants
+        }
+
+    return EnumColumns(enum, tags, contents)
+
+
+def from_numpy(columns: EnumColumns[Enum]) -> list[Enum]:
+    """ Create instances from arrays, created by `to_numpy` """
+    by_ordinal = columns.enum.__variants_by_ordinal__
+    # Empty variants have no contents
+    contents = [
+        iter(columns.contents[variant].tolist()) if variant in columns.contents else None
+        for variant in by_ordinal
+    ]
+
+    result = []
+    for tag in columns.tags.tolist():
+        variant, content = by_ordinal[tag], contents[tag]
+        result.append(variant() if content is None else variant(next(content)))
+    return result
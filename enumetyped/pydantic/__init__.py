@@ -9,6 +9,7 @@ from .core import (
     EnumetypedPydantic,
     FieldMetadata,
 )
+from .dynamic import create_enum
 
 TypEnumPydantic = EnumetypedPydantic
 
@@ -17,4 +18,5 @@ __all__ = [
     "Rename",
     "EnumetypedPydantic",
     "TypEnumPydantic",
+    "create_enum",
 ]
@@ -0,0 +1,425 @@
+import inspect
+import json
+import struct
+import types
+import typing
+
+import pydantic_core
+from pydantic import TypeAdapter
+
+from enumetyped.codec import _ContentCompiler
+from enumetyped.core import Empty, EnumetypedMeta, _enum_cached
+from enumetyped.pydantic.core import EnumetypedPydantic, eval_content_type
+
+__all__ = [
+    "BinaryCodec",
+    "binary_codec",
+]
+
+Enum = typing.TypeVar("Enum", bound=EnumetypedPydantic[typing.Any])
+
+# Value is written to buffer, read from reader
+Encode = typing.Callable[[typing.Any, bytearray], None]
+Decode = typing.Callable[["_Reader"], typing.Any]
+
+_DOUBLE = struct.Struct("<d")
+_CHUNK = 1 << 16
+
+# Kinds of values of `Any` contents, which are written before them
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _BYTES, _LIST, _DICT, _JSON = range(10)
+
+
+class _Type(typing.NamedTuple):
+    encode: Encode
+    decode: Decode
+    # Class of values, checked to choose member of union, None for any value
+    kind: typing.Optional[type] = None
+
+
+class _Reader:
+    # Reads data from bytes or file, file is read by chunks for streams of values
+    # and by exact sizes for single value, so nothing after value is consumed
+    __slots__ = ("data", "pos", "fp", "chunk")
+
+    def __init__(self, data: bytes = b"", fp: typing.Optional[typing.BinaryIO] = None, chunk: int = 0) -> None:
+        self.data = data
+        self.pos = 0
+        self.fp = fp
+        self.chunk = chunk
+
+    def at_end(self) -> bool:
+        return self.pos >= len(self.data) and not self._fill(1)
+
+    def byte(self) -> int:
+        if self.pos >= len(self.data) and not self._fill(1):
+            raise ValueError("Unexpected end of data")
+        result = self.data[self.pos]
+        self.pos += 1
+        return result
+
+    def take(self, size: int) -> bytes:
+        end = self.pos + size
+        if end > len(self.data):
+            if not self._fill(size):
+                raise ValueError("Unexpected end of data")
+            end = self.pos + size
+        result = self.data[self.pos:end]
+        self.pos = end
+        return result
+
+    def varint(self) -> int:
+        result = shift = 0
+        while True:
+            byte = self.byte()
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def _fill(self, size: int) -> bool:
+        if self.fp is None:
+            return False
+
+        parts = [self.data[self.pos:]]
+        missing = size - len(parts[0])
+        while missing > 0:
+            part = self.fp.read(max(missing, self.chunk))
+            if not part:
+                break
+            parts.append(part)
+            missing -= len(part)
+
+        self.data = b"".join(parts)
+        self.pos = 0
+        return missing <= 0
+
+
+def _write_varint(out: bytearray, number: int) -> None:
+    while number >= 0x80:
+        out.append(number & 0x7F | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _encode_int(value: int, out: bytearray) -> None:
+    # Zigzag, so small negative numbers are short too
+    _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _decode_int(reader: _Reader) -> int:
+    number = reader.varint()
+    return number >> 1 if not number & 1 else -((number + 1) >> 1)
+
+
+def _encode_bool(value: bool, out: bytearray) -> None:
+    out.append(1 if value else 0)
+
+
+def _encode_float(value: float, out: bytearray) -> None:
+    out += _DOUBLE.pack(value)
+
+
+def _encode_str(value: str, out: bytearray) -> None:
+    data = value.encode()
+    _write_varint(out, len(data))
+    out += data
+
+
+def _encode_bytes(value: bytes, out: bytearray) -> None:
+    _write_varint(out, len(value))
+    out += value
+
+
+def _encode_none(value: None, out: bytearray) -> None:
+    pass
+
+
+_SCALARS: dict[typing.Any, _Type] = {
+    bool: _Type(_encode_bool, lambda reader: reader.byte() != 0, bool),
+    int: _Type(_encode_int, _decode_int, int),
+    float: _Type(_encode_float, lambda reader: _DOUBLE.unpack(reader.take(8))[0], float),
+    str: _Type(_encode_str, lambda reader: reader.take(reader.varint()).decode(), str),
+    bytes: _Type(_encode_bytes, lambda reader: reader.take(reader.varint()), bytes),
+    type(None): _Type(_encode_none, lambda reader: None, type(None)),
+    None: _Type(_encode_none, lambda reader: None, type(None)),
+}
+
+
+class _EnumCodec:
+    # Functions of one enum by ordinals of variants, filled after codec is registered,
+    # so contents refer to codecs of enums, which are compiled yet
+    __slots__ = ("enum", "encoders", "decoders")
+
+    def __init__(self, enum: EnumetypedMeta) -> None:
+        self.enum = enum
+        self.encoders: list[typing.Optional[Encode]] = [None] * len(enum.__variants_by_ordinal__)
+        self.decoders: list[typing.Optional[Decode]] = [None] * len(enum.__variants_by_ordinal__)
+
+    def encode(self, value: typing.Any, out: bytearray) -> None:
+        ordinal = value.__ordinal__
+        _write_varint(out, ordinal)
+        self.encoders[ordinal](value, out)
+
+    def decode(self, reader: _Reader) -> typing.Any:
+        ordinal = reader.varint()
+        decode = self.decoders[ordinal] if ordinal < len(self.decoders) else None
+        if decode is None:
+            raise ValueError(f"{self.enum.__name__}: Unknown ordinal `{ordinal}`")
+        return decode(reader)
+
+
+class _Compiler(_ContentCompiler[_Type, _EnumCodec]):
+    def __init__(self) -> None:
+        super().__init__(_SCALARS)
+
+    def _enum_codec(self, enum: EnumetypedMeta) -> _EnumCodec:
+        return _EnumCodec(enum)
+
+    def _variant(self, codec: _EnumCodec, variant: typing.Any, attr: str) -> None:
+        encode, decode = self._content(variant)
+        codec.encoders[variant.__ordinal__] = encode
+        codec.decoders[variant.__ordinal__] = decode
+
+    def _content(self, variant: typing.Any) -> tuple[Encode, Decode]:
+        if variant.__content_type__ is Empty:
+            return _encode_none, lambda reader: variant()
+
+        content_type = variant.content_type()
+        if not variant.__implicit_root_model__:
+            content = self.compile(content_type)
+            encode_content, decode_content = content.encode, content.decode
+            return (
+                lambda value, out: encode_content(value._value, out),
+                lambda reader: variant(decode_content(reader)),
+            )
+
+        # Contents like `list[MyEnum]` are wrapped to root models, which are constructed
+        # without validation, because decoded contents are already of their types
+        root = content_type.model_fields["root"].annotation
+        if isinstance(root, (str, typing.ForwardRef)):
+            root = eval_content_type(variant)
+        content = self.compile(root)
+        encode_content, decode_content = content.encode, content.decode
+        construct = content_type.model_construct
+        return (
+            lambda value, out: encode_content(value._value.root, out),
+            lambda reader: variant(construct(decode_content(reader))),
+        )
+
+    def _enum_content(self, codec: _EnumCodec) -> _Type:
+        return _Type(codec.encode, codec.decode, codec.enum)
+
+    def _any(self) -> _Type:
+        return _Type(_encode_any, _decode_any)
+
+    def _sequence(self, item: _Type, kind: type) -> _Type:
+        encode_item, decode_item = item.encode, item.decode
+
+        def encode(value: typing.Any, out: bytearray) -> None:
+            _write_varint(out, len(value))
+            for v in value:
+                encode_item(v, out)
+
+        def decode(reader: _Reader) -> typing.Any:
+            items = [decode_item(reader) for _ in range(reader.varint())]
+            return items if kind is list else kind(items)
+
+        return _Type(encode, decode, kind)
+
+    def _tuple(self, items: list[_Type]) -> _Type:
+        def encode(value: typing.Any, out: bytearray) -> None:
+            for item, v in zip(items, value):
+                item.encode(v, out)
+
+        def decode(reader: _Reader) -> typing.Any:
+            return tuple([item.decode(reader) for item in items])
+
+        return _Type(encode, decode, tuple)
+
+    def _dict(self, key_type: typing.Any, item: _Type) -> _Type:
+        key = self.compile(key_type)
+        encode_key, encode_item = key.encode, item.encode
+        decode_key, decode_item = key.decode, item.decode
+
+        def encode(value: typing.Any, out: bytearray) -> None:
+            _write_varint(out, len(value))
+            for k, v in value.items():
+                encode_key(k, out)
+                encode_item(v, out)
+
+        def decode(reader: _Reader) -> typing.Any:
+            result = {}
+            for _ in range(reader.varint()):
+                k = decode_key(reader)
+                result[k] = decode_item(reader)
+            return result
+
+        return _Type(encode, decode, dict)
+
+    def _union(self, member_types: tuple[typing.Any, ...], members: list[_Type]) -> _Type:
+        # Index of member is written before value, member is chosen by exact type of value,
+        # then by `isinstance`, then first member, which checks no type, is taken
+
+        def encode(value: typing.Any, out: bytearray) -> None:
+            kind = type(value)
+            index = next((i for i, member in enumerate(members) if member.kind is kind), None)
+            if index is None:
+                index = next((
+                    i for i, member in enumerate(members)
+                    if member.kind is not None and isinstance(value, member.kind)
+                ), None)
+            if index is None:
+                index = next((i for i, member in enumerate(members) if member.kind is None), None)
+            if index is None:
+                raise TypeError(f"Value {value!r} matches no member of union")
+
+            _write_varint(out, index)
+            members[index].encode(value, out)
+
+        def decode(reader: _Reader) -> typing.Any:
+            index = reader.varint()
+            if index >= len(members):
+                raise ValueError(f"Unknown member `{index}` of union")
+            return members[index].decode(reader)
+
+        return _Type(encode, decode)
+
+    def _other(self, tp: typing.Any) -> _Type:
+        # Models, dataclasses and everything else are kept as their pydantic JSON
+        adapter: TypeAdapter[typing.Any] = TypeAdapter(tp)
+
+        def encode(value: typing.Any, out: bytearray) -> None:
+            _encode_bytes(adapter.dump_json(value), out)
+
+        def decode(reader: _Reader) -> typing.Any:
+            return adapter.validate_json(reader.take(reader.varint()))
+
+        return _Type(encode, decode, tp if inspect.isclass(tp) else None)
+
+
+def _encode_any(value: typing.Any, out: bytearray) -> None:
+    # Content type is known only from value, so kind is written before it.
+    # Like pydantic with `Any`, values of other types are dumped to JSON and loaded as JSON data
+    kind = type(value)
+    if value is None:
+        out.append(_NONE)
+    elif kind is bool:
+        out.append(_TRUE if value else _FALSE)
+    elif kind is int:
+        out.append(_INT)
+        _encode_int(value, out)
+    elif kind is float:
+        out.append(_FLOAT)
+        _encode_float(value, out)
+    elif kind is str:
+        out.append(_STR)
+        _encode_str(value, out)
+    elif kind is bytes:
+        out.append(_BYTES)
+        _encode_bytes(value, out)
+    elif kind in (list, tuple, set, frozenset):
+        out.append(_LIST)
+        _write_varint(out, len(value))
+        for v in value:
+            _encode_any(v, out)
+    elif kind is dict:
+        out.append(_DICT)
+        _write_varint(out, len(value))
+        for k, v in value.items():
+            _encode_any(k, out)
+            _encode_any(v, out)
+    else:
+        out.append(_JSON)
+        _encode_bytes(pydantic_core.to_json(value), out)
+
+
+def _decode_any(reader: _Reader) -> typing.Any:
+    kind = reader.byte()
+    if kind == _NONE:
+        return None
+    if kind == _FALSE or kind == _TRUE:
+        return kind == _TRUE
+    if kind == _INT:
+        return _decode_int(reader)
+    if kind == _FLOAT:
+        return _DOUBLE.unpack(reader.take(8))[0]
+    if kind == _STR:
+        return reader.take(reader.varint()).decode()
+    if kind == _BYTES:
+        return reader.take(reader.varint())
+    if kind == _LIST:
+        return [_decode_any(reader) for _ in range(reader.varint())]
+    if kind == _DICT:
+        result = {}
+        for _ in range(reader.varint()):
+            k = _decode_any(reader)
+            result[k] = _decode_any(reader)
+        return result
+    if kind == _JSON:
+        return json.loads(reader.take(reader.varint()))
+    raise ValueError(f"Unknown kind `{kind}` of value")
+
+
+class BinaryCodec(typing.Generic[Enum]):
+    """ Compact binary format of enum values
+
+        codec = binary_codec(Shape)
+        data = codec.dumps(Shape.Circle(1.0))  # b'\\x01\\x00\\x00\\x00\\x00\\x00\\x00\\xf0?'
+        assert codec.loads(data) == Shape.Circle(1.0)
+
+    Variant is written as varint of its ordinal, so ordinals are kept stable by `Ordinal`, not names.
+    Integers are zigzag varints, floats are 8 bytes, strings, lists, sets and dicts are prefixed
+    by their lengths, tuples and unions by nothing and index of member. Contents of other types,
+    like models and dataclasses, are written as their pydantic JSON. Values are not validated.
+    """
+
+    __slots__ = ("enum", "_codec")
+
+    def __init__(self, enum: type[Enum]) -> None:
+        self.enum = enum.__enum__
+        self._codec = _Compiler().enum(self.enum)
+
+    def dumps(self, value: Enum) -> bytes:
+        if not isinstance(value, self.enum):
+            raise TypeError(f"Expected instance of {self.enum.__name__}, got {type(value).__name__}")
+
+        out = bytearray()
+        self._codec.encode(value, out)
+        return bytes(out)
+
+    def loads(self, data: typing.Union[bytes, bytearray, memoryview]) -> Enum:
+        reader = _Reader(bytes(data))
+        result: Enum = self._codec.decode(reader)
+        if not reader.at_end():
+            raise ValueError(f"{len(reader.data) - reader.pos} bytes left after value")
+        return result
+
+    def dump(self, value: Enum, fp: typing.BinaryIO) -> None:
+        fp.write(self.dumps(value))
+
+    def load(self, fp: typing.BinaryIO) -> Enum:
+        """ Read one value, bytes after it are left in file """
+        result: Enum = self._codec.decode(_Reader(fp=fp))
+        return result
+
+    def dump_all(self, values: typing.Iterable[Enum], fp: typing.BinaryIO) -> None:
+        out = bytearray()
+        for value in values:
+            if not isinstance(value, self.enum):
+                raise TypeError(f"Expected instance of {self.enum.__name__}, got {type(value).__name__}")
+            self._codec.encode(value, out)
+            if len(out) >= _CHUNK:
+                fp.write(out)
+                out.clear()
+        fp.write(out)
+
+    def load_all(self, fp: typing.BinaryIO) -> typing.Iterator[Enum]:
+        """ Read values until end of file """
+        reader = _Reader(fp=fp, chunk=_CHUNK)
+        while not reader.at_end():
+            yield self._codec.decode(reader)
+
+
+def binary_codec(enum: type[Enum]) -> BinaryCodec[Enum]:
+    """ Codec of enum, cached in enum like `json_codec` """
+    return _enum_cached(enum.__enum__, "binary_codec", lambda: BinaryCodec(enum))
@@ -0,0 +1,334 @@
+import array
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+import typing
+
+from enumetyped.pydantic.encoding import ContentCodec, content_codec
+
+if typing.TYPE_CHECKING:
+    from enumetyped.pydantic.core import EnumetypedPydantic
+
+__all__ = [
+    "EnumFileWriter",
+    "EnumFileReader",
+]
+
+Enum = typing.TypeVar("Enum", bound="EnumetypedPydantic[typing.Any]")
+
+# File: magic, size of JSON header, header, chunks written by batches
+_FILE_HEADER = struct.Struct("<4sI")
+_MAGIC = b"ETCF"
+_VERSION = 1
+
+# Chunk: magic, count of values, size of contents; followed by tags, offsets of contents and contents
+_CHUNK_HEADER = struct.Struct("<4s4xQQ")
+_CHUNK_MAGIC = b"CHNK"
+
+_TAG_FORMATS: dict[int, typing.Literal["B", "H", "I"]] = {1: "B", 2: "H", 4: "I"}
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _header(codec: ContentCodec) -> dict[str, typing.Any]:
+    return {
+        "version": _VERSION,
+        "enum": f"{codec.enum.__module__}.{codec.enum.__qualname__}",
+        "byteorder": sys.byteorder,
+        "tag_size": codec.enum.__tag_size__(),
+        "variants": [
+            {
+                "name": name,
+                "ordinal": variant.__ordinal__,
+                "content": variant.__variant_annotation__.content,
+            }
+            for variant, name in codec.enum.__variants__.items()
+        ],
+    }
+
+
+class EnumFileWriter(typing.Generic[Enum]):
+    """ Append values of pydantic enum to columnar file by batches
+
+    File starts with JSON header, which describes variants of enum, and continues with chunks,
+    one per batch: array of variant ordinals (tags), array of offsets of contents and buffer of contents,
+    dumped to JSON by pydantic. Existing file is appended, when it was written for the same variants.
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike[str]], enum_class: type[Enum], batch_size: int = 10_000) -> None:
+        self._codec = content_codec(enum_class)
+        self._batch_size = batch_size
+        self._tags: list[int] = []
+        self._contents: list[bytes] = []
+
+        header = _header(self._codec)
+        self._tag_format = _TAG_FORMATS[header["tag_size"]]
+        self._file = open(path, "ab+")
+        try:
+            if self._file.tell() == 0:
+                data = json.dumps(header).encode()
+                self._file.write(_FILE_HEADER.pack(_MAGIC, len(data)) + data)
+                self._file.write(b"\0" * (_align(self._file.tell()) - self._file.tell()))
+            else:
+                self._file.seek(0)
+                data = self._file.read(_FILE_HEADER.size)
+                data += self._file.read(_FILE_HEADER.unpack_from(data)[1] if len(data) == _FILE_HEADER.size else 0)
+                if _read_header(data, path) != header:
+                    raise ValueError(f"{path}: File is written for other variants of {self._codec.enum.__name__}")
+
+                # New chunks are not appended after broken one
+                with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for _ in _chunk_layouts(mapped, header["tag_size"], path):
+                        pass
+                self._file.seek(0, os.SEEK_END)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def write(self, value: Enum) -> None:
+        tag, content = self._codec.encode(value)
+        self._tags.append(tag)
+        self._contents.append(content)
+        if len(self._tags) >= self._batch_size:
+            self.flush()
+
+    def write_batch(self, values: typing.Iterable[Enum]) -> None:
+        for value in values:
+            self.write(value)
+        self.flush()
+
+    def flush(self) -> None:
+        """ Write buffered values as chunk """
+        if not self._tags:
+            return
+
+        offsets = array.array("Q", [0])
+        for content in self._contents:
+            offsets.append(offsets[-1] + len(content))
+
+        tags = array.array(self._tag_format, self._tags).tobytes()
+        self._file.write(b"".join((
+            _CHUNK_HEADER.pack(_CHUNK_MAGIC, len(self._tags), offsets[-1]),
+            tags,
+            b"\0" * (_align(len(tags)) - len(tags)),
+            offsets.tobytes(),
+            *self._contents,
+            b"\0" * (_align(offsets[-1]) - offsets[-1]),
+        )))
+        self._file.flush()
+        self._tags.clear()
+        self._contents.clear()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> 'EnumFileWriter[Enum]':
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+
+def _read_header(data: typing.Union[bytes, mmap.mmap], path: typing.Any) -> dict[str, typing.Any]:
+    if len(data) < _FILE_HEADER.size:
+        raise ValueError(f"{path}: File is not columnar file of enum values")
+
+    magic, size = _FILE_HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError(f"{path}: File is not columnar file of enum values")
+
+    header: dict[str, typing.Any] = json.loads(data[_FILE_HEADER.size:_FILE_HEADER.size + size])
+    return header
+
+
+def _chunk_layouts(
+        data: mmap.mmap,
+        tag_size: int,
+        path: typing.Any,
+) -> typing.Iterator[tuple[int, int, int, int, int]]:
+    # Count of values, starts of tags, offsets and contents, and size of contents of each chunk.
+    # Chunk, which is cut by end of file (e.g. writer crashed during flush), is broken
+    position = _align(_FILE_HEADER.size + _FILE_HEADER.unpack_from(data)[1])
+    while position < len(data):
+        if position + _CHUNK_HEADER.size > len(data):
+            raise ValueError(f"{path}: Broken chunk at {position}")
+
+        magic, count, size = _CHUNK_HEADER.unpack_from(data, position)
+        tags_start = position + _CHUNK_HEADER.size
+        offsets_start = tags_start + _align(tag_size * count)
+        contents_start = offsets_start + 8 * (count + 1)
+        end = contents_start + _align(size)
+        if magic != _CHUNK_MAGIC or end > len(data):
+            raise ValueError(f"{path}: Broken chunk at {position}")
+
+        yield count, tags_start, offsets_start, contents_start, size
+        position = end
+
+
+class _Chunk(typing.NamedTuple):
+    start: int
+    tags: memoryview
+    offsets: memoryview
+    contents: memoryview
+
+
+class EnumFileReader(typing.Sequence[Enum]):
+    """ Read columnar file, written by `EnumFileWriter`, through `mmap`
+
+    Only headers of chunks are read on open, values are decoded on access by index.
+    Counting and filtering by variant scan tags without decoding contents.
+    Variants are matched by name, so file can be read after ordinals of enum are changed.
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike[str]], enum_class: type[Enum]) -> None:
+        self._codec = content_codec(enum_class)
+        self._chunks: list[_Chunk] = []
+        self._starts: list[int] = []
+        self._count = 0
+
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < _FILE_HEADER.size:
+                raise ValueError(f"{path}: File is not columnar file of enum values")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._load(path)
+        except BaseException:
+            self.close()
+            raise
+
+    def _load(self, path: typing.Any) -> None:
+        header = _read_header(self._mmap, path)
+        if header.get("version") != _VERSION or header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{path}: Unsupported version or byte order of file")
+
+        # Tags of file to ordinals of enum, -1 for gaps
+        by_name = {name: variant for variant, name in self._codec.enum.__variants__.items()}
+        self._tag_map: list[int] = [-1] * (max((v["ordinal"] for v in header["variants"]), default=-1) + 1)
+        for variant in header["variants"]:
+            if variant["name"] not in by_name:
+                raise ValueError(f"{path}: Variant `{variant['name']}` is not defined in {self._codec.enum.__name__}")
+            self._tag_map[variant["ordinal"]] = by_name[variant["name"]].__ordinal__
+
+        tag_size = header["tag_size"]
+        with memoryview(self._mmap) as view:
+            self._load_chunks(view, tag_size, path)
+
+    def _load_chunks(self, view: memoryview, tag_size: int, path: typing.Any) -> None:
+        for count, tags_start, offsets_start, contents_start, size in _chunk_layouts(self._mmap, tag_size, path):
+            self._chunks.append(_Chunk(
+                start=self._count,
+                tags=view[tags_start:tags_start + tag_size * count].cast(_TAG_FORMATS[tag_size]),
+                offsets=view[offsets_start:contents_start].cast("Q"),
+                contents=view[contents_start:contents_start + size],
+            ))
+            self._starts.append(self._count)
+            self._count += count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _decode(self, chunk: _Chunk, index: int) -> Enum:
+        content = chunk.contents[chunk.offsets[index]:chunk.offsets[index + 1]].tobytes()
+        return self._codec.decode(self._tag_map[chunk.tags[index]], content)  # type: ignore
+
+    @typing.overload
+    def __getitem__(self, index: int) -> Enum:
+        pass
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> list[Enum]:
+        pass
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[Enum, list[Enum]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("EnumFileReader index out of range")
+
+        chunk = self._chunks[bisect.bisect_right(self._starts, index) - 1]
+        return self._decode(chunk, index - chunk.start)
+
+    def __iter__(self) -> typing.Iterator[Enum]:
+        for chunk in self._chunks:
+            for index in range(len(chunk.tags)):
+                yield self._decode(chunk, index)
+
+    def _file_tag(self, variant: type[Enum]) -> typing.Optional[int]:
+        if variant not in self._codec.enum.__variants__:
+            raise ValueError(f"{self._codec.enum.__name__}: `{variant!r}` is not a variant")
+        if variant.__ordinal__ in self._tag_map:
+            return self._tag_map.index(variant.__ordinal__)
+        return None
+
+    def counts(self) -> dict[type[Enum], int]:
+        """ Count of values per variant, variants without values are skipped """
+        counts = [0] * len(self._tag_map)
+        for chunk in self._chunks:
+            tags = chunk.tags.tobytes()
+            if chunk.tags.itemsize == 1:
+                for tag in range(len(counts)):
+                    counts[tag] += tags.count(tag)
+            else:
+                for tag in chunk.tags:
+                    counts[tag] += 1
+
+        by_ordinal = self._codec.enum.__variants_by_ordinal__
+        result: dict[type[Enum], int] = {}
+        for tag, count in enumerate(counts):
+            if count:
+                variant = by_ordinal[self._tag_map[tag]]
+                result[variant] = result.get(variant, 0) + count  # type: ignore
+        return result
+
+    def count(self, variant: type[Enum]) -> int:
+        return self.counts().get(variant, 0)
+
+    def indices(self, variant: type[Enum]) -> 'array.array[int]':
+        """ Indices of values of variant, found without decoding """
+        tag = self._file_tag(variant)
+        result = array.array("Q")
+        if tag is None:
+            return result
+
+        for chunk in self._chunks:
+            if chunk.tags.itemsize == 1:
+                # Byte is searched in C, without iterating over tags
+                tags = chunk.tags.tobytes()
+                position = tags.find(tag)
+                while position != -1:
+                    result.append(chunk.start + position)
+                    position = tags.find(tag, position + 1)
+            else:
+                result.extend(chunk.start + i for i, t in enumerate(chunk.tags) if t == tag)
+
+        return result
+
+    def filter(self, variant: type[Enum]) -> typing.Iterator[Enum]:
+        """ Decode values of variant only """
+        for index in self.indices(variant):
+            yield self[index]
+
+    def close(self) -> None:
+        for chunk in self._chunks:
+            for view in (chunk.tags, chunk.offsets, chunk.contents):
+                view.release()
+        self._chunks.clear()
+        self._mmap.close()
+
+    def __enter__(self) -> 'EnumFileReader[Enum]':
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
@@ -8,13 +8,18 @@ import pydantic
 import pydantic as pydantic_
 import typing_extensions
 from annotated_types import GroupedMetadata, BaseMetadata
-from pydantic import TypeAdapter
-from pydantic.json_schema import DEFAULT_REF_TEMPLATE, GenerateJsonSchema, JsonSchemaMode
-from pydantic.main import IncEx  # noqa
 from pydantic_core import core_schema
 from pydantic_core.core_schema import ValidationInfo, SerializerFunctionWrapHandler
 
-from enumetyped.core import EnumetypedMeta, Content, Enumetyped
+from enumetyped.core import EnumetypedMeta, Content, Enumetyped, Ordinal, _Enumetyped, _lazy_lock
+from enumetyped.intern import _active_interner
+from enumetyped.resolver import resolve
+
+if typing.TYPE_CHECKING:
+    # Adapters and JSON schema generation are imported on first use
+    from pydantic import TypeAdapter
+    from pydantic.json_schema import GenerateJsonSchema, JsonSchemaMode
+    from pydantic.main import IncEx  # noqa
 
 __all__ = [
     "Rename",
@@ -24,7 +29,7 @@ __all__ = [
     "eval_content_type",
 ]
 
-from enumetyped.pydantic.serialization import AdjacentTagging, InternalTagging, ExternalTagging
+from enumetyped.pydantic.serialization import ExternalTagging
 from enumetyped.pydantic.serialization.tagging import Tagging
 
 
@@ -36,22 +41,51 @@ class Rename(BaseMetadata):
 @dataclass
 class FieldMetadata(GroupedMetadata):
     rename: typing.Optional[str] = None
+    ordinal: typing.Optional[int] = None
 
     def __iter__(self) -> typing.Iterator[BaseMetadata]:
         if self.rename is not None:
             yield Rename(self.rename)
+        if self.ordinal is not None:
+            yield Ordinal(self.ordinal)
 
 
 def eval_content_type(cls: type['EnumetypedPydantic[Content]']) -> type:
     # Eval annotation into real object
-    base = cls.__orig_bases__[0]  # type: ignore
-    module = importlib.import_module(base.__module__)
-    return eval(cls.__content_type__, module.__dict__)  # type: ignore
-
-
-def set_root_model(cls: type['EnumetypedPydantic[Content]'], not_eval_ct: str, module: types.ModuleType) -> None:
-    Root = pydantic.RootModel[not_eval_ct]  # type: ignore  # noqa
-    Root.__module__ = module.__name__
+    return resolve(cls.__variant_annotation__, cls.__module__)  # type: ignore
+
+
+def set_root_model(
+        cls: type['EnumetypedPydantic[Content]'],
+        not_eval_ct: typing.Any,
+        module_name: str,
+        namespace: typing.Optional[dict[str, typing.Any]] = None,
+) -> None:
+    Root: typing.Any
+    if namespace is None:
+        Root = pydantic.RootModel[not_eval_ct]  # noqa
+        Root.__module__ = module_name
+    else:
+        # Parametrized root models are cached by pydantic, so dynamic enums get own models.
+        # Pydantic resolves forward references of incomplete models from their modules, not from
+        # namespace of enum, so content is evaluated here, and schema is built with schema of enum
+        name = not_eval_ct if isinstance(not_eval_ct, str) else typing._type_repr(not_eval_ct)  # noqa
+        root = not_eval_ct
+        if isinstance(root, str):
+            try:
+                root = eval(root, dict(namespace))
+            except NameError:
+                pass
+        Root = types.new_class(
+            f"RootModel[{name}]",
+            (pydantic.RootModel,),
+            exec_body=lambda ns: ns.update(
+                __module__=module_name,
+                __annotations__={"root": root},
+                model_config=pydantic.ConfigDict(defer_build=True),
+            ),
+        )
+        Root.__pydantic_parent_namespace__ = namespace
 
     cls.__content_type__ = Root
     cls.__implicit_root_model__ = True
@@ -67,82 +101,51 @@ class EnumetypedPydanticMeta(EnumetypedMeta):
             class_dict: dict[str, typing.Any],
             variant: typing.Optional[str] = None,
             content: typing.Optional[str] = None,
+            tag_format: typing.Literal["name", "ordinal"] = "name",
+            **kwargs: typing.Any,
     ) -> typing.Any:
-        enum_class = super().__new__(cls, cls_name, bases, class_dict)
+        if tag_format not in ("name", "ordinal"):
+            raise ValueError(f"{cls_name}: Unknown tag format `{tag_format}`")
+
+        precompiled_renames = class_dict.pop("__precompiled_renames__", None)
+
+        enum_class = super().__new__(cls, cls_name, bases, class_dict, **kwargs)
         if enum_class.__annotations__.get("__abstract__"):
             return enum_class
 
         if enum_class.__is_variant__:
             return enum_class
 
-        # Set class to module for evaluate types
-        module = importlib.import_module(enum_class.__module__)
-        module.__dict__[enum_class.__name__] = enum_class
+        if enum_class.__namespace__ is None:
+            # Set class to module for evaluate types
+            module = importlib.import_module(enum_class.__module__)
+            module.__dict__[enum_class.__name__] = enum_class
 
         enum_class.__names_serialization__ = dict()
         enum_class.__names_deserialization__ = dict()
 
+        # Modules of other taggings are imported by enums, which use them.
+        # Ordinal tags are numbers, kept stable by `Ordinal` of variants
+        ordinal = tag_format == "ordinal"
         if variant is not None and content is not None:
-            enum_class.__tagging__ = AdjacentTagging(variant, content)
+            from enumetyped.pydantic.serialization.adjacent import AdjacentTagging
+            enum_class.__tagging__ = AdjacentTagging(variant, content, ordinal)
         elif variant is not None:
-            enum_class.__tagging__ = InternalTagging(variant)
+            from enumetyped.pydantic.serialization.internal import InternalTagging
+            enum_class.__tagging__ = InternalTagging(variant, ordinal)
         else:
-            enum_class.__tagging__ = ExternalTagging()
-
-        annotation: typing.Union[type[typing_extensions.Annotated[typing.Any, BaseMetadata]], type]
-        for attr, annotation in enum_class.__annotations__.items():
-            if not hasattr(annotation, "__args__"):
-                continue
-
-            enum_variant = getattr(enum_class, attr)
-            enum_variant.__module__ = enum_class.__module__
-
-            try:
-                not_eval_ct = enum_variant.__content_type__
-                content_type = enum_variant.content_type()
-                if type(content_type) is types.GenericAlias:  # noqa
-                    # Force generic variants like `Var` below
-                    # to RootModel like `VarRoot`
-                    #
-                    #   class Container(pydantic.RootModel):
-                    #       root: list['A']
-                    #
-                    #   class A(EnumetypedPydantic[Content]):
-                    #       Var: type["A[list[A]]"]
-                    #       VarRoot: type["A[]"]
-                    #
-                    set_root_model(enum_variant, not_eval_ct, module)
-
-                try:
-                    annotation = enum_class.__annotations__[attr]
-                    if isinstance(annotation, typing._AnnotatedAlias):  # type: ignore  # noqa
-                        # Save annotations like
-                        #
-                        #   class A(EnumetypedPydantic[Content]):
-                        #       Var: typing.Annotated[type["A[str]"], Rename("Vapppp")]
-                        #
-                        _, *annotations = typing_extensions.get_args(annotation)
-                        annotation.__origin__ = type[enum_class[content_type]]
-                    else:
-                        enum_class.__annotations__[attr] = type[enum_class[content_type]]
-
-                except TypeError:
-                    # Fall on below case
-                    #
-                    # class SimpleEnum(EnumetypedPydantic[Empty]):
-                    #     V1: type["SimpleEnum"]
-                    #     V2: type["SimpleEnum"]
-                    pass
+            enum_class.__tagging__ = ExternalTagging(ordinal)
 
-            except NameError:
-                # class A(...)
-                #     Var: type['A[B]']
-                #
-                # class B:
-                #    ...
-                not_eval_ct = enum_variant.__content_type__
-                set_root_model(enum_variant, not_eval_ct, module)
+        if precompiled_renames is not None:
+            # Emitted by `python -m enumetyped.compile` with variants
+            for attr, name in precompiled_renames.items():
+                enum_class.__names_serialization__[attr] = name
+                enum_class.__names_deserialization__[name] = attr
+            return enum_class
 
+        annotation: typing.Union[type[typing_extensions.Annotated[typing.Any, BaseMetadata]], type]
+        for attr in enum_class.__declared_variants__:
+            annotation = enum_class.__annotations__[attr]
             if isinstance(annotation, typing._AnnotatedAlias):  # type: ignore  # noqa
                 metadata: list[typing.Union[BaseMetadata, GroupedMetadata]] = []
                 for v in annotation.__metadata__:
@@ -161,6 +164,84 @@ class EnumetypedPydanticMeta(EnumetypedMeta):
 
         return enum_class
 
+    def __create_variant__(cls, attr: str) -> type[_Enumetyped[typing.Any]]:
+        enum_variant = super().__create_variant__(attr)
+
+        # RootModel built from source to resolve forward references lazily
+        not_eval_ct: typing.Any = enum_variant.__variant_annotation__.content
+        namespace = None
+        if cls.__namespace__ is not None:
+            # Dynamic enums are not bound in module, so references are resolved from their namespace.
+            # Contents, passed as objects, have no source
+            namespace = {**cls.__namespace__, cls.__name__: cls}
+            if not enum_variant.__variant_annotation__.names:
+                not_eval_ct = enum_variant.__content_type__
+
+        try:
+            content_type = enum_variant.content_type()
+            if type(content_type) is types.GenericAlias:  # noqa
+                # Force generic variants like `Var` below
+                # to RootModel like `VarRoot`
+                #
+                #   class Container(pydantic.RootModel):
+                #       root: list['A']
+                #
+                #   class A(EnumetypedPydantic[Content]):
+                #       Var: type["A[list[A]]"]
+                #       VarRoot: type["A[]"]
+                #
+                set_root_model(enum_variant, not_eval_ct, cls.__module__, namespace)  # type: ignore
+
+            try:
+                # Dynamic enums have no annotations, so their classes are not kept by cache of typing
+                annotation = cls.__annotations__.get(attr)
+                if annotation is None:
+                    pass
+                elif isinstance(annotation, typing._AnnotatedAlias):  # type: ignore  # noqa
+                    # Save annotations like
+                    #
+                    #   class A(EnumetypedPydantic[Content]):
+                    #       Var: typing.Annotated[type["A[str]"], Rename("Vapppp")]
+                    #
+                    # Annotated aliases are cached by typing and shared by equal declarations
+                    # of other enums, so new alias is set instead of changing `__origin__`
+                    cls.__annotations__[attr] = typing_extensions.Annotated[
+                        (type[cls[content_type]], *annotation.__metadata__)  # type: ignore
+                    ]
+                else:
+                    cls.__annotations__[attr] = type[cls[content_type]]  # type: ignore
+
+            except TypeError:
+                # Fall on below case
+                #
+                # class SimpleEnum(EnumetypedPydantic[Empty]):
+                #     V1: type["SimpleEnum"]
+                #     V2: type["SimpleEnum"]
+                pass
+
+        except NameError:
+            # class A(...)
+            #     Var: type['A[B]']
+            #
+            # class B:
+            #    ...
+            set_root_model(enum_variant, not_eval_ct, cls.__module__, namespace)  # type: ignore
+
+        if enum_variant.__implicit_root_model__:
+            cls.__specialize_variant__(enum_variant)
+
+        return enum_variant
+
+    def __variant_init_body__(cls, variant: type[_Enumetyped[typing.Any]]) -> list[str]:
+        body = super().__variant_init_body__(variant)
+        if variant.__implicit_root_model__:
+            return [
+                "if not isinstance(content, content_type):",
+                "    content = content_type(content)",
+                *body,
+            ]
+        return body
+
 
 class EnumetypedPydantic(Enumetyped[Content], metaclass=EnumetypedPydanticMeta):
     """ Class for created rust-like enums
@@ -292,6 +373,7 @@ class EnumetypedPydantic(Enumetyped[Content], metaclass=EnumetypedPydanticMeta):
 
 
     """
+    __slots__ = ()
     __abstract__: typing_extensions.Never
 
     __names_serialization__: typing.ClassVar[dict[str, str]]
@@ -300,16 +382,15 @@ class EnumetypedPydantic(Enumetyped[Content], metaclass=EnumetypedPydanticMeta):
     __tagging__: typing.ClassVar[Tagging]
     __implicit_root_model__: bool = False
 
-    _type_adapter: typing.Optional[TypeAdapter[typing_extensions.Self]] = None
+    # Namespace of enums created by `create_enum`, which are not bound in module
+    __namespace__: typing.ClassVar[typing.Optional[dict[str, typing.Any]]] = None
+
+    _type_adapter: typing.Optional['TypeAdapter[typing_extensions.Self]'] = None
 
     def __new__(cls, *args, **kwargs):  # type: ignore  # noqa
-        options = None
-        if args:
-            arg = args[0]
-            if not cls.__is_variant__:
-                options = arg
-        else:
-            options = kwargs
+        # Variants have own generated constructors (see `EnumetypedMeta.__specialize_variant__`),
+        # so only enum itself goes here, to restore variant from serialized data
+        options = args[0] if args else kwargs
 
         if options:
             return cls.model_validate(options)
@@ -334,24 +415,16 @@ class EnumetypedPydantic(Enumetyped[Content], metaclass=EnumetypedPydanticMeta):
         pass
 
     def __init__(self, *args, **kwargs):  # type: ignore  # noqa
-        if self._value is not None:
-            # Prevent parse data on second call
-            return
-
-        if args and self.__implicit_root_model__:
-            value = args[0]
-            if not isinstance(value, self.__content_type__):  # type: ignore  # noqa
-                self._value = self.__content_type__(value)  # type: ignore  # noqa
-            else:
-                super().__init__(value)
-        else:
-            super().__init__(*args)
+        # Instance is already initialized by `__new__`
+        pass
 
     @classmethod
     def content_type(cls) -> type:
         # Resolve types when __content_type__ declare after cls declaration
         if isinstance(cls.__content_type__, str):
-            cls.__content_type__ = eval_content_type(cls)
+            with _lazy_lock:
+                if isinstance(cls.__content_type__, str):
+                    cls.__content_type__ = eval_content_type(cls)
         return cls.__content_type__
 
     @classmethod
@@ -363,6 +436,10 @@ class EnumetypedPydantic(Enumetyped[Content], metaclass=EnumetypedPydanticMeta):
         if inspect.isclass(cls.content_type()) and issubclass(cls.content_type(), EnumetypedPydantic):
             value = cls.__python_value_restore__(value, info)
 
+        # Contents are validated first, so they are already interned
+        interner = _active_interner.get()
+        if interner is not None:
+            return interner.intern_value(cls(value))
         return cls(value)
 
     @classmethod
@@ -371,11 +448,13 @@ class EnumetypedPydantic(Enumetyped[Content], metaclass=EnumetypedPydanticMeta):
             source_type: typing.Any,
             handler: pydantic_.GetCoreSchemaHandler,
     ) -> core_schema.CoreSchema:
-        return cls.__tagging__.__get_pydantic_core_schema__(
-            cls,  # type: ignore
-            source_type,
-            handler,
-        )
+        # Taggings keep built schema, so schemas are built by one thread at once
+        with _lazy_lock:
+            return cls.__tagging__.__get_pydantic_core_schema__(
+                cls,  # type: ignore
+                source_type,
+                handler,
+            )
 
     @classmethod
     def __python_value_restore__(
@@ -402,9 +481,13 @@ class EnumetypedPydantic(Enumetyped[Content], metaclass=EnumetypedPydanticMeta):
         )
 
     @classmethod
-    def adapter(cls) -> TypeAdapter[typing_extensions.Self]:
+    def adapter(cls) -> 'TypeAdapter[typing_extensions.Self]':
         if cls._type_adapter is None:
-            cls._type_adapter = TypeAdapter(cls, module=cls.__module__)
+            from pydantic import TypeAdapter
+            with _lazy_lock:
+                # Other thread may build adapter while this one waits for lock
+                if cls._type_adapter is None:
+                    cls._type_adapter = TypeAdapter(cls, module=cls.__module__)
 
         return cls._type_adapter
 
@@ -412,8 +495,8 @@ class EnumetypedPydantic(Enumetyped[Content], metaclass=EnumetypedPydanticMeta):
         self,
         *,
         mode: typing.Literal['json', 'python'] = 'python',
-        include: IncEx | None = None,
-        exclude: IncEx | None = None,
+        include: 'IncEx | None' = None,
+        exclude: 'IncEx | None' = None,
         context: typing.Any | None = None,
         by_alias: bool = False,
         exclude_unset: bool = False,
@@ -442,8 +525,8 @@ class EnumetypedPydantic(Enumetyped[Content], metaclass=EnumetypedPydanticMeta):
         self,
         *,
         indent: int | None = None,
-        include: IncEx | None = None,
-        exclude: IncEx | None = None,
+        include: 'IncEx | None' = None,
+        exclude: 'IncEx | None' = None,
         context: typing.Any | None = None,
         by_alias: bool = False,
         exclude_unset: bool = False,
@@ -473,14 +556,16 @@ class EnumetypedPydantic(Enumetyped[Content], metaclass=EnumetypedPydanticMeta):
         cls,
         *,
         by_alias: bool = True,
-        ref_template: str = DEFAULT_REF_TEMPLATE,
-        schema_generator: type[GenerateJsonSchema] = GenerateJsonSchema,
-        mode: JsonSchemaMode = 'validation',
+        ref_template: typing.Optional[str] = None,
+        schema_generator: typing.Optional[type['GenerateJsonSchema']] = None,
+        mode: 'JsonSchemaMode' = 'validation',
     ) -> dict[str, typing.Any]:
+        from pydantic.json_schema import DEFAULT_REF_TEMPLATE, GenerateJsonSchema
+
         return cls.adapter().json_schema(
             by_alias=by_alias,
-            ref_template=ref_template,
-            schema_generator=schema_generator,
+            ref_template=ref_template if ref_template is not None else DEFAULT_REF_TEMPLATE,
+            schema_generator=schema_generator if schema_generator is not None else GenerateJsonSchema,
             mode=mode,
         )
 
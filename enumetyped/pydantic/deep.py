@@ -0,0 +1,223 @@
+import inspect
+import json
+import re
+import typing
+import weakref
+
+import pydantic
+
+from enumetyped.intern import _active_interner
+from enumetyped.pydantic.core import EnumetypedPydantic
+from enumetyped.pydantic.serialization.adjacent import AdjacentTagging
+from enumetyped.pydantic.serialization.external import ExternalTagging
+
+__all__ = [
+    "dump",
+    "dump_json",
+    "validate",
+    "validate_json",
+]
+
+Enum = typing.TypeVar("Enum", bound=EnumetypedPydantic[typing.Any])
+
+_WHITESPACE = " \t\n\r"
+# Contents of JSON string, escapes are decoded only when present
+_STRING = r'"((?:[^"\\]|\\.)*)"'
+
+
+# Pydantic calls serializers and validators of nested enums recursively, and limits depth of JSON,
+# so values, whose content is enum (`MyEnum.Self(MyEnum.Self(...))`), are peeled in loop here,
+# and only innermost value goes through adapter. Values with enums in lists, dicts etc. are not
+# deeper than pydantic itself allows, contents of internally tagged enums are merged into one dict.
+
+
+def _is_enum(content_type: typing.Any) -> bool:
+    return inspect.isclass(content_type) and issubclass(content_type, EnumetypedPydantic)
+
+
+def _is_chained(kls: type[EnumetypedPydantic[typing.Any]]) -> bool:
+    return isinstance(kls.__tagging__, (ExternalTagging, AdjacentTagging))
+
+
+def _chain(value: EnumetypedPydantic[typing.Any]) -> tuple[list[EnumetypedPydantic[typing.Any]], typing.Any]:
+    # Values with enum contents, outermost first, and innermost value
+    chain = []
+    while isinstance(value._value, EnumetypedPydantic) and _is_chained(value.__class__):
+        chain.append(value)
+        value = value._value
+    return chain, value
+
+
+def _tag(kls: type[EnumetypedPydantic[typing.Any]], attr: str) -> typing.Union[str, int]:
+    # Key of externally tagged variant is string, adjacent tag may be ordinal
+    tag = kls.__tagging__.tag(kls, attr)
+    return tag if isinstance(kls.__tagging__, AdjacentTagging) else str(tag)
+
+
+def dump(value: EnumetypedPydantic[typing.Any], *, mode: typing.Literal["json", "python"] = "python") -> typing.Any:
+    """ `value.model_dump(mode=mode)` without limit of depth """
+    chain, result = _chain(value)
+    result = result.model_dump(mode=mode)
+
+    tags: dict[type, tuple[typing.Any, ...]] = {}
+    for node in reversed(chain):
+        tag = tags.get(node.__class__)
+        if tag is None:
+            tagging = node.__tagging__
+            variant_tag = _tag(node.__class__, node.__variant_name__)
+            if isinstance(tagging, AdjacentTagging):
+                tag = tags[node.__class__] = (tagging.__variant_tag__, variant_tag, tagging.__content_tag__)
+            else:
+                tag = tags[node.__class__] = (variant_tag,)
+
+        if len(tag) == 1:
+            result = {tag[0]: result}
+        else:
+            result = {tag[0]: tag[1], tag[2]: result}
+    return result
+
+
+def _json_prefix(value: EnumetypedPydantic[typing.Any]) -> str:
+    tagging = value.__tagging__
+    tag = json.dumps(_tag(value.__class__, value.__variant_name__), ensure_ascii=False)
+    if isinstance(tagging, AdjacentTagging):
+        variant_tag = json.dumps(tagging.__variant_tag__, ensure_ascii=False)
+        content_tag = json.dumps(tagging.__content_tag__, ensure_ascii=False)
+        return f"{{{variant_tag}:{tag},{content_tag}:"
+    return f"{{{tag}:"
+
+
+def dump_json(value: EnumetypedPydantic[typing.Any]) -> str:
+    """ `value.model_dump_json()` without limit of depth """
+    chain, inner = _chain(value)
+
+    # Chains usually repeat few variants
+    prefixes: dict[type, str] = {}
+    parts = []
+    for node in chain:
+        prefix = prefixes.get(node.__class__)
+        if prefix is None:
+            prefix = prefixes[node.__class__] = _json_prefix(node)
+        parts.append(prefix)
+
+    parts.append(inner.model_dump_json())
+    parts.append("}" * len(chain))
+    return "".join(parts)
+
+
+class _Table(typing.NamedTuple):
+    # Variants with enum contents and their contents by serialized names, pattern of JSON until content
+    variants: dict[typing.Union[str, int], tuple[typing.Any, typing.Any]]
+    prefix: re.Pattern[str]
+
+
+# Tables of enums, dropped with enums
+_tables: weakref.WeakKeyDictionary[type, typing.Optional[_Table]] = weakref.WeakKeyDictionary()
+
+
+def _table(kls: type[EnumetypedPydantic[typing.Any]]) -> typing.Optional[_Table]:
+    try:
+        return _tables[kls]
+    except KeyError:
+        pass
+
+    table = None
+    if _is_chained(kls):
+        variants = {
+            _tag(kls, attr): (variant, variant.content_type())
+            for variant, attr in kls.__variants__.items()
+            if _is_enum(variant.content_type())
+        }
+
+        tagging = kls.__tagging__
+        if isinstance(tagging, AdjacentTagging):
+            # Only `{"type": "Variant", "content": ...}` is peeled, other orders of keys go through adapter
+            variant_tag, content_tag = json.dumps(tagging.__variant_tag__), json.dumps(tagging.__content_tag__)
+            prefix = rf'\s*\{{\s*{re.escape(variant_tag)}\s*:\s*(?:{_STRING}|(\d+))\s*,\s*{re.escape(content_tag)}\s*:'
+        else:
+            prefix = rf'\s*\{{\s*{_STRING}\s*:'
+        table = _Table(variants, re.compile(prefix))
+
+    _tables[kls] = table
+    return table
+
+
+def _construct(variants: list[typing.Any], result: typing.Any) -> typing.Any:
+    interner = _active_interner.get()
+    for variant in reversed(variants):
+        result = variant(result)
+        if interner is not None:
+            result = interner.intern_value(result)
+    return result
+
+
+def validate(kls: type[Enum], obj: typing.Any) -> Enum:
+    """ `kls.model_validate(obj)` without limit of depth """
+    variants = []
+    enum: typing.Any = kls
+    while (table := _table(enum)) is not None and isinstance(obj, dict):
+        tagging = enum.__tagging__
+        if isinstance(tagging, AdjacentTagging):
+            if len(obj) != 2 or tagging.__content_tag__ not in obj:
+                break
+            tag, content = obj.get(tagging.__variant_tag__), obj[tagging.__content_tag__]
+        elif len(obj) == 1:
+            (tag, content), = obj.items()
+        else:
+            break
+
+        # `True` is equal to ordinal 1, but is not a tag
+        found = table.variants.get(tag) if type(tag) is str or type(tag) is int else None
+        if found is None:
+            break
+        variants.append(found[0])
+        enum, obj = found[1], content
+
+    return _construct(variants, enum.model_validate(obj))  # type: ignore
+
+
+def validate_json(kls: type[Enum], data: typing.Union[str, bytes, bytearray]) -> Enum:
+    """ `kls.model_validate_json(data)` without limit of depth """
+    if not isinstance(data, str):
+        data = data.decode()
+
+    variants = []
+    enum: typing.Any = kls
+    pos = 0
+    while (table := _table(enum)) is not None:
+        match = table.prefix.match(data, pos)
+        if match is None:
+            break
+
+        name = match.group(1)
+        tag: typing.Union[str, int]
+        if name is None:
+            tag = int(match.group(2))
+        elif "\\" in name:
+            tag = json.loads(f'"{name}"')
+        else:
+            tag = name
+        found = table.variants.get(tag)
+        if found is None:
+            break
+        variants.append(found[0])
+        enum, pos = found[1], match.end()
+
+    # Each peeled value is closed by brace at the end. Otherwise, or when peeled dicts have other keys
+    # after content, data goes through adapter as is, which reports errors or ignores other keys
+    end = len(data)
+    for _ in variants:
+        end -= 1
+        while end > pos and data[end] in _WHITESPACE:
+            end -= 1
+        if end <= pos or data[end] != "}":
+            return kls.model_validate_json(data)
+
+    try:
+        value = enum.model_validate_json(data[pos:end])
+    except pydantic.ValidationError as e:
+        if not variants or all(error["type"] != "json_invalid" for error in e.errors()):
+            raise
+        return kls.model_validate_json(data)
+
+    return _construct(variants, value)  # type: ignore
@@ -0,0 +1,179 @@
+import threading
+import types
+import typing
+import weakref
+
+from annotated_types import GroupedMetadata
+
+from enumetyped.core import Content, Empty, Ordinal
+from enumetyped.pydantic.core import EnumetypedPydantic, Rename
+from enumetyped.resolver import parse_variant_annotation
+
+__all__ = [
+    "create_enum",
+]
+
+# Enums by their definitions, entries are dropped with enums
+_enums: weakref.WeakValueDictionary[typing.Hashable, type[EnumetypedPydantic[typing.Any]]] = weakref.WeakValueDictionary()
+_enums_lock = threading.Lock()
+
+
+def _metadata(content: typing.Any) -> tuple[typing.Any, list[typing.Any]]:
+    # `Annotated[int, Rename("int")]` to content and flat list of metadata
+    if not isinstance(content, typing._AnnotatedAlias):  # type: ignore  # noqa
+        return content, []
+
+    metadata: list[typing.Any] = []
+    for v in content.__metadata__:
+        if isinstance(v, GroupedMetadata):
+            metadata.extend(v)
+        else:
+            metadata.append(v)
+
+    origin = content.__origin__
+    if isinstance(origin, typing.ForwardRef):
+        origin = origin.__forward_arg__
+    return origin, metadata
+
+
+def _resolver(
+        name: str,
+        attr: str,
+        code: types.CodeType,
+        namespace: dict[str, typing.Any],
+) -> typing.Callable[[typing.Any], typing.Any]:
+    def resolve(enum: typing.Any) -> typing.Any:
+        try:
+            return eval(code, namespace, {name: enum})
+        except NameError as e:
+            # Namespace is complete, so content is not resolved later like forward reference
+            raise ValueError(f"{name}: Content of `{attr}` is not resolved: {e}") from None
+
+    return resolve
+
+
+def _table(
+        name: str,
+        variants: typing.Mapping[str, typing.Any],
+        namespace: dict[str, typing.Any],
+) -> tuple[dict[str, tuple[typing.Any, ...]], dict[str, str]]:
+    # Table of variants like `__precompiled__` of `python -m enumetyped.compile`
+    table: dict[str, tuple[typing.Any, ...]] = {}
+    renames: dict[str, str] = {}
+    ordinals: set[int] = set()
+    ordinal = -1
+
+    for attr, declared in variants.items():
+        content, metadata = _metadata(declared)
+
+        ordinal += 1
+        for __meta__ in metadata:
+            if isinstance(__meta__, Ordinal):
+                ordinal = __meta__.value
+            elif isinstance(__meta__, Rename):
+                if __meta__.value in renames.values():
+                    raise ValueError(f"{name}: Two or many field renamed to `{__meta__.value}`")
+                renames[attr] = __meta__.value
+
+        if ordinal < 0:
+            raise ValueError(f"{name}: Ordinal of `{attr}` must be non-negative")
+        if ordinal in ordinals:
+            raise ValueError(f"{name}: Two or many variants have ordinal `{ordinal}`")
+        ordinals.add(ordinal)
+
+        if content is Empty:
+            table[attr] = (ordinal, None, False, frozenset(), None)
+        elif isinstance(content, str):
+            # Not cached, so names of enums created at runtime don't stay in cache of annotations
+            annotation = parse_variant_annotation.__wrapped__(f"{name}[{content}]")
+            if annotation is None or annotation.content is None or annotation.code is None:
+                raise ValueError(f"{name}: Content of `{attr}` is not an expression: {content!r}")
+
+            resolver = None
+            if not annotation.is_self:
+                resolver = _resolver(name, attr, annotation.code, namespace)
+            table[attr] = (ordinal, annotation.content, annotation.is_self, annotation.names, resolver)
+        else:
+            table[attr] = (
+                ordinal,
+                typing._type_repr(content),  # noqa
+                False,
+                frozenset(),
+                lambda _, content=content: content,
+            )
+
+    return table, renames
+
+
+def create_enum(
+        name: str,
+        variants: typing.Mapping[str, typing.Any],
+        *,
+        variant: typing.Optional[str] = None,
+        content: typing.Optional[str] = None,
+        tag_format: typing.Literal["name", "ordinal"] = "name",
+        namespace: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        module: str = __name__,
+        compact: bool = False,
+        frozen: bool = False,
+        lazy: bool = False,
+        ordered: bool = False,
+) -> type[EnumetypedPydantic[typing.Any]]:
+    """ Create pydantic enum at runtime, e.g. from configuration
+
+    `variants` maps names of variants to contents: `Empty`, type or expression, which is evaluated
+    in `namespace`, where `name` refers to enum itself. `Annotated` contents take `Rename` and `Ordinal`.
+    `variant`, `content`, `tag_format` and other options are keywords of enum class.
+
+        Shape = create_enum("Shape", {"Point": Empty, "Circle": float, "Group": "list[Shape[Any]]"},
+                            variant="type", namespace={"Any": typing.Any})
+
+    Enum is not bound in module: it's freed with its adapter, when it's not used anymore.
+    Enums with equal definitions are created once, while the first one is alive.
+    """
+    namespace = dict(namespace or {})
+    options = dict(
+        variant=variant,
+        content=content,
+        tag_format=tag_format,
+        compact=compact,
+        frozen=frozen,
+        lazy=lazy,
+        ordered=ordered,
+    )
+
+    key: typing.Optional[typing.Hashable] = (
+        name,
+        module,
+        tuple(variants.items()),
+        tuple(sorted(namespace.items())),
+        tuple(options.items()),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        key = None
+
+    with _enums_lock:
+        enum = _enums.get(key) if key is not None else None
+        if enum is not None:
+            return enum
+
+        table, renames = _table(name, variants, namespace)
+
+        def body(class_dict: dict[str, typing.Any]) -> None:
+            class_dict.update(
+                __module__=module,
+                __qualname__=name,
+                __annotations__={},
+                __namespace__=namespace,
+                # Aliases like `Shape[Any]` are cached by `typing.Generic`, which keeps enum alive
+                __class_getitem__=classmethod(types.GenericAlias),
+                __precompiled__=table,
+                __precompiled_renames__=renames,
+            )
+
+        enum = types.new_class(name, (EnumetypedPydantic[Content],), options, body)  # type: ignore
+        if key is not None:
+            _enums[key] = enum
+        return enum
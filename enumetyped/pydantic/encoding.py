@@ -0,0 +1,57 @@
+import typing
+
+from pydantic import TypeAdapter
+
+from enumetyped.core import Empty, EnumetypedMeta, _enum_cached
+
+if typing.TYPE_CHECKING:
+    from enumetyped.pydantic.core import EnumetypedPydantic
+
+__all__ = [
+    "ContentCodec",
+    "content_codec",
+]
+
+
+class ContentCodec:
+    """ Encode contents of enum values to JSON bytes separately from variants
+
+    Variant is stored by its ordinal (tag), content is dumped by pydantic adapter of content type,
+    so batches of values are packed as array of tags and buffer of contents.
+    """
+    __slots__ = ("enum", "_adapters")
+
+    def __init__(self, enum_class: EnumetypedMeta) -> None:
+        self.enum = enum_class
+        # Adapters per ordinal, None for Empty variants and gaps
+        self._adapters: list[typing.Optional[TypeAdapter[typing.Any]]] = [
+            None if variant is None or variant.__content_type__ is Empty else
+            TypeAdapter(variant.content_type(), module=variant.__module__)
+            for variant in enum_class.__variants_by_ordinal__
+        ]
+
+    def encode(self, value: "EnumetypedPydantic[typing.Any]") -> tuple[int, bytes]:
+        if not isinstance(value, self.enum):
+            raise TypeError(f"Expected instance of {self.enum.__name__}, got {type(value).__name__}")
+
+        tag = value.__ordinal__
+        adapter = self._adapters[tag]
+        if adapter is None:
+            return tag, b""
+        return tag, adapter.dump_json(value._value)
+
+    def decode(self, tag: int, data: bytes) -> "EnumetypedPydantic[typing.Any]":
+        variant = self.enum.__variants_by_ordinal__[tag]
+        if variant is None:
+            raise ValueError(f"{self.enum.__name__}: Unknown ordinal `{tag}`")
+
+        adapter = self._adapters[tag]
+        if adapter is None:
+            return variant()  # type: ignore
+        return variant(adapter.validate_json(data))  # type: ignore
+
+
+def content_codec(enum_class: EnumetypedMeta) -> ContentCodec:
+    # Cached in enum like `EnumetypedPydantic.adapter()`
+    enum = enum_class.__enum__
+    return _enum_cached(enum, "content_codec", lambda: ContentCodec(enum))
@@ -1,9 +1,26 @@
-from .external import ExternalTagging
-from .adjacent import AdjacentTagging
-from .internal import InternalTagging
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .external import ExternalTagging
+    from .adjacent import AdjacentTagging
+    from .internal import InternalTagging
 
 __all__ = [
     "ExternalTagging",
     "AdjacentTagging",
     "InternalTagging",
 ]
+
+# Taggings are imported on first access, most of enums use only one of them
+_MODULES = {
+    "ExternalTagging": ".external",
+    "AdjacentTagging": ".adjacent",
+    "InternalTagging": ".internal",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_MODULES[name], __name__), name)
@@ -22,7 +22,8 @@ class AdjacentTagging(Tagging):
     __variant_tag__: str
     __content_tag__: str
 
-    def __init__(self, variant: str, content: str):
+    def __init__(self, variant: str, content: str, ordinal: bool = False):
+        super().__init__(ordinal)
         self.__variant_tag__ = variant
         self.__content_tag__ = content
 
@@ -36,11 +37,13 @@ class AdjacentTagging(Tagging):
 
         schema_ref = f"{kls.__module__}.{kls.__name__}:{id(kls)}"
 
-        json_schemas: dict[str, core_schema.CoreSchema] = {}
+        json_schemas: dict[typing.Union[str, int], core_schema.CoreSchema] = {}
         for attr in kls.__variants__.values():
             enum_variant: type[EnumetypedPydantic[Content]] = getattr(kls, attr)
-            attr = kls.__names_serialization__.get(attr, attr)
-            variant_schema = core_schema.typed_dict_field(core_schema.str_schema(pattern=attr))
+            tag = self.tag(kls, attr)
+            variant_schema = core_schema.typed_dict_field(
+                core_schema.literal_schema([tag]) if isinstance(tag, int) else core_schema.str_schema(pattern=tag)
+            )
             is_enumetyped_variant = (
                     inspect.isclass(enum_variant.__content_type__) and
                     issubclass(enum_variant.__content_type__, EnumetypedPydantic)
@@ -64,7 +67,7 @@ class AdjacentTagging(Tagging):
                 value_schema = core_schema.typed_dict_field(handler.generate_schema(enum_variant.__content_type__))
                 schema[self.__content_tag__] = value_schema
 
-            json_schemas[attr] = core_schema.typed_dict_schema(schema)
+            json_schemas[tag] = core_schema.typed_dict_schema(schema)
 
         tagged_schema = core_schema.tagged_union_schema(
             choices=json_schemas,
@@ -98,8 +101,7 @@ class AdjacentTagging(Tagging):
     ) -> typing.Any:
         type_key = input_value[self.__variant_tag__]
         value = input_value.get(self.__content_tag__, None)
-        attr = kls.__names_deserialization__.get(type_key, type_key)
-        return attr, value
+        return self.attr(kls, type_key), value
 
     def __python_value_restore__(
             self,
@@ -117,12 +119,9 @@ class AdjacentTagging(Tagging):
     ) -> typing.Any:
         from enumetyped.pydantic.core import EnumetypedPydantic
 
-        attr = model.__variant_name__
-        attr = kls.__names_serialization__.get(attr, attr)
-
         value = model._value  # noqa
 
-        result = {self.__variant_tag__: attr}
+        result = {self.__variant_tag__: self.tag(kls, model.__variant_name__)}
         if model.__content_type__ is Empty:
             pass
         elif isinstance(value, EnumetypedPydantic):
@@ -34,11 +34,13 @@ class ExternalTagging(Tagging):
         schema_ref = f"{kls.__module__}.{kls.__name__}:{id(kls)}"
 
         json_schema_attrs = {}
-        schemas = []
+        schemas: list[core_schema.CoreSchema] = []
 
         for attr in kls.__variants__.values():
             enum_variant: type[EnumetypedPydantic[Content]] = getattr(kls, attr)
-            attr = kls.__names_serialization__.get(attr, attr)
+            tag = self.tag(kls, attr)
+            # Keys of JSON objects are strings, ordinal of Empty variant is number
+            attr = str(tag)
 
             is_enumetyped_variant = (
                     inspect.isclass(enum_variant.__content_type__) and
@@ -55,14 +57,17 @@ class ExternalTagging(Tagging):
                 else:
                     item_schema = handler.generate_schema(enum_variant.__content_type__)
             elif enum_variant.__content_type__ is Empty:
-                schemas.append(core_schema.str_schema(pattern=attr))
+                if self.__ordinal_tags__:
+                    schemas.append(core_schema.literal_schema([tag]))
+                else:
+                    schemas.append(core_schema.str_schema(pattern=attr))
                 item_schema = core_schema.none_schema()
             else:
                 item_schema = handler.generate_schema(enum_variant.__content_type__)
 
             json_schema_attrs[attr] = core_schema.typed_dict_field(item_schema, required=False)
 
-        schemas.append(core_schema.typed_dict_schema(json_schema_attrs))  # type: ignore  # noqa
+        schemas.append(core_schema.typed_dict_schema(json_schema_attrs))  # noqa
 
         result = core_schema.definitions_schema(
             schema=core_schema.definition_reference_schema(schema_ref),
@@ -92,12 +97,11 @@ class ExternalTagging(Tagging):
             kls: type["EnumetypedPydantic[Content]"],
             input_value: typing.Any,
     ) -> typing.Any:
-        if isinstance(input_value, str):
+        if isinstance(input_value, (str, int)):
             input_value = {input_value: None}
 
         for attr, value in input_value.items():  # noqa
-            attr = kls.__names_deserialization__.get(attr, attr)
-            return attr, value
+            return self.attr(kls, attr), value
 
     def __pydantic_serialization__(
             self,
@@ -107,16 +111,15 @@ class ExternalTagging(Tagging):
     ) -> typing.Any:
         from enumetyped.pydantic.core import EnumetypedPydantic
 
-        attr = model.__variant_name__
-        attr = model.__names_serialization__.get(attr, attr)
+        tag = self.tag(model, model.__variant_name__)
 
         value = model._value  # noqa
 
         if model.__content_type__ is Empty and not AlwaysSerializeToDict.get():
-            return attr
+            return tag
         elif isinstance(value, EnumetypedPydantic):
             content = model.value.__pydantic_serialization__(value, serializer)
         else:
             content = serializer(value)
 
-        return {attr: content}
+        return {str(tag): content}
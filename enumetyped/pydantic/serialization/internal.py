@@ -21,7 +21,8 @@ __all__ = [
 class InternalTagging(Tagging):
     __variant_tag__: str
 
-    def __init__(self, variant: str):
+    def __init__(self, variant: str, ordinal: bool = False):
+        super().__init__(ordinal)
         self.__variant_tag__ = variant
 
     def __get_pydantic_core_schema__(
@@ -36,10 +37,10 @@ class InternalTagging(Tagging):
 
         schema_ref = f"{kls.__module__}.{kls.__name__}:{id(kls)}"
 
-        json_schemas: dict[str, core_schema.CoreSchema] = {}
+        json_schemas: dict[typing.Union[str, int], core_schema.CoreSchema] = {}
         for attr in kls.__variants__.values():
             enum_variant: type[EnumetypedPydantic[Content]] = getattr(kls, attr)
-            attr = kls.__names_serialization__.get(attr, attr)
+            tag = self.tag(kls, attr)
 
             item_schema: typing.Optional[CoreSchema] = None
             if enum_variant.__content_type__ is Empty:
@@ -58,13 +59,13 @@ class InternalTagging(Tagging):
                 if item_schema is None:
                     item_schema = handler.generate_schema(enum_variant.__content_type__)
 
-            json_schemas[attr] = core_schema.json_or_python_schema(
+            json_schemas[tag] = core_schema.json_or_python_schema(
                 json_schema=core_schema.with_info_after_validator_function(
-                    getattr(kls, attr).__python_value_restore__,
+                    enum_variant.__python_value_restore__,
                     item_schema,
                 ),
                 python_schema=core_schema.with_info_after_validator_function(
-                    getattr(kls, attr).__python_value_restore__,
+                    enum_variant.__python_value_restore__,
                     core_schema.union_schema([item_schema, core_schema.any_schema()])
                 ),
             )
@@ -109,10 +110,9 @@ class InternalTagging(Tagging):
         if isinstance(input_value, str):
             input_value = {input_value: None}
 
-        type_key: str = input_value.pop(self.__variant_tag__) # noqa
-        attr = kls.__names_deserialization__.get(type_key, type_key)
+        type_key: typing.Union[str, int] = input_value.pop(self.__variant_tag__) # noqa
 
-        return attr, input_value
+        return self.attr(kls, type_key), input_value
 
     def __pydantic_serialization__(
             self,
@@ -122,12 +122,9 @@ class InternalTagging(Tagging):
     ) -> typing.Any:
         from enumetyped.pydantic.core import EnumetypedPydantic
 
-        attr = model.__variant_name__
-        attr = kls.__names_serialization__.get(attr, attr)
-
         value = model._value  # noqa
 
-        result = {self.__variant_tag__: attr}
+        result = {self.__variant_tag__: self.tag(kls, model.__variant_name__)}
         if model.__content_type__ is Empty:
             pass
         elif isinstance(value, EnumetypedPydantic):
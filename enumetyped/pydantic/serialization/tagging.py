@@ -15,6 +15,30 @@ __all__ = [
 
 class Tagging(ABC):
     core_schema: CoreSchema
+    # Variants are tagged by ordinals instead of names, see `tag_format` of enum
+    __ordinal_tags__: bool
+
+    def __init__(self, ordinal: bool = False):
+        self.__ordinal_tags__ = ordinal
+
+    def tag(self, kls: type["EnumetypedPydantic[typing.Any]"], attr: str) -> typing.Union[str, int]:
+        """ Serialized tag of variant: its name, rename or ordinal """
+        if self.__ordinal_tags__:
+            return kls.__declared_ordinals__[attr]
+        return kls.__names_serialization__.get(attr, attr)
+
+    def attr(self, kls: type["EnumetypedPydantic[typing.Any]"], tag: typing.Any) -> typing.Any:
+        # Attribute of variant by serialized tag, keys of JSON objects are strings
+        if not self.__ordinal_tags__:
+            return kls.__names_deserialization__.get(tag, tag)
+
+        if type(tag) is str and tag.isdigit():
+            tag = int(tag)
+        variants = kls.__variants_by_ordinal__
+        variant = variants[tag] if type(tag) is int and 0 <= tag < len(variants) else None
+        if variant is None:
+            raise ValueError(f"{kls.__name__}: Unknown ordinal `{tag}`")
+        return variant.__variant_name__
 
     @abstractmethod
     def parse(
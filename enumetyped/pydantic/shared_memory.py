@@ -0,0 +1,155 @@
+import array
+import struct
+import typing
+from multiprocessing.shared_memory import SharedMemory
+
+from enumetyped.pydantic.encoding import ContentCodec, content_codec
+
+if typing.TYPE_CHECKING:
+    from enumetyped.pydantic.core import EnumetypedPydantic
+
+__all__ = [
+    "SharedEnumBatch",
+]
+
+Enum = typing.TypeVar("Enum", bound="EnumetypedPydantic[typing.Any]")
+
+# Magic, size of tag, count of values, size of contents
+_HEADER = struct.Struct("<4sB3xQQ")
+_MAGIC = b"ETSM"
+
+_TAG_FORMATS: dict[int, typing.Literal["B", "H", "I"]] = {1: "B", 2: "H", 4: "I"}
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+class SharedEnumBatch(typing.Sequence[Enum]):
+    """ Batch of enum values, packed into `multiprocessing.shared_memory` block
+
+    Block contains array of variant ordinals (tags), array of offsets of contents and buffer
+    of contents, encoded by pydantic. Values are decoded on access by index. Batch is pickled
+    as name of block, so workers of process pool attach to block instead of unpickling values.
+
+        with SharedEnumBatch.create(MyEnum, values) as batch:
+            pool.map(worker, [(batch, start, start + 1000) for start in range(0, len(batch), 1000)])
+    """
+
+    def __init__(self, enum_class: type[Enum], shm: SharedMemory, owner: bool = False) -> None:
+        self._codec: ContentCodec = content_codec(enum_class)
+        self._shm = shm
+        self._owner = owner
+
+        buf: memoryview = shm.buf  # type: ignore
+        magic, tag_size, count, size = _HEADER.unpack_from(buf)
+        if magic != _MAGIC:
+            raise ValueError(f"Shared memory `{shm.name}` doesn't contain batch of enum values")
+
+        tags_start = _HEADER.size
+        offsets_start = _align(tags_start + tag_size * count)
+        contents_start = offsets_start + 8 * (count + 1)
+
+        self._count: int = count
+        self._tags = buf[tags_start:tags_start + tag_size * count].cast(_TAG_FORMATS[tag_size])
+        self._offsets = buf[offsets_start:contents_start].cast("Q")
+        self._contents = buf[contents_start:contents_start + size]
+
+    @classmethod
+    def create(cls, enum_class: type[Enum], values: typing.Iterable[Enum]) -> 'SharedEnumBatch[Enum]':
+        """ Encode values and copy them into new shared memory block, owned by this batch """
+        codec: ContentCodec = content_codec(enum_class)
+        tags: list[int] = []
+        contents: list[bytes] = []
+        for value in values:
+            tag, content = codec.encode(value)
+            tags.append(tag)
+            contents.append(content)
+
+        tag_size = codec.enum.__tag_size__()
+
+        offsets = [0]
+        for content in contents:
+            offsets.append(offsets[-1] + len(content))
+
+        count = len(tags)
+        offsets_start = _align(_HEADER.size + tag_size * count)
+        contents_start = offsets_start + 8 * (count + 1)
+
+        shm = SharedMemory(create=True, size=contents_start + offsets[-1])
+        buf: memoryview = shm.buf  # type: ignore
+        try:
+            _HEADER.pack_into(buf, 0, _MAGIC, tag_size, count, offsets[-1])
+            buf[_HEADER.size:_HEADER.size + tag_size * count] = array.array(_TAG_FORMATS[tag_size], tags).tobytes()
+            buf[offsets_start:contents_start] = array.array("Q", offsets).tobytes()
+            buf[contents_start:contents_start + offsets[-1]] = b"".join(contents)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        return cls(enum_class, shm, owner=True)
+
+    @classmethod
+    def attach(cls, enum_class: type[Enum], name: str) -> 'SharedEnumBatch[Enum]':
+        """ Attach to block, created by `SharedEnumBatch.create` in another process """
+        return cls(enum_class, SharedMemory(name=name))
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return self.attach, (self._codec.enum, self._shm.name)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @typing.overload
+    def __getitem__(self, index: int) -> Enum:
+        pass
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> list[Enum]:
+        pass
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[Enum, list[Enum]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("SharedEnumBatch index out of range")
+
+        content = self._contents[self._offsets[index]:self._offsets[index + 1]].tobytes()
+        return self._codec.decode(self._tags[index], content)  # type: ignore
+
+    def __iter__(self) -> typing.Iterator[Enum]:
+        for index in range(self._count):
+            yield self[index]
+
+    def _release(self) -> None:
+        # Views must be released before mmap of block is closed, they are not set when block is invalid
+        for attr in ("_tags", "_offsets", "_contents"):
+            view = getattr(self, attr, None)
+            if view is not None:
+                view.release()
+
+    def close(self) -> None:
+        """ Release block in this process, block is removed when closed by owner """
+        self._release()
+        self._shm.close()
+        if self._owner:
+            self._owner = False
+            self._shm.unlink()
+
+    def __del__(self) -> None:
+        self._release()
+
+    def __enter__(self) -> 'SharedEnumBatch[Enum]':
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
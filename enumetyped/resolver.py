@@ -0,0 +1,116 @@
+import ast
+import functools
+import sys
+import types
+import typing
+import weakref
+from dataclasses import dataclass
+
+__all__ = [
+    "VariantAnnotation",
+    "parse_variant_annotation",
+    "resolve",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class VariantAnnotation:
+    # Name of enum, which variant refers to: "MyEnum" in "MyEnum[int]"
+    enum_name: str
+
+    # Source of content expression: "int" in "MyEnum[int]", None for "MyEnum" (Empty content)
+    content: typing.Optional[str]
+
+    # Content is an enum itself, like "MyEnum[MyEnum[Any]]"
+    is_self: bool
+
+    # Names used in content expression
+    names: frozenset[str]
+
+    code: typing.Optional[types.CodeType]
+
+    # Content expression as function of enum, emitted by `python -m enumetyped.compile`
+    resolver: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None
+
+
+@functools.lru_cache(maxsize=None)
+def parse_variant_annotation(annotation: str) -> typing.Optional[VariantAnnotation]:
+    # Parse variant annotation like "MyEnum[list[int]]" once,
+    # returns None when annotation is not a variant
+    try:
+        node = ast.parse(annotation.strip(), mode="eval").body
+    except SyntaxError:
+        return None
+
+    if isinstance(node, ast.Name):
+        return VariantAnnotation(enum_name=node.id, content=None, is_self=False, names=frozenset(), code=None)
+
+    if not isinstance(node, ast.Subscript) or not isinstance(node.value, ast.Name):
+        return None
+
+    enum_name = node.value.id
+    content = node.slice
+    source = ast.get_source_segment(annotation.strip(), content)
+    if source is None:
+        source = ast.unparse(content)
+
+    is_self = (
+            isinstance(content, ast.Name) and content.id == enum_name or
+            isinstance(content, ast.Subscript) and isinstance(content.value, ast.Name) and content.value.id == enum_name
+    )
+
+    return VariantAnnotation(
+        enum_name=enum_name,
+        content=source,
+        is_self=is_self,
+        names=frozenset(n.id for n in ast.walk(content) if isinstance(n, ast.Name)),
+        code=compile(ast.Expression(body=content), f"<{enum_name} variant>", "eval"),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(content: str) -> types.CodeType:
+    # Precompiled annotations have no code, it's compiled on first resolve
+    return compile(content, "<variant content>", "eval")
+
+
+# Resolved content types, cached per module with objects of names, which they were resolved from,
+# so names rebound later (or by `importlib.reload`) are resolved again; entries are dropped with module
+_resolved: weakref.WeakKeyDictionary[
+    types.ModuleType,
+    dict[str, tuple[typing.Any, dict[str, typing.Any]]],
+] = weakref.WeakKeyDictionary()
+
+_MISSING = object()
+
+
+def resolve(
+        annotation: VariantAnnotation,
+        module_name: str,
+        namespace: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+) -> typing.Any:
+    """ Evaluate content of variant annotation in namespace of module, where enum is defined
+
+    `namespace` overrides module globals (e.g. enum, which is not bound in module while it's created),
+    results evaluated with it are not cached. Raises NameError when some names are not defined yet.
+    """
+    assert annotation.content is not None
+
+    module = sys.modules.get(module_name)
+    globals_ = module.__dict__ if module is not None else {}
+
+    cache = None
+    if module is not None and not (namespace and annotation.names.intersection(namespace)):
+        cache = _resolved.setdefault(module, {})
+        cached = cache.get(annotation.content)
+        if cached is not None:
+            result, referenced = cached
+            if all(globals_.get(name, _MISSING) is value for name, value in referenced.items()):
+                return result
+
+    code = annotation.code if annotation.code is not None else _compile(annotation.content)
+    result = eval(code, globals_, dict(namespace or {}))
+
+    if cache is not None:
+        cache[annotation.content] = (result, {name: globals_.get(name, _MISSING) for name in annotation.names})
+    return result
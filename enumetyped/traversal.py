@@ -0,0 +1,142 @@
+import typing
+
+from enumetyped.core import _IMMUTABLE, _Enumetyped
+
+__all__ = [
+    "children",
+    "preorder",
+    "postorder",
+    "fold",
+    "transform",
+]
+
+Node = typing.TypeVar("Node", bound=_Enumetyped[typing.Any])
+Result = typing.TypeVar("Result")
+
+
+def _is_root_model(content: typing.Any) -> bool:
+    # Pydantic `RootModel`, e.g. created for generic contents by `set_root_model`
+    return getattr(type(content), "__pydantic_root_model__", False) is True
+
+
+def _collect(content: typing.Any, result: list[_Enumetyped[typing.Any]]) -> None:
+    # Containers are nested as deep as content type is declared, so recursion is bounded here,
+    # unlike nesting of enums, which is walked by explicit stacks below
+    if isinstance(content, (list, tuple)):
+        items: typing.Iterable[typing.Any] = content
+    elif isinstance(content, dict):
+        items = content.values()
+    elif _is_root_model(content):
+        items = (content.root,)
+    else:
+        return
+
+    for item in items:
+        if isinstance(item, _Enumetyped):
+            result.append(item)
+        elif type(item) not in _IMMUTABLE:
+            _collect(item, result)
+
+
+def _children(node: _Enumetyped[typing.Any]) -> typing.Sequence[_Enumetyped[typing.Any]]:
+    # Empty variants have `_value` None, nested enums are the most common content after scalars
+    value = node._value
+    if type(value) in _IMMUTABLE:
+        return ()
+    if isinstance(value, _Enumetyped):
+        return (value,)
+
+    result: list[_Enumetyped[typing.Any]] = []
+    _collect(value, result)
+    return result
+
+
+def _replace(content: typing.Any, replacements: typing.Iterator[_Enumetyped[typing.Any]]) -> typing.Any:
+    # Content with enums replaced in the order they were collected
+    if isinstance(content, _Enumetyped):
+        return next(replacements)
+    elif isinstance(content, list):
+        return [_replace(item, replacements) for item in content]
+    elif isinstance(content, tuple):
+        items = [_replace(item, replacements) for item in content]
+        if hasattr(content, "_fields"):
+            return content._make(items)  # type: ignore
+        return type(content)(items)
+    elif isinstance(content, dict):
+        pairs = [(key, _replace(item, replacements)) for key, item in content.items()]
+        return dict(pairs) if type(content) is dict else type(content)(pairs)
+    elif _is_root_model(content):
+        # Already validated, so root model is not validated again
+        return type(content).model_construct(_replace(content.root, replacements))
+    return content
+
+
+def children(node: _Enumetyped[typing.Any]) -> list[_Enumetyped[typing.Any]]:
+    """ Enums in content of value: nested enum, items of lists, tuples and dicts, root of `RootModel` """
+    return list(_children(node))
+
+
+def _mirrored(root: _Enumetyped[typing.Any]) -> list[tuple[_Enumetyped[typing.Any], typing.Sequence[typing.Any]]]:
+    # Preorder with children in reverse order, reversed it's postorder in declared order
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        nodes = _children(node)
+        order.append((node, nodes))
+        stack.extend(nodes)
+    return order
+
+
+def preorder(root: Node) -> typing.Iterator[_Enumetyped[typing.Any]]:
+    """ Values of tree, each before values in its content """
+    stack: list[_Enumetyped[typing.Any]] = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(_children(node)))
+
+
+def postorder(root: Node) -> typing.Iterator[_Enumetyped[typing.Any]]:
+    """ Values of tree, each after values in its content; tree is walked before first value """
+    for node, _ in reversed(_mirrored(root)):
+        yield node
+
+
+def fold(root: Node, fn: typing.Callable[[typing.Any, list[Result]], Result]) -> Result:
+    """ Reduce tree bottom-up: `fn` takes value and results for values in its content
+
+        depth = fold(tree, lambda node, depths: 1 + max(depths, default=0))
+    """
+    results: list[Result] = []
+    for node, nodes in reversed(_mirrored(root)):
+        if nodes:
+            # Results for content are the last ones, in declared order
+            start = len(results) - len(nodes)
+            result = fn(node, results[start:])
+            del results[start:]
+        else:
+            result = fn(node, [])
+        results.append(result)
+
+    return results[0]
+
+
+def transform(root: Node, fn: typing.Callable[[typing.Any], typing.Any]) -> Node:
+    """ Rebuild tree bottom-up: `fn` takes value with already transformed content and returns new value
+
+    Values, whose contents are not changed, are passed to `fn` as is, so unchanged subtrees are not copied.
+
+        simplified = transform(expr, lambda node: node.value if isinstance(node, Expr.Paren) else node)
+    """
+    results: list[typing.Any] = []
+    for node, nodes in reversed(_mirrored(root)):
+        if nodes:
+            start = len(results) - len(nodes)
+            if any(old is not new for old, new in zip(nodes, results[start:])):
+                node = type(node)(_replace(node._value, iter(results[start:])))
+            del results[start:]
+        results.append(fn(node))
+
+    result: Node = results[0]
+    return result
@@ -0,0 +1,87 @@
+from typing import Any
+
+import pytest
+from typing_extensions import Annotated
+
+from enumetyped import Enumetyped, Empty, Content, EnumArray, Ordinal
+from enumetyped.pydantic import EnumetypedPydantic
+
+
+class Event(Enumetyped[Content]):
+    Start: type["Event[Empty]"]
+    Click: type["Event[tuple[int, int]]"]
+    Key: Annotated[type["Event[str]"], Ordinal(5)]
+
+
+class PydanticEvent(EnumetypedPydantic[Content]):
+    Start: type["PydanticEvent[Empty]"]
+    Keys: type["PydanticEvent[list[str]]"]
+
+
+VALUES: list[Event[Any]] = [
+    Event.Start(),
+    Event.Click((1, 2)),
+    Event.Key("a"),
+    Event.Click((3, 4)),
+    Event.Start(),
+    Event.Key("b"),
+]
+
+
+def test_append_and_iterate() -> None:
+    values = EnumArray(Event)
+    for value in VALUES:
+        values.append(value)
+
+    assert len(values) == len(VALUES)
+    assert list(values) == VALUES
+    assert [values[i] for i in range(len(values))] == VALUES
+    assert values[-1] == Event.Key("b")
+    assert values[0] is Event.Start()
+
+
+def test_slice() -> None:
+    values = EnumArray(Event, VALUES)
+    assert list(values[1:4]) == VALUES[1:4]
+    assert list(values[::-2]) == VALUES[::-2]
+
+    part = values[:2]
+    part.append(Event.Key("c"))
+    values.append(Event.Click((5, 6)))
+    assert list(part) == [*VALUES[:2], Event.Key("c")]
+    assert list(values) == [*VALUES, Event.Click((5, 6))]
+
+
+def test_counts() -> None:
+    values = EnumArray(Event, VALUES)
+    assert values.counts() == {Event.Start: 2, Event.Click: 2, Event.Key: 2}
+    assert values.count(Event.Click) == 2
+    assert EnumArray(Event, [Event.Key("a")]).counts() == {Event.Key: 1}
+
+
+def test_filter_and_group() -> None:
+    values = EnumArray(Event, VALUES)
+    assert list(values.filter(Event.Click)) == [Event.Click((1, 2)), Event.Click((3, 4))]
+    assert list(values.filter(Event.Start)) == [Event.Start(), Event.Start()]
+    assert values.contents(Event.Key) == ["a", "b"]
+    assert values.contents(Event.Start) == [None, None]
+
+    groups = values.group()
+    assert list(groups) == [Event.Start, Event.Click, Event.Key]
+    assert list(groups[Event.Key]) == [Event.Key("a"), Event.Key("b")]
+
+
+def test_wrong_values() -> None:
+    values = EnumArray(Event)
+    with pytest.raises(TypeError):
+        values.append(PydanticEvent.Start())  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError):
+        values.filter(PydanticEvent.Start)  # type: ignore[arg-type]
+
+
+def test_pydantic() -> None:
+    source: list[PydanticEvent[Any]] = [PydanticEvent.Keys(["a"]), PydanticEvent.Start(), PydanticEvent.Keys(["b"])]
+    values = EnumArray(PydanticEvent, source)
+    assert list(values) == source
+    assert values[2].model_dump_json() == '{"Keys":["b"]}'
@@ -0,0 +1,135 @@
+import dataclasses
+import io
+from typing import Any, Optional, Union
+
+import pydantic
+import pytest
+from typing_extensions import Annotated
+
+from enumetyped import Content, Empty, Ordinal
+from enumetyped.pydantic import EnumetypedPydantic, Rename, create_enum
+from enumetyped.pydantic.binary import BinaryCodec, binary_codec
+
+
+class Point(pydantic.BaseModel):
+    x: int
+    y: int
+
+
+@dataclasses.dataclass
+class Label:
+    text: str
+    size: Optional[float] = None
+
+
+class Packet(EnumetypedPydantic[Content], variant="type", content="value"):
+    Nil: type["Packet[Empty]"]
+    Int: type["Packet[int]"]
+    Float: type["Packet[float]"]
+    Str: Annotated[type["Packet[str]"], Rename("string")]
+    Flag: type["Packet[bool]"]
+    Raw: type["Packet[bytes]"]
+    Items: type["Packet[list[Packet[Any]]]"]
+    Pair: type["Packet[tuple[int, str]]"]
+    Tags: type["Packet[frozenset[str]]"]
+    Map: type["Packet[dict[int, float]]"]
+    Maybe: type["Packet[Optional[str]]"]
+    Either: type["Packet[Union[bool, int, str]]"]
+    Model: type["Packet[Point]"]
+    Data: type["Packet[Label]"]
+    Loose: type["Packet[Any]"]
+    Nested: type["Packet[Packet[Any]]"]
+    Far: Annotated[type["Packet[int]"], Ordinal(300)]
+
+
+VALUES: list[Packet[Any]] = [
+    Packet.Nil(),
+    Packet.Int(0),
+    Packet.Int(-1),
+    Packet.Int(2 ** 70),
+    Packet.Float(-1.5e-300),
+    Packet.Str("héllo\x00"),
+    Packet.Flag(False),
+    Packet.Raw(b"\x00\x01"),
+    Packet.Items([Packet.Nil(), Packet.Int(1), Packet.Items([])]),
+    Packet.Pair((1, "a")),
+    Packet.Tags(frozenset({"a", "b"})),
+    Packet.Map({1: 2.0, -3: 0.5}),
+    Packet.Maybe(None),
+    Packet.Maybe("x"),
+    Packet.Either(True),
+    Packet.Either(1),
+    Packet.Either("1"),
+    Packet.Model(Point(x=1, y=2)),
+    Packet.Data(Label("a", 1.0)),
+    Packet.Loose({"a": [1, 2.5, None, True, "s"], "b": {"c": b"d"}}),
+    Packet.Nested(Packet.Nested(Packet.Str("s"))),
+    Packet.Far(7),
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_round_trip(value: Packet[Any]) -> None:
+    codec = binary_codec(Packet)
+    data = codec.dumps(value)
+    assert codec.loads(data) == value
+    assert len(data) < len(value.model_dump_json())
+
+
+def test_layout() -> None:
+    codec = binary_codec(Packet)
+    assert codec.dumps(Packet.Nil()) == b"\x00"
+    assert codec.dumps(Packet.Int(-2)) == b"\x01\x03"
+    assert codec.dumps(Packet.Str("ab")) == b"\x03\x02ab"
+    assert codec.dumps(Packet.Far(1)) == b"\xac\x02\x02"
+    assert codec.dumps(Packet.Either("a")) == b"\x0b\x02\x01a"
+    assert codec.dumps(Packet.Model(Point(x=1, y=2))) == b"\x0c\x0d" + b'{"x":1,"y":2}'
+
+
+def test_any_as_json_data() -> None:
+    # Like pydantic, other values in `Any` contents are loaded as their JSON data
+    codec = binary_codec(Packet)
+    assert codec.loads(codec.dumps(Packet.Loose((1, Point(x=1, y=2))))) == Packet.Loose([1, {"x": 1, "y": 2}])
+
+
+def test_streams() -> None:
+    codec = binary_codec(Packet)
+    fp = io.BytesIO()
+    codec.dump_all(VALUES * 1000, fp)
+    fp.seek(0)
+    assert list(codec.load_all(fp)) == VALUES * 1000
+
+    fp = io.BytesIO()
+    codec.dump(Packet.Int(1), fp)
+    codec.dump(Packet.Str("a"), fp)
+    fp.seek(0)
+    assert codec.load(fp) == Packet.Int(1)
+    assert fp.tell() == 2
+    assert codec.load(fp) == Packet.Str("a")
+
+
+def test_dynamic() -> None:
+    Dyn = create_enum("Dyn", {"Nil": Empty, "Items": "list[Dyn[Any]]"}, namespace={"Any": Any})
+    value = Dyn.Items([Dyn.Nil(), Dyn.Items([])])
+    assert binary_codec(Dyn).loads(binary_codec(Dyn).dumps(value)) == value
+
+
+def test_cached() -> None:
+    assert binary_codec(Packet) is binary_codec(Packet.Int)
+    assert BinaryCodec(Packet) is not binary_codec(Packet)
+
+
+def test_errors() -> None:
+    codec = binary_codec(Packet)
+    with pytest.raises(TypeError):
+        codec.dumps(1)  # type: ignore
+    with pytest.raises(TypeError):
+        codec.dump_all([Packet.Nil(), 1], io.BytesIO())  # type: ignore
+    with pytest.raises(ValueError, match="Unknown ordinal `20`"):
+        codec.loads(b"\x14")
+    with pytest.raises(ValueError, match="Unexpected end"):
+        codec.loads(b"\x03\x05ab")
+    with pytest.raises(ValueError, match="1 bytes left"):
+        codec.loads(b"\x00\x00")
+    with pytest.raises(ValueError, match="Unexpected end"):
+        list(codec.load_all(io.BytesIO(b"\x00\x03")))
@@ -0,0 +1,157 @@
+import dataclasses
+from typing import Any, Optional, Union
+
+import pytest
+
+from enumetyped import Content, Empty, Enumetyped
+from enumetyped.codec import JsonCodec, json_codec
+from enumetyped.pydantic import EnumetypedPydantic
+
+
+@dataclasses.dataclass
+class Payload:
+    a: int
+    b: Optional[str] = None
+    c: list[float] = dataclasses.field(default_factory=list)
+
+
+class Shape(Enumetyped[Content]):
+    Nil: type["Shape[Empty]"]
+    Int: type["Shape[int]"]
+    Float: type["Shape[float]"]
+    Str: type["Shape[str]"]
+    Flag: type["Shape[bool]"]
+    Items: type["Shape[list[Shape[Any]]]"]
+    Pair: type["Shape[tuple[int, str]]"]
+    Map: type["Shape[dict[int, float]]"]
+    Maybe: type["Shape[Optional[str]]"]
+    Either: type["Shape[Union[int, str]]"]
+    Load: type["Shape[Payload]"]
+    Nested: type["Shape[Shape[Any]]"]
+
+
+class ShapeExternal(EnumetypedPydantic[Content]):
+    Nil: type["ShapeExternal[Empty]"]
+    Int: type["ShapeExternal[int]"]
+    Float: type["ShapeExternal[float]"]
+    Str: type["ShapeExternal[str]"]
+    Flag: type["ShapeExternal[bool]"]
+    Items: type["ShapeExternal[list[ShapeExternal[Any]]]"]
+    Pair: type["ShapeExternal[tuple[int, str]]"]
+    Map: type["ShapeExternal[dict[int, float]]"]
+    Maybe: type["ShapeExternal[Optional[str]]"]
+    Either: type["ShapeExternal[Union[int, str]]"]
+    Load: type["ShapeExternal[Payload]"]
+    Nested: type["ShapeExternal[ShapeExternal[Any]]"]
+
+
+class ShapeAdjacent(EnumetypedPydantic[Content], variant="type", content="value"):
+    Nil: type["ShapeAdjacent[Empty]"]
+    Int: type["ShapeAdjacent[int]"]
+    Float: type["ShapeAdjacent[float]"]
+    Str: type["ShapeAdjacent[str]"]
+    Flag: type["ShapeAdjacent[bool]"]
+    Items: type["ShapeAdjacent[list[ShapeAdjacent[Any]]]"]
+    Pair: type["ShapeAdjacent[tuple[int, str]]"]
+    Map: type["ShapeAdjacent[dict[int, float]]"]
+    Maybe: type["ShapeAdjacent[Optional[str]]"]
+    Either: type["ShapeAdjacent[Union[int, str]]"]
+    Load: type["ShapeAdjacent[Payload]"]
+    Nested: type["ShapeAdjacent[ShapeAdjacent[Any]]"]
+
+
+class Record(Enumetyped[Content]):
+    Nil: type["Record[Empty]"]
+    Load: type["Record[Payload]"]
+    Map: type["Record[dict[str, int]]"]
+    Nested: type["Record[Record[Any]]"]
+
+
+class RecordInternal(EnumetypedPydantic[Content], variant="type"):
+    Nil: type["RecordInternal[Empty]"]
+    Load: type["RecordInternal[Payload]"]
+    Map: type["RecordInternal[dict[str, int]]"]
+    Nested: type["RecordInternal[RecordInternal[Any]]"]
+
+
+def shapes(E: Any) -> list[Any]:
+    return [
+        E.Nil(),
+        E.Int(-12),
+        E.Float(1.5),
+        E.Str('q"\\/\né\x01\U0001F600'),
+        E.Flag(True),
+        E.Items([E.Nil(), E.Int(1), E.Items([])]),
+        E.Pair((1, "a")),
+        E.Map({1: 2.0, 3: 1e-7}),
+        E.Maybe(None),
+        E.Maybe("x"),
+        E.Either(1),
+        E.Either("1"),
+        E.Load(Payload(1, c=[0.5])),
+        E.Nested(E.Nested(E.Nil())),
+    ]
+
+
+def records(E: Any) -> list[Any]:
+    return [
+        E.Nil(),
+        E.Load(Payload(1, "b")),
+        E.Map({"x": 1}),
+        E.Map({}),
+        E.Nested(E.Load(Payload(2))),
+    ]
+
+
+@pytest.mark.parametrize("core, enum, pydantic_enum, options", [
+    (shapes, Shape, ShapeExternal, {}),
+    (shapes, Shape, ShapeAdjacent, {"variant": "type", "content": "value"}),
+    (records, Record, RecordInternal, {"variant": "type"}),
+])
+def test_same_as_pydantic(core: Any, enum: Any, pydantic_enum: Any, options: dict[str, str]) -> None:
+    codec = json_codec(enum, **options)
+    for value, pydantic_value in zip(core(enum), core(pydantic_enum)):
+        assert codec.dumps(value) == pydantic_value.model_dump_json()
+
+        if not isinstance(value, Record.Nested):
+            # Internal tagging overwrites variant of enum by variant of its content
+            assert codec.loads(codec.dumps(value)) == value
+        assert codec.loads(pydantic_value.model_dump_json().encode()) == codec.loads(codec.dumps(value))
+
+
+@pytest.mark.parametrize("number", [
+    0.0, -0.0, 0.1, 1e15, 1e16, 1.2345678901234568e17, 1e-4, 1e-5, -1.5e-5, 9.9e-6, 1e-7, 5e-324,
+    1.7976931348623157e308, float("inf"), float("nan"),
+])
+def test_floats(number: float) -> None:
+    assert json_codec(Shape).dumps(Shape.Float(number)) == ShapeExternal.Float(number).model_dump_json()
+
+
+def test_cached() -> None:
+    assert json_codec(Shape) is json_codec(Shape.Int)
+    assert json_codec(Shape) is not json_codec(Shape, variant="type", content="value")
+
+
+def test_errors() -> None:
+    codec = json_codec(Shape)
+    with pytest.raises(TypeError):
+        codec.dumps(Record.Nil())  # type: ignore
+    with pytest.raises(ValueError, match="Unknown variant `Other`"):
+        codec.loads('{"Other": 1}')
+    with pytest.raises(ValueError, match="Expected int"):
+        codec.loads('{"Int": "1"}')
+    with pytest.raises(ValueError, match="Expected int"):
+        codec.loads('{"Int": true}')
+    with pytest.raises(ValueError, match="matches no member"):
+        codec.loads('{"Either": 1.5}')
+
+    with pytest.raises(TypeError, match="must be dataclass, dict or enum"):
+        JsonCodec(Shape, variant="type")
+    with pytest.raises(ValueError):
+        JsonCodec(Shape, content="value")
+
+    class Unsupported(Enumetyped[Content]):
+        Bytes: type["Unsupported[bytes]"]
+
+    with pytest.raises(TypeError, match="not supported"):
+        JsonCodec(Unsupported)
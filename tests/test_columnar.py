@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+from enumetyped import Content, Empty
+from enumetyped.pydantic import EnumetypedPydantic, FieldMetadata
+from enumetyped.pydantic.columnar import EnumFileReader, EnumFileWriter
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class User(BaseModel):
+    name: str
+
+
+class Event(EnumetypedPydantic[Content]):
+    Start: type["Event[Empty]"]
+    Click: type["Event[Point]"]
+    Login: type["Event[User]"]
+    Keys: Annotated[type["Event[list[str]]"], FieldMetadata(rename="keys")]
+    Nested: type["Event[Event[Any]]"]
+
+
+class ReorderedEvent(EnumetypedPydantic[Content]):
+    Nested: type["ReorderedEvent[ReorderedEvent[Any]]"]
+    Keys: type["ReorderedEvent[list[str]]"]
+    Login: type["ReorderedEvent[User]"]
+    Click: type["ReorderedEvent[Point]"]
+    Start: type["ReorderedEvent[Empty]"]
+    New: type["ReorderedEvent[int]"]
+
+
+class OtherEvent(EnumetypedPydantic[Content]):
+    Start: type["OtherEvent[Empty]"]
+
+
+VALUES: list[Event[Any]] = [
+    Event.Start(),
+    Event.Click(Point(1, 2)),
+    Event.Login(User(name="user")),
+    Event.Keys(["a", "b"]),
+    Event.Nested(Event.Click(Point(3, 4))),
+    Event.Click(Point(5, 6)),
+]
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "events.etc"
+    with EnumFileWriter(path, Event, batch_size=4) as writer:
+        for value in VALUES:
+            writer.write(value)
+
+    with EnumFileReader(path, Event) as reader:
+        assert len(reader) == len(VALUES)
+        assert list(reader) == VALUES
+        assert [reader[i] for i in range(len(VALUES))] == VALUES
+        assert reader[-1] == Event.Click(Point(5, 6))
+        assert reader[0] is Event.Start()
+        assert reader[3:5] == VALUES[3:5]
+
+        with pytest.raises(IndexError):
+            reader[len(VALUES)]
+
+
+def test_append_batches(tmp_path: Path) -> None:
+    path = tmp_path / "events.etc"
+    with EnumFileWriter(path, Event) as writer:
+        writer.write_batch(VALUES[:2])
+        writer.write_batch([])
+
+    with EnumFileWriter(path, Event) as writer:
+        writer.write_batch(VALUES[2:])
+
+    with EnumFileReader(path, Event) as reader:
+        assert list(reader) == VALUES
+        assert len(reader._chunks) == 2
+
+
+def test_counts_and_filter(tmp_path: Path) -> None:
+    path = tmp_path / "events.etc"
+    with EnumFileWriter(path, Event, batch_size=2) as writer:
+        writer.write_batch(VALUES)
+
+    with EnumFileReader(path, Event) as reader:
+        assert reader.counts() == {
+            Event.Start: 1,
+            Event.Click: 2,
+            Event.Login: 1,
+            Event.Keys: 1,
+            Event.Nested: 1,
+        }
+        assert reader.count(Event.Click) == 2
+        assert list(reader.indices(Event.Click)) == [1, 5]
+        assert list(reader.filter(Event.Click)) == [Event.Click(Point(1, 2)), Event.Click(Point(5, 6))]
+
+        with pytest.raises(ValueError):
+            reader.indices(OtherEvent.Start)  # type: ignore[arg-type]
+
+
+def test_variants_by_name(tmp_path: Path) -> None:
+    path = tmp_path / "events.etc"
+    with EnumFileWriter(path, Event) as writer:
+        writer.write_batch([Event.Start(), Event.Keys(["a"]), Event.Nested(Event.Start())])
+
+    with EnumFileReader(path, ReorderedEvent) as reader:
+        assert list(reader) == [
+            ReorderedEvent.Start(),
+            ReorderedEvent.Keys(["a"]),
+            ReorderedEvent.Nested(ReorderedEvent.Start()),
+        ]
+        assert reader.count(ReorderedEvent.Keys) == 1
+        assert reader.count(ReorderedEvent.New) == 0
+        assert list(reader.indices(ReorderedEvent.New)) == []
+
+    with pytest.raises(ValueError):
+        EnumFileReader(path, OtherEvent)
+
+    with pytest.raises(ValueError):
+        EnumFileWriter(path, OtherEvent)
+
+
+def test_not_columnar_file(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"Start":null}\n')
+    with pytest.raises(ValueError):
+        EnumFileReader(path, Event)
+
+
+def test_truncated(tmp_path: Path) -> None:
+    path = tmp_path / "events.etc"
+    with EnumFileWriter(path, Event, batch_size=4) as writer:
+        for value in VALUES:
+            writer.write(value)
+
+    # Like writer crashed during flush of the last chunk, in its header or in its data
+    data = path.read_bytes()
+    for cut in (1, 10, 40):
+        path.write_bytes(data[:-cut])
+        with pytest.raises(ValueError, match="Broken chunk"):
+            EnumFileReader(path, Event)
+        with pytest.raises(ValueError, match="Broken chunk"):
+            EnumFileWriter(path, Event)
+
+    path.write_bytes(b"")
+    with pytest.raises(ValueError, match="not columnar file"):
+        EnumFileReader(path, Event)
@@ -0,0 +1,85 @@
+import tracemalloc
+from typing import Any
+
+from enumetyped import Enumetyped, Empty, Content
+from enumetyped.pydantic import EnumetypedPydantic
+
+
+class DictEnum(Enumetyped[Content]):
+    Empty: type["DictEnum[Empty]"]
+    Int: type["DictEnum[int]"]
+
+
+class CompactEnum(Enumetyped[Content], compact=True):
+    Empty: type["CompactEnum[Empty]"]
+    Int: type["CompactEnum[int]"]
+    Self: type["CompactEnum[CompactEnum[Any]]"]
+
+
+class CompactPydanticEnum(EnumetypedPydantic[Content], compact=True):
+    Empty: type["CompactPydanticEnum[Empty]"]
+    Int: type["CompactPydanticEnum[int]"]
+    List: type["CompactPydanticEnum[list[int]]"]
+
+
+def bytes_per_instance(kls: type[Enumetyped[Any]], count: int = 10_000) -> float:
+    # Preallocate holder and contents, so only variant instances are measured
+    holder: list[Any] = [None] * count
+    contents = list(range(1000, 1000 + count))
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for i in range(count):
+            holder[i] = kls(contents[i])
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / count
+
+
+def test_compact_has_no_dict() -> None:
+    assert not hasattr(CompactEnum.Int(1), "__dict__")
+    assert not hasattr(CompactEnum.Empty(), "__dict__")
+    assert hasattr(DictEnum.Int(1), "__dict__")
+
+
+def test_compact_value_slot() -> None:
+    assert CompactEnum.Int.__dict__["__slots__"] == ("_value",)
+    assert CompactEnum.Empty.__slots__ == ()
+    assert CompactEnum.__compact__
+    assert not DictEnum.__compact__
+
+
+def test_compact_behaviour() -> None:
+    assert CompactEnum.Int(1).value == 1
+    assert CompactEnum.Empty().value is None
+    assert CompactEnum.Self(CompactEnum.Int(1)) == CompactEnum.Self(CompactEnum.Int(1))
+    assert isinstance(CompactEnum.Int(1), CompactEnum)
+
+    match CompactEnum.Int(1):
+        case CompactEnum.Int(1):
+            matched = True
+        case _:
+            matched = False
+
+    assert matched
+
+
+def test_compact_pydantic() -> None:
+    for value in (
+            CompactPydanticEnum.Int(1),
+            CompactPydanticEnum.Empty(),
+            CompactPydanticEnum.List([1, 2]),
+    ):
+        assert not hasattr(value, "__dict__")
+        restored: CompactPydanticEnum[Any] = CompactPydanticEnum.model_validate_json(value.model_dump_json())
+        assert value == restored
+
+
+def test_compact_memory() -> None:
+    default = bytes_per_instance(DictEnum.Int)
+    compact = bytes_per_instance(CompactEnum.Int)
+    # About 40 against 80 bytes on CPython 3.11
+    assert compact <= default * 0.6
@@ -0,0 +1,124 @@
+import importlib
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Iterator, get_args, get_origin
+
+import pytest
+
+from enumetyped.compile import compile_module, is_stale, main
+
+SOURCE = '''
+import dataclasses
+from typing import Any, Optional
+
+from typing_extensions import Annotated
+
+from enumetyped import Content, Empty, Enumetyped, Ordinal
+from enumetyped.pydantic import EnumetypedPydantic, Rename
+
+
+@dataclasses.dataclass
+class Payload:
+    a: int
+
+
+class Shape(Enumetyped[Content], frozen=True):
+    Point: type["Shape[Empty]"]
+    Circle: Annotated[type["Shape[float]"], Ordinal(5)]
+    Group: type["Shape[list[Shape[Any]]]"]
+    Nested: type["Shape[Shape[Any]]"]
+    Later: type["Shape[Later]"]
+
+
+class Event(EnumetypedPydantic[Content], lazy=True):
+    Started: Annotated[type["Event[int]"], Rename("started")]
+    Stopped: type["Event[Optional[str]]"]
+    Load: type["Event[Payload]"]
+
+
+def helper() -> int:
+    return 42
+
+
+@dataclasses.dataclass
+class Later:
+    b: str
+'''
+
+
+@pytest.fixture
+def models(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    path = tmp_path / "compile_models.py"
+    path.write_text(SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield path
+    for name in ("compile_models", "compile_models_compiled"):
+        sys.modules.pop(name, None)
+
+
+def generate() -> Any:
+    assert main(["compile_models"]) == 0
+    return importlib.import_module("compile_models_compiled")
+
+
+def test_same_variants(models: Path) -> None:
+    source = importlib.import_module("compile_models")
+    compiled = generate()
+
+    for name in ("Shape", "Event"):
+        source_enum, compiled_enum = getattr(source, name), getattr(compiled, name)
+        assert list(source_enum.__variants__.values()) == list(compiled_enum.__variants__.values())
+        assert source_enum.__declared_ordinals__ == compiled_enum.__declared_ordinals__
+        for source_variant, compiled_variant in zip(source_enum.__variants__, compiled_enum.__variants__):
+            assert source_variant.__variant_annotation__.content == compiled_variant.__variant_annotation__.content
+            assert source_variant.__variant_annotation__.names == compiled_variant.__variant_annotation__.names
+
+    assert compiled.Shape.Circle.__content_type__ is float
+    group = compiled.Shape.Group.__content_type__
+    assert get_origin(group) is list and get_origin(get_args(group)[0]) is compiled.Shape
+    assert compiled.Shape.Nested.__content_type__ is compiled.Shape
+    # Declared below enum, like in source module
+    assert compiled.Shape.Later.__content_type__ == "Later"
+    assert "__precompiled__" not in compiled.Shape.__dict__
+    assert compiled.helper() == 42
+
+
+def test_compiled_values(models: Path) -> None:
+    compiled = generate()
+    Shape, Event = compiled.Shape, compiled.Event
+
+    value = Shape.Group([Shape.Point(), Shape.Nested(Shape.Circle(1.5))])
+    assert value == Shape.Group([Shape.Point(), Shape.Nested(Shape.Circle(1.5))])
+    assert hash(Shape.Nested(Shape.Circle(1.5))) == hash(Shape.Nested(Shape.Circle(1.5)))
+    assert pickle.loads(pickle.dumps(value)) == value
+
+    assert Event.__names_serialization__ == {"Started": "started"}
+    assert Event.Started(1).model_dump() == {"started": 1}
+    assert Event.adapter().validate_json('{"Load": {"a": 1}}') == Event.Load(compiled.Payload(a=1))
+
+
+def test_stale(models: Path) -> None:
+    output = models.with_name("compile_models_compiled.py")
+    assert is_stale("compile_models")
+    assert main(["compile_models", "--check"]) == 1
+
+    generate()
+    assert not is_stale("compile_models")
+    assert main(["compile_models", "--check"]) == 0
+    assert not is_stale("compile_models", output)
+
+    models.write_text(SOURCE + "\n\nX = 1\n")
+    assert is_stale("compile_models")
+    assert main(["compile_models", "--check"]) == 1
+
+    output.write_text("# Edited by hand\n")
+    assert is_stale("compile_models", output)
+
+
+def test_output(models: Path, tmp_path: Path) -> None:
+    output = tmp_path / "other.py"
+    assert main(["compile_models", "-o", str(output)]) == 0
+    assert output.read_text() == compile_module("compile_models")
+    assert not is_stale("compile_models", output)
+    assert is_stale("compile_models")
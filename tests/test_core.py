@@ -1,6 +1,8 @@
 import dataclasses
 from typing import TypedDict, Any
 
+import pytest
+
 from enumetyped import Enumetyped, Empty, Content
 
 
@@ -79,3 +81,27 @@ def test_equality() -> None:
     assert SimpleEnum.Int(1) == SimpleEnum.Int(1)
     assert SimpleEnum.Int(1) != SimpleEnum.Int(2)
     assert SimpleEnum.Int(1) != SimpleEnum.EmptyVar()
+
+
+def test_empty_singleton() -> None:
+    assert SimpleEnum.EmptyVar() is SimpleEnum.EmptyVar()
+    assert SimpleEnum.EmptyVar(...) is SimpleEnum.EmptyVar()
+    by_name: SimpleEnum[Any] = SimpleEnum("EmptyVar")
+    assert by_name is SimpleEnum.EmptyVar()
+    assert SimpleEnum.Int(1) is not SimpleEnum.Int(1)
+
+
+def test_specialized_constructor() -> None:
+    assert SimpleEnum.Int.__init__ is object.__init__
+    assert SimpleEnum.Int.__new__.__qualname__.endswith(".__new__")
+    assert SimpleEnum.Int(1).value == 1
+
+    with pytest.raises(ValueError, match="Content must be set"):
+        SimpleEnum.Int()
+
+
+def test_enum_of_variant() -> None:
+    assert SimpleEnum.__enum__ is SimpleEnum
+    assert SimpleEnum.Int.__enum__ is SimpleEnum
+    assert SimpleEnum.Int(1).__enum__ is SimpleEnum
+    assert SimpleEnum.__tag_size__() == 1
@@ -1,5 +1,6 @@
 import pydantic
 import json
+import pytest
 from typing import Any
 from enumetyped import Content, Empty
 from enumetyped.pydantic import EnumetypedPydantic
@@ -137,3 +138,19 @@ def test_self_containing_with_container_via_implicitly_root_model() -> None:
     assert self_containing == deserialized
     assert self_containing == deserialized_kwargs
     assert self_containing == deserialized_forward
+
+
+def test_specialized_constructor() -> None:
+    post = ExampleFeed.Post("test")
+    assert ExampleFeed.Post.__init__ is object.__init__
+    assert ExampleFeed(**{"Post": "test"}) == post
+
+    with pytest.raises(ValueError, match="Content must be set"):
+        ExampleFeed.Post()
+
+    # implicit root model wraps content in generated constructor too
+    self_list = ExampleFeed.SelfListForce([post])
+    assert self_list.value == [post]
+    root = self_list._value
+    assert root is not None
+    assert ExampleFeed.SelfListForce(root).value == [post]
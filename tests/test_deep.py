@@ -0,0 +1,113 @@
+from typing import Any
+
+import pydantic
+import pytest
+from typing_extensions import Annotated, TypedDict
+
+from enumetyped import Content, Empty
+from enumetyped.intern import Interner
+from enumetyped.pydantic import EnumetypedPydantic, Rename
+from enumetyped.pydantic.deep import dump, dump_json, validate, validate_json
+
+
+class Inner(EnumetypedPydantic[Content]):
+    Int: type["Inner[int]"]
+    Nil: type["Inner[Empty]"]
+
+
+class Chain(EnumetypedPydantic[Content]):
+    Leaf: type["Chain[int]"]
+    Nil: type["Chain[Empty]"]
+    List: type["Chain[list[Chain[Any]]]"]
+    Wrap: Annotated[type["Chain[Chain[Any]]"], Rename("wr\"ap")]
+    Inner: type["Chain[Inner[Any]]"]
+
+
+class Adjacent(EnumetypedPydantic[Content], variant="type", content="value", frozen=True):
+    Leaf: type["Adjacent[int]"]
+    Nil: type["Adjacent[Empty]"]
+    Wrap: type["Adjacent[Adjacent[Any]]"]
+
+
+class Payload(TypedDict):
+    a: int
+
+
+class Internal(EnumetypedPydantic[Content], variant="type"):
+    Leaf: type["Internal[Payload]"]
+    Wrap: type["Internal[Internal[Any]]"]
+
+
+def nest(value: Any, depth: int) -> Any:
+    for _ in range(depth):
+        value = value.__enum__.Wrap(value)
+    return value
+
+
+VALUES = [
+    Chain.Leaf(1),
+    Chain.Nil(),
+    nest(Chain.Nil(), 3),
+    nest(Chain.List([nest(Chain.Leaf(1), 2)]), 2),
+    nest(Chain.Inner(Inner.Int(1)), 2),
+    nest(Chain.Inner(Inner.Nil()), 1),
+    nest(Adjacent.Leaf(1), 3),
+    nest(Adjacent.Nil(), 2),
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_same_as_adapter(value: Any) -> None:
+    kls = value.__enum__
+    assert dump(value) == value.model_dump()
+    assert dump(value, mode="json") == value.model_dump(mode="json")
+    assert dump_json(value) == value.model_dump_json()
+
+    assert validate(kls, value.model_dump()) == kls.model_validate(value.model_dump())
+    assert validate_json(kls, value.model_dump_json()) == kls.model_validate_json(value.model_dump_json())
+
+
+@pytest.mark.parametrize("value", [nest(Chain.Leaf(1), 100_000), nest(Adjacent.Nil(), 100_000)])
+def test_deep(value: Any) -> None:
+    kls = value.__enum__
+    assert validate_json(kls, dump_json(value)) == value
+    assert validate(kls, dump(value)) == value
+    assert validate_json(kls, dump_json(value).encode()) == value
+
+
+def test_whitespace() -> None:
+    assert validate_json(Chain, ' { "wr\\"ap" : {"wr\\u0022ap":\n"Nil" } } ') == nest(Chain.Nil(), 2)
+    assert validate_json(Adjacent, '{"type": "Wrap", "value": {"value": 1, "type": "Leaf"}} ') == nest(Adjacent.Leaf(1), 1)
+
+
+def test_internal() -> None:
+    # Contents of internally tagged enums are merged, so they go through adapter as is
+    value = Internal.Wrap(Internal.Leaf({"a": 1}))
+    assert dump(value) == value.model_dump()
+    assert dump_json(value) == value.model_dump_json()
+    assert validate_json(Internal, '{"type": "Leaf", "a": 1}') == Internal.Leaf({"a": 1})
+
+
+def test_other_keys() -> None:
+    # Peeled dicts with other keys go through adapter, which ignores them
+    data = '{"type": "Wrap", "value": {"type": "Leaf", "value": 1}, "x": 1}'
+    assert validate_json(Adjacent, data) == Adjacent.model_validate_json(data) == nest(Adjacent.Leaf(1), 1)
+
+
+def test_errors() -> None:
+    with pytest.raises(pydantic.ValidationError):
+        validate_json(Chain, '{"wr\\"ap": {"Leaf": 1}} x')
+    with pytest.raises(pydantic.ValidationError):
+        validate_json(Chain, '{"wr\\"ap": {"Leaf": 1}')
+    with pytest.raises(pydantic.ValidationError):
+        validate_json(Adjacent, dump_json(nest(Adjacent.Nil(), 100_000))[:-1])
+    with pytest.raises(pydantic.ValidationError):
+        validate_json(Chain, '{"wr\\"ap": {"Leaf": "x"}}')
+
+
+def test_interned() -> None:
+    data = dump_json(Adjacent.Wrap(nest(Adjacent.Leaf(1), 10)))
+    with Interner() as interner:
+        first, second = validate_json(Adjacent, data), validate_json(Adjacent, data)
+    assert first is second
+    assert len(interner) == 12
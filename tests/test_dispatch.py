@@ -0,0 +1,77 @@
+from typing import Any
+
+import pytest
+from typing_extensions import Annotated
+
+from enumetyped import Enumetyped, Empty, Content, Ordinal
+from enumetyped.pydantic import EnumetypedPydantic
+
+
+class Shape(Enumetyped[Content]):
+    Point: type["Shape[Empty]"]
+    Circle: Annotated[type["Shape[float]"], Ordinal(5)]
+    Square: type["Shape[float]"]
+    Group: type["Shape[list[Shape[Any]]]"]
+
+
+class OtherShape(Enumetyped[Content]):
+    Point: type["OtherShape[Empty]"]
+
+
+class PydanticShape(EnumetypedPydantic[Content]):
+    Circle: type["PydanticShape[float]"]
+    Square: type["PydanticShape[float]"]
+
+
+def test_dispatch() -> None:
+    def area(shape: Shape[Any]) -> float:
+        return float(dispatch(shape))
+
+    dispatch = Shape.dispatcher({
+        Shape.Point: lambda _: 0.0,
+        Shape.Circle: lambda v: 3.0 * v.value ** 2,
+        Shape.Square: lambda v: v.value ** 2,
+        Shape.Group: lambda v: sum(area(s) for s in v.value),
+    })
+
+    assert dispatch(Shape.Point()) == 0.0
+    assert dispatch(Shape.Circle(1.0)) == 3.0
+    assert dispatch(Shape.Square(2.0)) == 4.0
+    assert dispatch(Shape.Group([Shape.Circle(1.0), Shape.Square(2.0)])) == 7.0
+
+
+def test_default() -> None:
+    dispatch = Shape.dispatcher({Shape.Circle: lambda _: "circle"}, default=lambda _: "other")
+    assert dispatch(Shape.Circle(1.0)) == "circle"
+    assert dispatch(Shape.Point()) == "other"
+    assert dispatch(Shape.Group([])) == "other"
+
+
+def test_not_exhaustive() -> None:
+    with pytest.raises(ValueError, match="Square"):
+        Shape.dispatcher({
+            Shape.Point: lambda _: 0,
+            Shape.Circle: lambda _: 1,
+            Shape.Group: lambda _: 2,
+        })
+
+
+def test_foreign_variant() -> None:
+    with pytest.raises(ValueError):
+        Shape.dispatcher({OtherShape.Point: lambda _: 0}, default=lambda _: 1)
+
+
+def test_foreign_value() -> None:
+    dispatch = Shape.dispatcher({}, default=lambda _: 0)
+    with pytest.raises(TypeError, match="is not a value of enum"):
+        dispatch(OtherShape.Point())
+    with pytest.raises(TypeError):
+        dispatch(1)  # type: ignore
+
+
+def test_pydantic() -> None:
+    dispatch = PydanticShape.dispatcher({
+        PydanticShape.Circle: lambda v: f"circle {v.value}",
+        PydanticShape.Square: lambda v: f"square {v.value}",
+    })
+    assert dispatch(PydanticShape.model_validate_json('{"Square":2.0}')) == "square 2.0"
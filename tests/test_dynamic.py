@@ -0,0 +1,112 @@
+import gc
+import weakref
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+import enumetyped.pydantic.dynamic
+from enumetyped import Empty, Ordinal
+from enumetyped.pydantic import EnumetypedPydantic, Rename, create_enum
+
+
+class Payload(BaseModel):
+    a: int
+
+
+VARIANTS = {
+    "Point": Empty,
+    "Circle": float,
+    "Named": Annotated[str, Rename("named"), Ordinal(5)],
+    "Group": "list[Shape[Any]]",
+    "Load": "Payload",
+    "Ints": list[int],
+    "Nested": "Shape",
+}
+
+NAMESPACE = {"Any": Any, "Payload": Payload}
+
+
+def create(**options: Any) -> Any:
+    return create_enum("Shape", VARIANTS, namespace=NAMESPACE, **options)
+
+
+@pytest.mark.parametrize("options, nested", [
+    ({}, {"Nested": {"Circle": 1.0}}),
+    ({"variant": "type", "content": "value"}, {"type": "Nested", "value": {"type": "Circle", "value": 1.0}}),
+    ({"lazy": True}, {"Nested": {"Circle": 1.0}}),
+    ({"frozen": True, "compact": True}, {"Nested": {"Circle": 1.0}}),
+])
+def test_create_enum(options: dict[str, Any], nested: Any) -> None:
+    Shape = create(**options)
+    assert issubclass(Shape, EnumetypedPydantic)
+    assert Shape.__name__ == "Shape"
+    assert list(Shape.__variants__.values()) == list(VARIANTS)
+    assert Shape.Named.__ordinal__ == 5
+    assert Shape.Ints.__ordinal__ == 8
+    assert Shape.Load.content_type() is Payload
+    assert Shape.Nested.content_type() is Shape
+
+    value = Shape.Group([
+        Shape.Point(),
+        Shape.Named("x"),
+        Shape.Nested(Shape.Circle(1.0)),
+        Shape.Ints([1, 2]),
+        Shape.Load(Payload(a=1)),
+    ])
+    dumped = value.model_dump(mode="json")
+    items = dumped["Group"] if "Group" in dumped else dumped["value"]
+    assert items[2] == nested
+    assert Shape.adapter().validate_json(value.model_dump_json()) == value
+    assert Shape.Named("x").model_dump() in ({"named": "x"}, {"type": "named", "value": "x"})
+
+
+def test_validated_first() -> None:
+    # Adapter is built before any value is dumped
+    Shape = create_enum("Shape", VARIANTS, namespace={**NAMESPACE, "unique": object()})
+    assert Shape.model_validate_json('{"Group": [{"Nested": "Point"}]}') == Shape.Group([Shape.Nested(Shape.Point())])
+
+
+def test_not_bound_in_module() -> None:
+    create()
+    create_enum("Other", {"A": int}, module=__name__)
+    assert "Shape" not in vars(enumetyped.pydantic.dynamic)
+    assert "Other" not in globals()
+
+
+def test_cached() -> None:
+    Shape = create()
+    assert create() is Shape
+    assert create(lazy=True) is not Shape
+    assert create_enum("Shape", VARIANTS, namespace={**NAMESPACE, "Extra": int}) is not Shape
+    assert create_enum("Shape", {**VARIANTS, "Extra": int}, namespace=NAMESPACE) is not Shape
+
+    # Unhashable definitions are not cached
+    variants = {"A": int}
+    namespace: dict[str, Any] = {"unhashable": []}
+    assert create_enum("Plain", variants, namespace=namespace) is not create_enum("Plain", variants, namespace=namespace)
+
+
+def test_collected() -> None:
+    Shape = create()
+    Shape.Group([Shape.Point()]).model_dump_json()
+    refs = [weakref.ref(Shape), weakref.ref(Shape.adapter()), weakref.ref(Shape.Group.content_type())]
+
+    del Shape
+    gc.collect()
+    assert [ref() for ref in refs] == [None, None, None]
+
+    # Definition is created again, after previous enum is collected
+    assert create().Point() == create().Point()
+
+
+def test_errors() -> None:
+    with pytest.raises(ValueError, match="not resolved"):
+        create_enum("Broken", {"A": "Missing"})
+    with pytest.raises(ValueError, match="not an expression"):
+        create_enum("Broken", {"A": "list["})
+    with pytest.raises(ValueError, match="ordinal `0`"):
+        create_enum("Broken", {"A": int, "B": Annotated[int, Ordinal(1)], "C": Annotated[str, Ordinal(0)]})
+    with pytest.raises(ValueError, match="renamed to `a`"):
+        create_enum("Broken", {"A": Annotated[int, Rename("a")], "B": Annotated[int, Rename("a")]})
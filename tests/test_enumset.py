@@ -0,0 +1,87 @@
+import pickle
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from typing_extensions import Annotated
+
+from enumetyped import Enumetyped, Empty, Content, EnumSet, Ordinal
+from enumetyped.pydantic import EnumetypedPydantic, Rename
+
+
+class Permission(Enumetyped[Empty]):
+    Read: type["Permission"]
+    Write: type["Permission"]
+    Admin: Annotated[type["Permission"], Ordinal(70)]
+
+
+class Feature(EnumetypedPydantic[Empty]):
+    Search: type["Feature"]
+    DarkMode: Annotated[type["Feature"], Rename("dark_mode")]
+    Beta: type["Feature"]
+
+
+class WithContent(Enumetyped[Content]):
+    Int: type["WithContent[int]"]
+
+
+class Settings(BaseModel):
+    features: EnumSet[Feature]
+
+
+def test_membership() -> None:
+    permissions = EnumSet(Permission, [Permission.Admin(), Permission.Read()])
+    assert Permission.Read() in permissions
+    assert Permission.Admin() in permissions
+    assert Permission.Write() not in permissions
+    assert Feature.Search() not in permissions
+    assert len(permissions) == 2
+    assert list(permissions) == [Permission.Read(), Permission.Admin()]
+    assert not EnumSet(Permission)
+
+
+def test_operations() -> None:
+    read, write, admin = Permission.Read(), Permission.Write(), Permission.Admin()
+    a, b = EnumSet(Permission, [read, write]), EnumSet(Permission, [write, admin])
+
+    assert a | b == EnumSet.full(Permission)
+    assert a & b == EnumSet(Permission, [write])
+    assert a - b == EnumSet(Permission, [read])
+    assert a ^ b == EnumSet(Permission, [read, admin])
+    assert EnumSet(Permission, [read]) <= a
+    assert a >= EnumSet(Permission, [read])
+    assert not a <= b
+    assert hash(a) == hash(EnumSet(Permission, [write, read]))
+
+    with pytest.raises(TypeError):
+        _ = a | EnumSet(Feature)  # type: ignore[arg-type]
+
+
+def test_only_empty_variants() -> None:
+    with pytest.raises(TypeError):
+        EnumSet(WithContent)
+
+    with pytest.raises(TypeError):
+        EnumSet(Permission, [Feature.Search()])
+
+
+def test_pickle() -> None:
+    permissions = EnumSet(Permission, [Permission.Admin()])
+    assert pickle.loads(pickle.dumps(permissions)) == permissions
+
+
+def test_pydantic() -> None:
+    settings = Settings(features=EnumSet(Feature, [Feature.Beta(), Feature.DarkMode()]))
+    assert settings.model_dump_json() == '{"features":["dark_mode","Beta"]}'
+    assert settings.model_dump() == {"features": ["dark_mode", "Beta"]}
+    assert Settings.model_validate_json(settings.model_dump_json()) == settings
+    assert Settings.model_validate({"features": ["Search"]}).features == EnumSet(Feature, [Feature.Search()])
+
+    with pytest.raises(ValidationError):
+        Settings.model_validate_json('{"features":["DarkMode"]}')
+
+    with pytest.raises(ValidationError):
+        Settings(features=EnumSet(Permission))
+
+    schema: Any = Settings.model_json_schema()
+    assert schema["properties"]["features"]["items"]["enum"] == ["Search", "dark_mode", "Beta"]
@@ -0,0 +1,108 @@
+from dataclasses import FrozenInstanceError
+from typing import Any
+
+import pytest
+
+from enumetyped import Enumetyped, Empty, Content
+from enumetyped.pydantic import EnumetypedPydantic
+
+
+class FrozenEnum(Enumetyped[Content], frozen=True):
+    Empty: type["FrozenEnum[Empty]"]
+    Int: type["FrozenEnum[int]"]
+    Str: type["FrozenEnum[str]"]
+    Self: type["FrozenEnum[FrozenEnum[Any]]"]
+
+
+class CompactFrozenEnum(Enumetyped[Content], compact=True, frozen=True):
+    Empty: type["CompactFrozenEnum[Empty]"]
+    Int: type["CompactFrozenEnum[int]"]
+
+
+class FrozenPydanticEnum(EnumetypedPydantic[Content], frozen=True):
+    Empty: type["FrozenPydanticEnum[Empty]"]
+    Int: type["FrozenPydanticEnum[int]"]
+    Tuple: type["FrozenPydanticEnum[tuple[int, int]]"]
+
+
+class MutableEnum(Enumetyped[Content]):
+    Int: type["MutableEnum[int]"]
+
+
+def test_frozen_assignment() -> None:
+    value = FrozenEnum.Int(1)
+    with pytest.raises(FrozenInstanceError):
+        value._value = 2
+
+    with pytest.raises(FrozenInstanceError):
+        del value._value
+
+    with pytest.raises(FrozenInstanceError):
+        CompactFrozenEnum.Int(1)._value = 2
+
+    assert value.value == 1
+
+
+def test_frozen_hash() -> None:
+    assert hash(FrozenEnum.Int(1)) == hash(FrozenEnum.Int(1))
+    assert hash(FrozenEnum.Self(FrozenEnum.Int(1))) == hash(FrozenEnum.Self(FrozenEnum.Int(1)))
+    assert hash(CompactFrozenEnum.Int(1)) == hash(CompactFrozenEnum.Int(1))
+    assert hash(FrozenEnum.Empty()) == hash(FrozenEnum.Empty())
+
+
+def test_frozen_hash_cached() -> None:
+    value = FrozenEnum.Int(1)
+    assert getattr(value, "_hash", None) is None
+    hash_ = hash(value)
+    assert value._hash == hash_  # type: ignore[attr-defined]
+
+    compact = CompactFrozenEnum.Int(1)
+    assert hash(compact) == compact._hash  # type: ignore[attr-defined]
+
+
+def test_frozen_hash_deep() -> None:
+    value: FrozenEnum[Any] = FrozenEnum.Int(1)
+    other: FrozenEnum[Any] = FrozenEnum.Int(1)
+    for _ in range(5000):
+        value, other = FrozenEnum.Self(value), FrozenEnum.Self(other)
+
+    assert hash(value) == hash(other)
+    assert {value: "a"}[other] == "a"
+
+
+def test_frozen_set_and_dict() -> None:
+    values = [FrozenEnum.Int(1), FrozenEnum.Int(1), FrozenEnum.Str("1"), FrozenEnum.Empty(), FrozenEnum.Empty()]
+    assert set(values) == {FrozenEnum.Int(1), FrozenEnum.Str("1"), FrozenEnum.Empty()}
+    assert {FrozenEnum.Int(1): "a"}[FrozenEnum.Int(1)] == "a"
+
+
+def test_compact_frozen_empty() -> None:
+    assert hash(CompactFrozenEnum.Empty()) == hash(CompactFrozenEnum.Empty())
+    values = {CompactFrozenEnum.Empty(), CompactFrozenEnum.Empty(), CompactFrozenEnum.Int(1)}
+    assert values == {CompactFrozenEnum.Empty(), CompactFrozenEnum.Int(1)}
+    assert {CompactFrozenEnum.Empty(): "a"}[CompactFrozenEnum.Empty()] == "a"
+
+
+def test_frozen_equality() -> None:
+    assert FrozenEnum.Int(1) == FrozenEnum.Int(1)
+    assert FrozenEnum.Int(1) != FrozenEnum.Int(2)
+    assert FrozenEnum.Int(1) != FrozenEnum.Str(1)  # type: ignore[call-overload]
+
+    a, b = FrozenEnum.Int(1), FrozenEnum.Int(2)
+    hash(a), hash(b)
+    assert a != b
+
+
+def test_frozen_pydantic() -> None:
+    value = FrozenPydanticEnum.Tuple((1, 2))
+    restored: FrozenPydanticEnum[Any] = FrozenPydanticEnum.model_validate_json(value.model_dump_json())
+    assert value == restored
+    assert hash(value) == hash(restored)
+
+    with pytest.raises(FrozenInstanceError):
+        value._value = (2, 3)
+
+
+def test_mutable_is_not_hashable() -> None:
+    with pytest.raises(TypeError):
+        hash(MutableEnum.Int(1))
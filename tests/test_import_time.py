@@ -0,0 +1,80 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Import time of modules of this package, without pydantic and other dependencies, in microseconds.
+# Recorded with headroom for slow CI machines, update when imports are changed deliberately.
+BUDGETS = {
+    "enumetyped": 40_000,
+    "enumetyped.pydantic": 70_000,
+}
+
+# Loaded on first use: adapters, JSON schema generation, root models and taggings other than default
+LAZY = [
+    "enumetyped.array",
+    "enumetyped.enumset",
+    "enumetyped.pydantic.serialization.adjacent",
+    "enumetyped.pydantic.serialization.internal",
+    "pydantic.main",
+    "pydantic.json_schema",
+    "pydantic.type_adapter",
+    "pydantic.root_model",
+]
+
+_LINE = re.compile(r"^import time:\s+(?P<self>\d+) \|\s+\d+ \|\s+(?P<module>\S+)$", re.MULTILINE)
+
+
+def import_time(module: str) -> int:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return sum(
+        int(match["self"])
+        for match in _LINE.finditer(result.stderr)
+        if match["module"].split(".")[0] == "enumetyped"
+    )
+
+
+@pytest.mark.parametrize("module", BUDGETS)
+def test_import_time(module: str) -> None:
+    # The best of few runs, other processes slow down single one
+    assert min(import_time(module) for _ in range(3)) < BUDGETS[module]
+
+
+def test_lazy_modules() -> None:
+    code = """
+import sys
+
+from enumetyped import Content, Empty
+from enumetyped.pydantic import EnumetypedPydantic
+
+
+class Event(EnumetypedPydantic[Content]):
+    Start: type["Event[Empty]"]
+    Click: type["Event[int]"]
+
+
+print(*sys.modules)
+"""
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True)
+    modules = set(result.stdout.split())
+    assert [module for module in LAZY if module in modules] == []
+
+
+def test_lazy_attributes() -> None:
+    import enumetyped
+    from enumetyped.pydantic import serialization
+
+    assert enumetyped.EnumSet.__module__ == "enumetyped.enumset"
+    assert enumetyped.EnumArray.__module__ == "enumetyped.array"
+    assert serialization.InternalTagging.__module__ == "enumetyped.pydantic.serialization.internal"
+
+    with pytest.raises(AttributeError):
+        enumetyped.Missing  # noqa
+    with pytest.raises(AttributeError):
+        serialization.Missing  # noqa
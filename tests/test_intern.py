@@ -0,0 +1,153 @@
+import threading
+from typing import Any
+
+import pytest
+
+from enumetyped import Content, Empty, Enumetyped
+from enumetyped.intern import Interner, _active_interner
+from enumetyped.pydantic import EnumetypedPydantic
+
+
+class Shared(EnumetypedPydantic[Content], frozen=True):
+    Leaf: type["Shared[int]"]
+    Pair: type["Shared[tuple[Shared[Any], Shared[Any]]]"]
+    List: type["Shared[list[Shared[Any]]]"]
+    Self: type["Shared[Shared[Any]]"]
+    Nil: type["Shared[Empty]"]
+
+
+class CompactShared(EnumetypedPydantic[Content], compact=True, frozen=True):
+    Leaf: type["CompactShared[int]"]
+    Nil: type["CompactShared[Empty]"]
+
+
+class Mutable(Enumetyped[Content]):
+    Int: type["Mutable[int]"]
+    Frozen: type["Mutable[Shared[Any]]"]
+
+
+def test_intern() -> None:
+    tree = Shared.Pair((Shared.Self(Shared.Leaf(1)), Shared.Self(Shared.Leaf(1))))
+    left, right = tree.value  # type: ignore
+
+    interner = Interner()
+    result = interner.intern(tree)
+    assert result == tree
+    assert result.value[0] is left  # type: ignore
+    assert result.value[1] is left  # type: ignore
+    assert right is not left
+
+    assert interner.intern(Shared.Self(Shared.Leaf(1))) is left
+    assert len(interner) == 3
+
+
+def test_not_interned() -> None:
+    interner = Interner()
+
+    # Unhashable and mutable values are kept, but their contents are interned
+    tree = Shared.List([Shared.Leaf(1), Shared.Leaf(1)])
+    result = interner.intern(tree)
+    assert result.value[0] is result.value[1]  # type: ignore
+    assert interner.intern(Shared.List([Shared.Leaf(1)])) is not interner.intern(Shared.List([Shared.Leaf(1)]))
+
+    value = Mutable.Frozen(Shared.Leaf(2))
+    assert interner.intern(value) is value
+    copied = interner.intern(Mutable.Frozen(Shared.Leaf(2)))
+    assert copied is not value
+    assert copied.value is value.value
+
+
+def test_compact() -> None:
+    interner = Interner()
+    assert interner.intern_value(CompactShared.Nil()) is CompactShared.Nil()
+    assert interner.intern_value(CompactShared.Leaf(1)) is interner.intern_value(CompactShared.Leaf(1))
+
+    with interner:
+        assert CompactShared.model_validate_json('"Nil"') is CompactShared.Nil()
+
+
+def test_bounded() -> None:
+    interner = Interner(maxsize=2)
+    one, two = interner.intern(Shared.Leaf(1)), interner.intern(Shared.Leaf(2))
+
+    # Recently used value is kept
+    assert interner.intern(Shared.Leaf(1)) is one
+    interner.intern(Shared.Leaf(3))
+    assert len(interner) == 2
+    assert interner.intern(Shared.Leaf(1)) is one
+    assert interner.intern(Shared.Leaf(2)) is not two
+    assert (interner.hits, interner.misses) == (2, 4)
+
+    interner.clear()
+    assert len(interner) == 0 and interner.hits == 0
+
+    with pytest.raises(ValueError):
+        Interner(maxsize=0)
+
+
+def test_validation() -> None:
+    data = Shared.List([Shared.Self(Shared.Leaf(1)), Shared.Self(Shared.Leaf(1)), Shared.Nil()]).model_dump_json()
+
+    plain: Shared[Any] = Shared.model_validate_json(data)
+    assert plain.value[0] is not plain.value[1]  # type: ignore
+
+    with Interner() as interner:
+        assert _active_interner.get() is interner
+        first: Shared[Any] = Shared.model_validate_json(data)
+        second: Shared[Any] = Shared.model_validate_json(data)
+
+    assert _active_interner.get() is None
+    assert first == plain
+    assert first.value[0] is first.value[1] is second.value[0]  # type: ignore
+    assert first.value[0].value is second.value[1].value  # type: ignore
+
+
+def test_deep() -> None:
+    tree: Shared[Any] = Shared.Leaf(1)
+    for _ in range(100_000):
+        tree = Shared.Self(tree)
+
+    interner = Interner(maxsize=10)
+    assert interner.intern(tree) is tree
+    assert len(interner) == 10
+
+
+def test_threads() -> None:
+    # Blocks of the same interner overlap in two threads: the first thread enters and leaves
+    # its block before the second one does, each resets its own token
+    interner = Interner()
+    steps = [threading.Event() for _ in range(3)]
+    errors: list[BaseException] = []
+
+    def first() -> None:
+        try:
+            with interner:
+                steps[0].set()
+                steps[1].wait(5)
+                Shared.model_validate_json('{"Leaf":1}')
+            assert _active_interner.get() is None
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            steps[2].set()
+
+    def second() -> None:
+        steps[0].wait(5)
+        try:
+            with interner:
+                steps[1].set()
+                steps[2].wait(5)
+                Shared.model_validate_json('{"Leaf":2}')
+                assert _active_interner.get() is interner
+            assert _active_interner.get() is None
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(interner) == 2
@@ -0,0 +1,74 @@
+from typing import Any
+
+from typing_extensions import Annotated
+
+from enumetyped import Enumetyped, Empty, Content
+from enumetyped.pydantic import EnumetypedPydantic, Rename
+
+
+class LazyEnum(Enumetyped[Content], lazy=True):
+    A: type["LazyEnum[Empty]"]
+    B: type["LazyEnum[int]"]
+    C: type["LazyEnum[str]"]
+    Self: type["LazyEnum[LazyEnum[Any]]"]
+
+
+class LazyPydanticEnum(EnumetypedPydantic[Content], lazy=True):
+    Empty: type["LazyPydanticEnum[Empty]"]
+    Int: type["LazyPydanticEnum[int]"]
+    List: Annotated[type["LazyPydanticEnum[list[int]]"], Rename("list")]
+    Self: type["LazyPydanticEnum[LazyPydanticEnum[Any]]"]
+
+
+class LazyOnlyEnum(Enumetyped[Content], lazy=True):
+    A: type["LazyOnlyEnum[Empty]"]
+    B: type["LazyOnlyEnum[int]"]
+
+
+def test_created_on_access() -> None:
+    assert "A" not in LazyOnlyEnum.__dict__
+    assert "__variants__" not in LazyOnlyEnum.__dict__
+
+    variant = LazyOnlyEnum.B
+    assert LazyOnlyEnum.__dict__["B"] is variant
+    assert LazyOnlyEnum.B is variant
+    assert "A" not in LazyOnlyEnum.__dict__
+
+
+def test_variants_in_declaration_order() -> None:
+    _ = LazyEnum.Self, LazyEnum.B
+    assert list(LazyEnum.__variants__.values()) == ["A", "B", "C", "Self"]
+    assert list(LazyEnum.__variants__) == [LazyEnum.A, LazyEnum.B, LazyEnum.C, LazyEnum.Self]
+    assert LazyEnum.A.__variants__ is LazyEnum.__variants__
+
+
+def test_instance_checking() -> None:
+    assert isinstance(LazyEnum.B(1), LazyEnum)
+    assert isinstance(LazyEnum.B(1), LazyEnum.B)
+    assert not isinstance(LazyEnum.B(1), LazyEnum.C)
+    assert LazyEnum.A() is LazyEnum.A()
+    by_name: LazyEnum[Any] = LazyEnum("A")
+    assert by_name is LazyEnum.A()
+
+
+def test_pattern_matching() -> None:
+    match LazyEnum.Self(LazyEnum.B(1)):
+        case LazyEnum.Self(LazyEnum.B(1)):
+            matched = True
+        case _:
+            matched = False
+
+    assert matched
+
+
+def test_pydantic() -> None:
+    for value in (
+        LazyPydanticEnum.Empty(),
+        LazyPydanticEnum.Int(1),
+        LazyPydanticEnum.List([1, 2]),
+        LazyPydanticEnum.Self(LazyPydanticEnum.Int(1)),
+    ):
+        restored: LazyPydanticEnum[Any] = LazyPydanticEnum.model_validate_json(value.model_dump_json())
+        assert value == restored
+
+    assert LazyPydanticEnum.List([1]).model_dump_json() == '{"list":[1]}'
@@ -0,0 +1,78 @@
+from typing import Any
+
+import pytest
+
+from enumetyped import Enumetyped, Empty, Content, EnumArray
+from enumetyped.pydantic import EnumetypedPydantic
+
+numpy = pytest.importorskip("numpy")
+
+from enumetyped.numpy import to_numpy, from_numpy  # noqa: E402
+
+
+class Measure(Enumetyped[Content]):
+    Missing: type["Measure[Empty]"]
+    Int: type["Measure[int]"]
+    Float: type["Measure[float]"]
+    Flag: type["Measure[bool]"]
+
+
+class PydanticMeasure(EnumetypedPydantic[Content]):
+    Missing: type["PydanticMeasure[Empty]"]
+    Int: type["PydanticMeasure[int]"]
+
+
+class Text(Enumetyped[Content]):
+    Str: type["Text[str]"]
+
+
+VALUES: list[Measure[Any]] = [
+    Measure.Int(5),
+    Measure.Missing(),
+    Measure.Int(20),
+    Measure.Float(1.5),
+    Measure.Flag(True),
+    Measure.Int(11),
+]
+
+
+def test_to_numpy() -> None:
+    columns = to_numpy(Measure, VALUES)
+    assert len(columns) == len(VALUES)
+    assert columns.tags.dtype == numpy.uint8
+    assert columns.tags.tolist() == [1, 0, 1, 2, 3, 1]
+    assert columns.contents[Measure.Int].dtype == numpy.int64
+    assert columns.contents[Measure.Int].tolist() == [5, 20, 11]
+    assert columns.contents[Measure.Float].tolist() == [1.5]
+    assert columns.contents[Measure.Flag].tolist() == [True]
+    assert Measure.Missing not in columns.contents
+
+
+def test_masks() -> None:
+    columns = to_numpy(Measure, VALUES)
+    assert columns.mask(Measure.Missing).tolist() == [False, True, False, False, False, False]
+    positions = columns.positions(Measure.Int)
+    assert positions[columns.contents[Measure.Int] > 10].tolist() == [2, 5]
+
+
+def test_from_numpy() -> None:
+    assert from_numpy(to_numpy(Measure, VALUES)) == VALUES
+    assert from_numpy(to_numpy(Measure, [])) == []
+
+
+def test_enum_array() -> None:
+    values = EnumArray(Measure, VALUES)
+    columns = to_numpy(Measure, values[1:])
+    assert columns.tags.tolist() == [0, 1, 2, 3, 1]
+    assert columns.contents[Measure.Int].tolist() == [20, 11]
+    assert from_numpy(columns) == VALUES[1:]
+
+
+def test_pydantic() -> None:
+    values: list[PydanticMeasure[Any]] = [PydanticMeasure.Int(1), PydanticMeasure.Missing()]
+    assert from_numpy(to_numpy(PydanticMeasure, values)) == values
+
+
+def test_unsupported_content() -> None:
+    with pytest.raises(TypeError):
+        to_numpy(Text, [Text.Str("a")])
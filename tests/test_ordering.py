@@ -0,0 +1,105 @@
+import bisect
+from typing import Any
+
+import pytest
+
+from enumetyped import Enumetyped, Empty, Content
+from enumetyped.pydantic import EnumetypedPydantic
+
+
+class Tree(Enumetyped[Content], ordered=True):
+    Leaf: type["Tree[Empty]"]
+    Int: type["Tree[int]"]
+    Str: type["Tree[str]"]
+    Node: type["Tree[Tree[Any]]"]
+
+
+class FrozenTree(Enumetyped[Content], frozen=True):
+    Leaf: type["FrozenTree[int]"]
+    Node: type["FrozenTree[FrozenTree[Any]]"]
+
+
+class PydanticTree(EnumetypedPydantic[Content], ordered=True):
+    Int: type["PydanticTree[int]"]
+    Node: type["PydanticTree[PydanticTree[Any]]"]
+
+
+class Unordered(Enumetyped[Content]):
+    Int: type["Unordered[int]"]
+
+
+DEPTH = 10_000
+
+
+def deep(value: Any, depth: int, node: Any) -> Any:
+    for _ in range(depth):
+        value = node(value)
+    return value
+
+
+def test_deep_equality() -> None:
+    assert deep(Tree.Int(1), DEPTH, Tree.Node) == deep(Tree.Int(1), DEPTH, Tree.Node)
+    assert deep(Tree.Int(1), DEPTH, Tree.Node) != deep(Tree.Int(2), DEPTH, Tree.Node)
+    assert deep(Tree.Int(1), DEPTH, Tree.Node) != deep(Tree.Int(1), DEPTH - 1, Tree.Node)
+    assert deep(Tree.Leaf(), DEPTH, Tree.Node) == deep(Tree.Leaf(), DEPTH, Tree.Node)
+
+
+def test_deep_frozen_equality() -> None:
+    a, b = deep(FrozenTree.Leaf(1), DEPTH, FrozenTree.Node), deep(FrozenTree.Leaf(1), DEPTH, FrozenTree.Node)
+    assert a == b
+    assert a != deep(FrozenTree.Leaf(2), DEPTH, FrozenTree.Node)
+
+
+def test_equality_with_other_types() -> None:
+    assert Tree.Int(1) != 1
+    assert Tree.Int(1) != Unordered.Int(1)
+    assert Tree.Node(Tree.Int(1)) != Tree.Node(Unordered.Int(1))  # type: ignore[call-overload]
+
+
+def test_ordering() -> None:
+    values: list[Tree[Any]] = [
+        Tree.Node(Tree.Str("b")),
+        Tree.Str("b"),
+        Tree.Int(2),
+        Tree.Leaf(),
+        Tree.Node(Tree.Int(1)),
+        Tree.Str("a"),
+        Tree.Int(1),
+    ]
+    assert sorted(values) == [
+        Tree.Leaf(),
+        Tree.Int(1),
+        Tree.Int(2),
+        Tree.Str("a"),
+        Tree.Str("b"),
+        Tree.Node(Tree.Int(1)),
+        Tree.Node(Tree.Str("b")),
+    ]
+
+    assert Tree.Int(1) <= Tree.Int(1)
+    assert Tree.Str("a") >= Tree.Int(10)
+    assert Tree.Str("b") > Tree.Str("a")
+    assert not Tree.Leaf() < Tree.Leaf()
+    assert deep(Tree.Int(1), DEPTH, Tree.Node) < deep(Tree.Int(2), DEPTH, Tree.Node)
+
+
+def test_bisect() -> None:
+    values = sorted(Tree.Int(i) for i in range(0, 100, 2))
+    assert bisect.bisect_left(values, Tree.Int(10)) == 5
+    assert bisect.bisect_left(values, Tree.Str("")) == len(values)
+
+
+def test_pydantic_ordering() -> None:
+    values: list[PydanticTree[Any]] = [PydanticTree.Node(PydanticTree.Int(1)), PydanticTree.Int(2)]
+    assert sorted(values) == [
+        PydanticTree.Int(2),
+        PydanticTree.Node(PydanticTree.Int(1)),
+    ]
+
+
+def test_not_ordered() -> None:
+    with pytest.raises(TypeError):
+        _ = Unordered.Int(1) < Unordered.Int(2)
+
+    with pytest.raises(TypeError):
+        _ = Tree.Int(1) < Unordered.Int(2)
@@ -0,0 +1,68 @@
+from typing import Any
+
+import pytest
+from typing_extensions import Annotated
+
+from enumetyped import Enumetyped, Empty, Content, Ordinal
+from enumetyped.pydantic import EnumetypedPydantic, FieldMetadata
+
+
+class OrdinalEnum(Enumetyped[Content]):
+    A: type["OrdinalEnum[Empty]"]
+    B: type["OrdinalEnum[int]"]
+    C: Annotated[type["OrdinalEnum[str]"], Ordinal(5)]
+    D: type["OrdinalEnum[OrdinalEnum[Any]]"]
+
+
+class OrdinalPydanticEnum(EnumetypedPydantic[Content]):
+    Int: Annotated[type["OrdinalPydanticEnum[int]"], FieldMetadata(ordinal=1)]
+    Str: Annotated[type["OrdinalPydanticEnum[str]"], FieldMetadata(rename="str", ordinal=0)]
+
+
+class LazyOrdinalEnum(Enumetyped[Content], lazy=True):
+    A: type["LazyOrdinalEnum[Empty]"]
+    B: Annotated[type["LazyOrdinalEnum[int]"], Ordinal(2)]
+
+
+def test_declaration_order() -> None:
+    assert OrdinalEnum.A.__ordinal__ == 0
+    assert OrdinalEnum.B.__ordinal__ == 1
+    assert OrdinalEnum.C.__ordinal__ == 5
+    assert OrdinalEnum.D.__ordinal__ == 6
+
+
+def test_instance_ordinal() -> None:
+    assert OrdinalEnum.A().__ordinal__ == 0
+    assert OrdinalEnum.D(OrdinalEnum.B(1)).__ordinal__ == 6
+
+
+def test_variants_by_ordinal() -> None:
+    assert OrdinalEnum.__variants_by_ordinal__ == (
+        OrdinalEnum.A, OrdinalEnum.B, None, None, None, OrdinalEnum.C, OrdinalEnum.D,
+    )
+
+    for variant in OrdinalEnum.__variants__:
+        assert OrdinalEnum.__variants_by_ordinal__[variant.__ordinal__] is variant
+
+
+def test_field_metadata() -> None:
+    assert OrdinalPydanticEnum.Str.__ordinal__ == 0
+    assert OrdinalPydanticEnum.Int.__ordinal__ == 1
+    assert OrdinalPydanticEnum.__variants_by_ordinal__ == (OrdinalPydanticEnum.Str, OrdinalPydanticEnum.Int)
+    assert OrdinalPydanticEnum.Str("a").model_dump_json() == '{"str":"a"}'
+
+
+def test_lazy() -> None:
+    assert "__variants_by_ordinal__" not in LazyOrdinalEnum.__dict__
+    assert LazyOrdinalEnum.__variants_by_ordinal__ == (LazyOrdinalEnum.A, None, LazyOrdinalEnum.B)
+
+
+def test_duplicate() -> None:
+    with pytest.raises(ValueError):
+        class DuplicateEnum(Enumetyped[Content]):
+            A: type["DuplicateEnum[Empty]"]
+            B: Annotated[type["DuplicateEnum[int]"], Ordinal(0)]
+
+    with pytest.raises(ValueError):
+        class NegativeEnum(Enumetyped[Content]):
+            A: Annotated[type["NegativeEnum[int]"], Ordinal(-1)]
@@ -0,0 +1,82 @@
+import copy
+import pickle
+from typing import Any
+
+from enumetyped import Enumetyped, Empty, Content
+from enumetyped.pydantic import EnumetypedPydantic
+
+
+class PickledEnum(Enumetyped[Content]):
+    Empty: type["PickledEnum[Empty]"]
+    Int: type["PickledEnum[int]"]
+    List: type["PickledEnum[list[int]]"]
+    Self: type["PickledEnum[PickledEnum[Any]]"]
+
+
+class FrozenPickledEnum(Enumetyped[Content], frozen=True, compact=True):
+    Empty: type["FrozenPickledEnum[Empty]"]
+    Int: type["FrozenPickledEnum[int]"]
+
+
+class LazyPickledEnum(Enumetyped[Content], lazy=True):
+    Int: type["LazyPickledEnum[int]"]
+
+
+class PydanticPickledEnum(EnumetypedPydantic[Content]):
+    Empty: type["PydanticPickledEnum[Empty]"]
+    List: type["PydanticPickledEnum[list[int]]"]
+
+
+VALUES: list[Any] = [
+    PickledEnum.Empty(),
+    PickledEnum.Int(1),
+    PickledEnum.List([1, 2]),
+    PickledEnum.Self(PickledEnum.Int(2)),
+    FrozenPickledEnum.Empty(),
+    FrozenPickledEnum.Int(1),
+    LazyPickledEnum.Int(1),
+    PydanticPickledEnum.Empty(),
+    PydanticPickledEnum.List([1, 2]),
+]
+
+
+def test_qualname() -> None:
+    assert PickledEnum.Int.__qualname__ == "PickledEnum.Int"
+    assert pickle.loads(pickle.dumps(PickledEnum.Int)) is PickledEnum.Int
+
+
+def test_pickle() -> None:
+    for value in VALUES:
+        restored = pickle.loads(pickle.dumps(value))
+        assert restored == value
+        assert type(restored) is type(value)
+
+    assert pickle.loads(pickle.dumps(PickledEnum.Empty())) is PickledEnum.Empty()
+    assert hash(pickle.loads(pickle.dumps(FrozenPickledEnum.Int(1)))) == hash(FrozenPickledEnum.Int(1))
+
+
+def test_pickle_payload() -> None:
+    assert PickledEnum.Int(5).__reduce__() == (PickledEnum.Int, (5,))
+    assert PickledEnum.Empty().__reduce__() == (PickledEnum.Empty, ())
+    assert PydanticPickledEnum.List([1]).__reduce__() == (PydanticPickledEnum.List, ([1],))
+
+
+def test_copy() -> None:
+    for value in VALUES:
+        assert copy.copy(value) == value
+        assert copy.deepcopy(value) == value
+
+    value = PickledEnum.List([1, 2])
+    assert copy.copy(value).value is value.value
+    assert copy.deepcopy(value).value is not value.value
+
+    assert copy.deepcopy(PickledEnum.Empty()) is PickledEnum.Empty()
+    frozen = FrozenPickledEnum.Int(1)
+    assert copy.deepcopy(frozen) is frozen
+    assert copy.deepcopy(PickledEnum.Int(1)) is not PickledEnum.Int(1)
+
+    nested = PickledEnum.Self(PickledEnum.List([1]))
+    restored = copy.deepcopy(nested)
+    assert restored == nested
+    assert restored.value is not nested.value
+    assert restored.value.value is not nested.value.value  # type: ignore[union-attr]
@@ -0,0 +1,124 @@
+import dataclasses
+import sys
+import types
+from typing import Any, Optional
+
+from enumetyped import Enumetyped, Empty, Content
+from enumetyped.resolver import parse_variant_annotation, resolve
+
+
+@dataclasses.dataclass
+class Local:
+    a: int
+
+
+class ResolvedEnum(Enumetyped[Content]):
+    Empty: type["ResolvedEnum[Empty]"]
+    NoContent: type["ResolvedEnum"]  # type: ignore[type-arg]
+    Local: type["ResolvedEnum[Local]"]
+    # `Local` is resolved in module, not as variant above
+    Optional: type["ResolvedEnum[Optional[Local]]"]  # type: ignore[valid-type]
+    Self: type["ResolvedEnum[ResolvedEnum[Any]]"]
+    SelfList: type["ResolvedEnum[list[ResolvedEnum[Any]]]"]
+    Deferred: type["ResolvedEnum[DeclaredBelow]"]
+
+
+@dataclasses.dataclass
+class DeclaredBelow:
+    b: int
+
+
+def test_parse() -> None:
+    annotation = parse_variant_annotation("MyEnum[dict[str, list[int]]]")
+    assert annotation is not None
+    assert annotation.enum_name == "MyEnum"
+    assert annotation.content == "dict[str, list[int]]"
+    assert not annotation.is_self
+    assert annotation.names == {"dict", "str", "list", "int"}
+
+    annotation = parse_variant_annotation("MyEnum")
+    assert annotation is not None
+    assert annotation.content is None
+
+    annotation = parse_variant_annotation("MyEnum[MyEnum[Any]]")
+    assert annotation is not None
+    assert annotation.is_self
+
+    assert parse_variant_annotation("not an annotation[") is None
+    assert parse_variant_annotation("1 + 2") is None
+
+
+def test_parse_cached() -> None:
+    assert parse_variant_annotation("MyEnum[int]") is parse_variant_annotation("MyEnum[int]")
+
+
+def test_resolved_in_defining_module() -> None:
+    assert ResolvedEnum.Empty.__content_type__ is Empty
+    assert ResolvedEnum.NoContent.__content_type__ is Empty
+    assert ResolvedEnum.Local.__content_type__ is Local
+    assert ResolvedEnum.Optional.__content_type__ == Optional[Local]  # type: ignore[comparison-overlap]
+    assert ResolvedEnum.Self.__content_type__ is ResolvedEnum
+    assert ResolvedEnum.SelfList.__content_type__ == list[ResolvedEnum[Any]]
+
+
+def test_deferred() -> None:
+    assert ResolvedEnum.Deferred.__content_type__ == "DeclaredBelow"
+    assert resolve(ResolvedEnum.Deferred.__variant_annotation__, __name__) is DeclaredBelow
+
+
+def test_resolve_cached_per_module() -> None:
+    annotation = parse_variant_annotation("ResolvedEnum[Optional[Local]]")
+    assert annotation is not None
+    assert resolve(annotation, __name__) is resolve(annotation, __name__)
+
+
+REBOUND = '''
+import dataclasses
+import sys
+import types
+
+from enumetyped import Enumetyped, Content
+from enumetyped.pydantic import EnumetypedPydantic
+
+
+@dataclasses.dataclass
+class Item:
+    a: int
+
+
+class E(Enumetyped[Content]):
+    V: type["E[Item]"]
+
+
+@dataclasses.dataclass
+class Item:
+    b: str
+
+
+class F(Enumetyped[Content]):
+    V: type["F[Item]"]
+
+
+class P(EnumetypedPydantic[Content]):
+    V: type["P[Item]"]
+'''
+
+
+def test_rebound_name() -> None:
+    module = types.ModuleType("resolver_rebound")
+    sys.modules[module.__name__] = module
+    try:
+        exec(REBOUND, module.__dict__)
+        first_f, first_p = module.F, module.P
+        assert module.E.V.__content_type__ is not module.F.V.__content_type__
+        assert module.F.V.__content_type__ is module.Item
+        assert module.P.model_validate({"V": {"b": "x"}}) == module.P.V(module.Item(b="x"))
+
+        # Like `importlib.reload`, module is executed again in the same namespace
+        exec(REBOUND, module.__dict__)
+        assert module.F.V.__content_type__ is module.Item
+        assert module.F.V.__content_type__ is not first_f.V.__content_type__
+        assert module.P is not first_p
+        assert module.P.model_validate({"V": {"b": "x"}}) == module.P.V(module.Item(b="x"))
+    finally:
+        del sys.modules[module.__name__]
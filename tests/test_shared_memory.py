@@ -0,0 +1,90 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+from enumetyped import Content, Empty
+from enumetyped.pydantic import EnumetypedPydantic, Rename
+from enumetyped.pydantic.shared_memory import SharedEnumBatch
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Model(BaseModel):
+    name: str
+
+
+class Item(EnumetypedPydantic[Content], variant="type", content="value"):
+    Empty: type["Item[Empty]"]
+    Int: type["Item[int]"]
+    List: Annotated[type["Item[list[str]]"], Rename("list")]
+    Point: type["Item[Point]"]
+    Model: type["Item[Model]"]
+    Self: type["Item[Item[Any]]"]
+
+
+VALUES: list[Item[Any]] = [
+    Item.Int(1),
+    Item.Empty(),
+    Item.List(["a", "b"]),
+    Item.Point(Point(1, 2)),
+    Item.Model(Model(name="model")),
+    Item.Self(Item.Int(2)),
+]
+
+
+def total(batch: SharedEnumBatch[Item[Any]]) -> int:
+    try:
+        return sum(v.value or 0 for v in batch if isinstance(v, Item.Int))
+    finally:
+        batch.close()
+
+
+def test_lazy_decode() -> None:
+    with SharedEnumBatch.create(Item, VALUES) as batch:
+        assert len(batch) == len(VALUES)
+        assert batch[2] == Item.List(["a", "b"])
+        assert batch[-1] == Item.Self(Item.Int(2))
+        assert batch[1] is Item.Empty()
+        assert batch[1:3] == VALUES[1:3]
+        assert list(batch) == VALUES
+
+        with pytest.raises(IndexError):
+            batch[len(VALUES)]
+
+
+def test_attach() -> None:
+    with SharedEnumBatch.create(Item, VALUES) as batch:
+        with SharedEnumBatch.attach(Item, batch.name) as attached:
+            assert list(attached) == VALUES
+
+        restored = pickle.loads(pickle.dumps(batch))
+        assert list(restored) == VALUES
+        restored.close()
+
+
+def test_empty_batch() -> None:
+    with SharedEnumBatch.create(Item, []) as batch:
+        assert len(batch) == 0
+        assert list(batch) == []
+
+
+def test_wrong_values() -> None:
+    with pytest.raises(TypeError):
+        SharedEnumBatch.create(Item, [1])  # type: ignore[type-var]
+
+
+def test_process_pool() -> None:
+    values = [Item.Int(i) if i % 2 else Item.Empty() for i in range(1000)]
+    with SharedEnumBatch.create(Item, values) as batch:
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            assert pool.submit(total, batch).result() == sum(range(1, 1000, 2))
@@ -170,3 +170,10 @@ def test_empty_serialization_compatibility() -> None:
             MyEnumAdjacent.model_validate_json('{"tag":"NoValue","payload":null}') ==
             MyEnumAdjacent.model_validate_json('{"tag":"NoValue"}')
     )
+
+
+def test_empty_singleton() -> None:
+    assert MyEnumAdjacent.NoValue() is MyEnumAdjacent.NoValue()
+    assert MyEnumAdjacent.model_validate_json('{"tag":"NoValue"}') is MyEnumAdjacent.NoValue()
+    by_dict: MyEnumAdjacent[Any] = MyEnumAdjacent({"tag": "NoValue", "payload": None})
+    assert by_dict is MyEnumAdjacent.NoValue()
@@ -176,3 +176,12 @@ def test_empty_serialization_compatibility() -> None:
             MyEnum.model_validate_json('{"NoValue":null}') ==
             MyEnum.model_validate_json('"NoValue"')
     )
+
+
+def test_empty_singleton() -> None:
+    assert MyEnum.NoValue() is MyEnum.NoValue()
+    assert MyEnum.model_validate_json('"NoValue"') is MyEnum.NoValue()
+    assert MyEnum.model_validate_json('{"NoValue":null}') is MyEnum.NoValue()
+    by_name: MyEnum[Any] = MyEnum("NoValue")
+    assert by_name is MyEnum.NoValue()
+    assert SimpleEnum.model_validate("V1") is SimpleEnum.V1()
@@ -2,11 +2,11 @@ from dataclasses import dataclass
 from typing import Any
 
 from pydantic import BaseModel
-from typing_extensions import TypedDict
+from typing_extensions import Annotated, TypedDict
 
 from enumetyped import Content
 from enumetyped import Empty
-from enumetyped.pydantic import EnumetypedPydantic
+from enumetyped.pydantic import EnumetypedPydantic, Rename
 
 
 @dataclass
@@ -53,6 +53,11 @@ class MyEnumInternal(EnumetypedPydantic[Content], variant="tag"):
     Model: type["MyEnumInternal[TModel2]"]
 
 
+class RenamedInternal(EnumetypedPydantic[Content], variant="tag"):
+    Model: Annotated[type["RenamedInternal[TModel2]"], Rename("model")]
+    NoValue: Annotated[type["RenamedInternal[Empty]"], Rename("no_value")]
+
+
 def test_isinstance() -> None:
     assert isinstance(MyEnumInternal.Other(OtherEnum5.Int(123)), MyEnumInternal.Other)
     assert isinstance(MyEnumInternal.NoValue(), MyEnumInternal.NoValue)
@@ -101,3 +106,18 @@ def test_empty_serialization_compatibility() -> None:
             MyEnumInternal.model_validate_json('{"tag":"NoValue","payload":null}') ==
             MyEnumInternal.model_validate_json('{"tag":"NoValue"}')
     )
+
+
+def test_empty_singleton() -> None:
+    assert MyEnumInternal.NoValue() is MyEnumInternal.NoValue()
+    assert MyEnumInternal.model_validate_json('{"tag":"NoValue"}') is MyEnumInternal.NoValue()
+    by_dict: MyEnumInternal[Any] = MyEnumInternal({"tag": "NoValue"})
+    assert by_dict is MyEnumInternal.NoValue()
+
+
+def test_renamed() -> None:
+    # Validators of variants are looked up by attribute, not by serialized name
+    model = RenamedInternal.Model(TModel2(b="1"))
+    assert model.model_dump_json() == '{"tag":"model","b":"1"}'
+    assert RenamedInternal.model_validate_json(model.model_dump_json()) == model
+    assert RenamedInternal.model_validate_json('{"tag":"no_value"}') is RenamedInternal.NoValue()
@@ -0,0 +1,92 @@
+from typing import Any
+
+import pydantic
+import pytest
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+from enumetyped import Content, Empty, Ordinal
+from enumetyped.pydantic import EnumetypedPydantic, Rename, create_enum
+from enumetyped.pydantic.deep import dump, dump_json, validate, validate_json
+
+
+class TModel2(BaseModel):
+    b: str
+
+
+class MyEnumExternalOrdinal(EnumetypedPydantic[Content], tag_format="ordinal"):
+    NoValue: type["MyEnumExternalOrdinal[Empty]"]
+    Int: type["MyEnumExternalOrdinal[int]"]
+    List: type["MyEnumExternalOrdinal[list[MyEnumExternalOrdinal[Any]]]"]
+    # Ordinal is the tag, rename is ignored
+    Str: Annotated[type["MyEnumExternalOrdinal[str]"], Rename("string"), Ordinal(10)]
+    Self: type["MyEnumExternalOrdinal[MyEnumExternalOrdinal[Any]]"]
+
+
+class MyEnumAdjacentOrdinal(EnumetypedPydantic[Content], variant="tag", content="payload", tag_format="ordinal"):
+    NoValue: type["MyEnumAdjacentOrdinal[Empty]"]
+    Int: type["MyEnumAdjacentOrdinal[int]"]
+    List: type["MyEnumAdjacentOrdinal[list[MyEnumAdjacentOrdinal[Any]]]"]
+    Self: type["MyEnumAdjacentOrdinal[MyEnumAdjacentOrdinal[Any]]"]
+
+
+class MyEnumInternalOrdinal(EnumetypedPydantic[Content], variant="tag", tag_format="ordinal"):
+    NoValue: type["MyEnumInternalOrdinal[Empty]"]
+    Model: type["MyEnumInternalOrdinal[TModel2]"]
+
+
+@pytest.mark.parametrize("value, serialized", [
+    (MyEnumExternalOrdinal.NoValue(), 0),
+    (MyEnumExternalOrdinal.Int(1), {"1": 1}),
+    (
+        MyEnumExternalOrdinal.List([MyEnumExternalOrdinal.NoValue(), MyEnumExternalOrdinal.Str("a")]),
+        {"2": [0, {"10": "a"}]},
+    ),
+    (MyEnumExternalOrdinal.Self(MyEnumExternalOrdinal.Int(2)), {"11": {"1": 2}}),
+    (MyEnumAdjacentOrdinal.NoValue(), {"tag": 0}),
+    (MyEnumAdjacentOrdinal.Int(1), {"tag": 1, "payload": 1}),
+    (
+        MyEnumAdjacentOrdinal.List([MyEnumAdjacentOrdinal.Self(MyEnumAdjacentOrdinal.NoValue())]),
+        {"tag": 2, "payload": [{"tag": 3, "payload": {"tag": 0}}]},
+    ),
+    (MyEnumInternalOrdinal.NoValue(), {"tag": 0}),
+    (MyEnumInternalOrdinal.Model(TModel2(b="x")), {"tag": 1, "b": "x"}),
+])
+def test_round_trip(value: Any, serialized: Any) -> None:
+    kls = value.__class__.__bases__[0]
+    assert value.model_dump() == serialized
+    assert kls.model_validate(serialized) == value
+    assert kls.model_validate_json(value.model_dump_json()) == value
+
+
+def test_invalid() -> None:
+    with pytest.raises(pydantic.ValidationError):
+        MyEnumAdjacentOrdinal.model_validate_json('{"tag": "1", "payload": 1}')
+    with pytest.raises(pydantic.ValidationError):
+        MyEnumAdjacentOrdinal.model_validate_json('{"tag": 9}')
+    with pytest.raises(pydantic.ValidationError):
+        MyEnumExternalOrdinal.model_validate_json('"NoValue"')
+    with pytest.raises(pydantic.ValidationError):
+        MyEnumInternalOrdinal.model_validate_json('{"tag": true}')
+    with pytest.raises(ValueError, match="Unknown tag format `number`"):
+        class Broken(EnumetypedPydantic[Content], tag_format="number"):
+            A: type["Broken[int]"]
+
+
+def test_deep() -> None:
+    for E in (MyEnumExternalOrdinal, MyEnumAdjacentOrdinal):
+        value: Any = E.Int(1)
+        for _ in range(2000):
+            value = E.Self(value)
+        assert validate_json(E, dump_json(value)) == value
+        assert validate(E, dump(value)) == value
+        nested: Any = E.Self(E.Int(1))  # type: ignore[arg-type]
+        assert dump_json(nested) == nested.model_dump_json()
+
+
+def test_dynamic() -> None:
+    variants = {"Point": Empty, "Circle": float}
+    Shape = create_enum("Shape", variants, variant="type", content="value", tag_format="ordinal")
+    assert Shape.Circle(1.0).model_dump() == {"type": 1, "value": 1.0}
+    assert Shape.model_validate_json('{"type": 0}') == Shape.Point()
+    assert create_enum("Shape", variants, variant="type", content="value") is not Shape
@@ -0,0 +1,85 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator
+
+import pydantic
+import pytest
+
+from enumetyped import Empty
+from enumetyped.pydantic import create_enum
+from enumetyped.pydantic.encoding import content_codec
+
+THREADS = 16
+
+
+@pytest.fixture(autouse=True)
+def switch_often() -> Iterator[None]:
+    # Threads are switched in the middle of initialization, like on free-threaded build
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def fresh(lazy: bool) -> Any:
+    # Enum, whose adapter and contents are not built yet, new for every call
+    return create_enum(
+        "Fresh",
+        {"Nil": Empty, "Int": int, "Items": "list[Fresh[Any]]", "Self": "Fresh"},
+        namespace={"Any": Any, "unique": object()},
+        lazy=lazy,
+    )
+
+
+def run(fn: Callable[[int], Any]) -> list[Any]:
+    barrier = threading.Barrier(THREADS)
+
+    def call(i: int) -> Any:
+        barrier.wait()
+        return fn(i)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        return list(executor.map(call, range(THREADS)))
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_adapter_built_once(lazy: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    built = []
+
+    class CountingAdapter(pydantic.TypeAdapter):  # type: ignore
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            built.append(args[0])
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(pydantic, "TypeAdapter", CountingAdapter)
+    Fresh = fresh(lazy)
+
+    def validate(i: int) -> Any:
+        value = Fresh.Items([Fresh.Int(i), Fresh.Self(Fresh.Nil())])
+        assert Fresh.model_validate_json(value.model_dump_json()) == value
+        return Fresh.adapter()
+
+    adapters = run(validate)
+    assert len(set(map(id, adapters))) == 1
+    # Variants, whose values are dumped, have own adapters
+    assert Fresh in built
+    assert len(built) == len(set(built))
+
+
+def test_content_type() -> None:
+    Fresh = fresh(lazy=True)
+    results = run(lambda i: (Fresh.Self.content_type(), Fresh.Items.content_type()))
+    assert len({tuple(map(id, result)) for result in results}) == 1
+    assert results[0][0] is Fresh
+
+
+def test_content_codec() -> None:
+    Fresh = fresh(lazy=False)
+
+    def encode(i: int) -> Any:
+        codec = content_codec(Fresh)
+        assert codec.decode(*codec.encode(Fresh.Int(i))) == Fresh.Int(i)
+        return codec
+
+    assert len(set(map(id, run(encode)))) == 1
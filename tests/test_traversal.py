@@ -0,0 +1,113 @@
+from typing import Any, NamedTuple
+
+from enumetyped import Content, Empty, Enumetyped
+from enumetyped.pydantic import EnumetypedPydantic
+from enumetyped.traversal import children, fold, postorder, preorder, transform
+
+
+class Expr(Enumetyped[Content]):
+    Num: type["Expr[int]"]
+    Neg: type["Expr[Expr[Any]]"]
+    Add: type["Expr[tuple[Expr[Any], Expr[Any]]]"]
+    Sum: type["Expr[list[Expr[Any]]]"]
+    Let: type["Expr[dict[str, Expr[Any]]]"]
+    Nil: type["Expr[Empty]"]
+
+
+class Pair(NamedTuple):
+    left: Any
+    right: Any
+
+
+class Tree(EnumetypedPydantic[Content]):
+    Leaf: type["Tree[int]"]
+    Node: type["Tree[list[Tree[Any]]]"]
+
+
+def evaluate(node: Any, results: list[int]) -> int:
+    if isinstance(node, Expr.Num):
+        return node.value  # type: ignore
+    if isinstance(node, Expr.Neg):
+        return -results[0]
+    return sum(results)
+
+
+EXPR = Expr.Sum([
+    Expr.Num(1),
+    Expr.Add((Expr.Num(2), Expr.Neg(Expr.Num(3)))),
+    Expr.Let({"a": Expr.Num(4), "b": Expr.Nil()}),
+])
+
+
+def test_children() -> None:
+    assert children(Expr.Nil()) == []
+    assert children(Expr.Num(1)) == []
+    assert children(Expr.Neg(Expr.Num(1))) == [Expr.Num(1)]
+    assert children(Expr.Add((Expr.Num(1), Expr.Num(2)))) == [Expr.Num(1), Expr.Num(2)]
+    assert children(Expr.Let({"a": Expr.Num(1)})) == [Expr.Num(1)]
+    assert children(Expr.Sum([[Expr.Num(1)], Pair(Expr.Num(2), 3)])) == [Expr.Num(1), Expr.Num(2)]  # type: ignore
+
+
+def test_orders() -> None:
+    assert [type(node).__variant_name__ for node in preorder(EXPR)] == [
+        "Sum", "Num", "Add", "Num", "Neg", "Num", "Let", "Num", "Nil",
+    ]
+    assert [type(node).__variant_name__ for node in postorder(EXPR)] == [
+        "Num", "Num", "Num", "Neg", "Add", "Num", "Nil", "Let", "Sum",
+    ]
+
+
+def test_fold() -> None:
+    assert fold(EXPR, evaluate) == 1 + 2 - 3 + 4
+    assert fold(EXPR, lambda node, depths: 1 + max(depths, default=0)) == 4
+    assert fold(Expr.Nil(), lambda node, results: len(results)) == 0
+
+
+def test_transform() -> None:
+    def negate(node: Any) -> Any:
+        return Expr.Num(-node.value) if isinstance(node, Expr.Num) and node.value == 3 else node
+
+    result = transform(EXPR, negate)
+    assert result == Expr.Sum([
+        Expr.Num(1),
+        Expr.Add((Expr.Num(2), Expr.Neg(Expr.Num(-3)))),
+        Expr.Let({"a": Expr.Num(4), "b": Expr.Nil()}),
+    ])
+
+    # Only path to changed value is rebuilt
+    assert result is not EXPR
+    assert result.value[0] is EXPR.value[0]  # type: ignore
+    assert result.value[2] is EXPR.value[2]  # type: ignore
+    assert result.value[1].value[0] is EXPR.value[1].value[0]  # type: ignore
+
+    assert transform(EXPR, lambda node: node) is EXPR
+
+
+def test_transform_containers() -> None:
+    tree: Any = Expr.Sum([Pair(Expr.Num(1), "x"), (Expr.Num(2),), {"a": [Expr.Num(3)]}])  # type: ignore
+    result = transform(tree, lambda node: Expr.Num(node.value * 10) if isinstance(node, Expr.Num) else node)  # type: ignore[operator]
+    assert result.value == [Pair(Expr.Num(10), "x"), (Expr.Num(20),), {"a": [Expr.Num(30)]}]
+    assert type(result.value[0]) is Pair
+
+
+def test_root_model() -> None:
+    tree = Tree.Node([Tree.Leaf(1), Tree.Node([Tree.Leaf(2), Tree.Leaf(3)])])
+    assert children(tree) == [Tree.Leaf(1), Tree.Node([Tree.Leaf(2), Tree.Leaf(3)])]
+    assert fold(tree, lambda node, results: node.value if isinstance(node, Tree.Leaf) else sum(results)) == 6  # type: ignore[arg-type]
+
+    result = transform(tree, lambda node: Tree.Leaf(node.value + 1) if isinstance(node, Tree.Leaf) else node)  # type: ignore[operator]
+    assert result == Tree.Node([Tree.Leaf(2), Tree.Node([Tree.Leaf(3), Tree.Leaf(4)])])
+    assert type(result._value) is Tree.Node.content_type()
+    assert result.model_dump() == {"Node": [{"Leaf": 2}, {"Node": [{"Leaf": 3}, {"Leaf": 4}]}]}
+
+
+def test_deep() -> None:
+    depth = 100_000
+    tree: Expr[Any] = Expr.Num(1)
+    for _ in range(depth):
+        tree = Expr.Neg(tree)
+
+    assert sum(1 for _ in preorder(tree)) == depth + 1
+    assert sum(1 for _ in postorder(tree)) == depth + 1
+    assert fold(tree, evaluate) == 1
+    assert fold(transform(tree, lambda node: Expr.Num(2) if isinstance(node, Expr.Num) else node), evaluate) == 2